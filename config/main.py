@@ -23,7 +23,8 @@ from jsonpatch import JsonPatchConflict
 from jsonpointer import JsonPointerException
 from collections import OrderedDict
 from generic_config_updater.generic_updater import GenericUpdater, ConfigFormat, extract_scope
-from generic_config_updater.gu_common import HOST_NAMESPACE, GenericConfigUpdaterError
+from generic_config_updater.gu_common import HOST_NAMESPACE, GenericConfigUpdaterError, genericUpdaterProfiling
+from generic_config_updater.patch_sorter import Algorithm
 from minigraph import parse_device_desc_xml, minigraph_encoder
 from natsort import natsorted
 from portconfig import get_child_ports
@@ -1327,7 +1328,8 @@ def apply_patch_wrapper(args):
 
 
 # Function to apply patch for a single ASIC.
-def apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path):
+def apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path,
+                          validation_processes=0, sort_algorithm=Algorithm.DFS, profile=False):
     scope, changes = scope_changes
     # Replace localhost to DEFAULT_NAMESPACE which is db definition of Host
     if scope.lower() == HOST_NAMESPACE or scope == "":
@@ -1339,12 +1341,14 @@ def apply_patch_for_scope(scope_changes, results, config_format, verbose, dry_ru
 
     try:
         # Call apply_patch with the ASIC-specific changes and predefined parameters
-        GenericUpdater(scope=scope).apply_patch(jsonpatch.JsonPatch(changes),
-                                                config_format,
-                                                verbose,
-                                                dry_run,
-                                                ignore_non_yang_tables,
-                                                ignore_path)
+        generic_updater = GenericUpdater(scope=scope, validation_processes=validation_processes,
+                                         sort_algorithm=sort_algorithm, profile=profile)
+        generic_updater.apply_patch(jsonpatch.JsonPatch(changes),
+                                    config_format,
+                                    verbose,
+                                    dry_run,
+                                    ignore_non_yang_tables,
+                                    ignore_path)
         results[scope_for_log] = {"success": True, "message": "Success"}
         log.log_notice(f"'apply-patch' executed successfully for {scope_for_log} by {changes} in thread:{thread_id}")
     except Exception as e:
@@ -1705,6 +1709,33 @@ def print_dry_run_message(dry_run):
     if dry_run:
         click.secho("** DRY RUN EXECUTION **", fg="yellow", underline=True)
 
+
+def gcu_sort_options(func):
+    """-j, -s and --profile options of the commands sorting and applying a patch"""
+    func = click.option('--profile', type=click.File('w'),
+                        help='save the time spent per phase, the states explored by the sorter, the validator '
+                             'invocations and the CONFIG_DB round trips per scope as JSON to the given file, '
+                             '- for stdout')(func)
+    func = click.option('-s', '--sort-algorithm', type=click.Choice([e.name for e in Algorithm], case_sensitive=False),
+                        default=Algorithm.DFS.name,
+                        help='algorithm searching for the order in which the changes are applied',
+                        show_default=True)(func)
+    func = click.option('-j', '--validation-processes', type=click.IntRange(min=0), default=0,
+                        help='number of processes validating the candidate changes while sorting the patch, '
+                             '0 to validate them in this process')(func)
+    return func
+
+
+def init_gcu_profile(profile):
+    if profile is not None:
+        genericUpdaterProfiling.reset()
+
+
+def write_gcu_profile(profile):
+    if profile is not None:
+        profile.write(json.dumps(genericUpdaterProfiling.report(), indent=4) + "\n")
+
+
 @config.command('apply-patch')
 @click.argument('patch-file-path', type=str, required=True)
 @click.option('-f', '--format', type=click.Choice([e.name for e in ConfigFormat]),
@@ -1716,16 +1747,23 @@ def print_dry_run_message(dry_run):
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@gcu_sort_options
 @click.pass_context
-def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang_tables, ignore_path, verbose):
+def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang_tables, ignore_path, verbose,
+                validation_processes, sort_algorithm, profile):
     """Apply given patch of updates to Config. A patch is a JsonPatch which follows rfc6902.
        This command can be used do partial updates to the config with minimum disruption to running processes.
        It allows addition as well as deletion of configs. The patch file represents a diff of ConfigDb(ABNF)
        format or SonicYang format.
 
        <patch-file-path>: Path to the patch file on the file-system."""
+    # The validation processes are forked, which is unsafe from the threads applying the scopes in parallel
+    if parallel and validation_processes > 0:
+        ctx.fail("--validation-processes cannot be used with --parallel")
+
     try:
         print_dry_run_message(dry_run)
+        init_gcu_profile(profile)
 
         with open(patch_file_path, 'r') as fh:
             text = fh.read()
@@ -1737,6 +1775,7 @@ def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang
 
         results = {}
         config_format = ConfigFormat[format.upper()]
+        sort_algorithm = Algorithm[sort_algorithm.upper()]
         # Initialize a dictionary to hold changes categorized by scope
         changes_by_scope = {}
 
@@ -1767,7 +1806,8 @@ def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang
             with concurrent.futures.ThreadPoolExecutor() as executor:
                 # Prepare the argument tuples
                 arguments = [(scope_changes, results, config_format,
-                              verbose, dry_run, ignore_non_yang_tables, ignore_path)
+                              verbose, dry_run, ignore_non_yang_tables, ignore_path, validation_processes,
+                              sort_algorithm, profile is not None)
                              for scope_changes in changes_by_scope.items()]
 
                 # Submit all tasks and wait for them to complete
@@ -1782,7 +1822,10 @@ def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang
                                       config_format,
                                       verbose, dry_run,
                                       ignore_non_yang_tables,
-                                      ignore_path)
+                                      ignore_path,
+                                      validation_processes,
+                                      sort_algorithm,
+                                      profile is not None)
 
         # Check if any updates failed
         failures = [scope for scope, result in results.items() if not result['success']]
@@ -1796,6 +1839,8 @@ def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang
     except Exception as ex:
         click.secho("Failed to apply patch due to: {}".format(ex), fg="red", underline=True, err=True)
         ctx.fail(ex)
+    finally:
+        write_gcu_profile(profile)
 
 @config.command()
 @click.argument('target-file-path', type=str, required=True)
@@ -1807,8 +1852,10 @@ def apply_patch(ctx, patch_file_path, format, dry_run, parallel, ignore_non_yang
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@gcu_sort_options
 @click.pass_context
-def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose):
+def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose, validation_processes,
+            sort_algorithm, profile):
     """Replace the whole config with the specified config. The config is replaced with minimum disruption e.g.
        if ACL config is different between current and target config only ACL config is updated, and other config/services
        such as DHCP will not be affected.
@@ -1818,6 +1865,7 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
        <target-file-path>: Path to the target file on the file-system."""
     try:
         print_dry_run_message(dry_run)
+        init_gcu_profile(profile)
 
         with open(target_file_path, 'r') as fh:
             target_config_as_text = fh.read()
@@ -1825,12 +1873,17 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
 
         config_format = ConfigFormat[format.upper()]
 
-        GenericUpdater().replace(target_config, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_path)
+        GenericUpdater(validation_processes=validation_processes,
+                       sort_algorithm=Algorithm[sort_algorithm.upper()],
+                       profile=profile is not None).replace(target_config, config_format, verbose, dry_run,
+                                                            ignore_non_yang_tables, ignore_path)
 
         click.secho("Config replaced successfully.", fg="cyan", underline=True)
     except Exception as ex:
         click.secho("Failed to replace config", fg="red", underline=True, err=True)
         ctx.fail(ex)
+    finally:
+        write_gcu_profile(profile)
 
 @config.command()
 @click.argument('checkpoint-name', type=str, required=True)
@@ -1838,8 +1891,10 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@gcu_sort_options
 @click.pass_context
-def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path, verbose):
+def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path, verbose, validation_processes,
+             sort_algorithm, profile):
     """Rollback the whole config to the specified checkpoint. The config is rolled back with minimum disruption e.g.
        if ACL config is different between current and checkpoint config only ACL config is updated, and other config/services
        such as DHCP will not be affected.
@@ -1847,13 +1902,19 @@ def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path,
        <checkpoint-name>: The checkpoint name, use `config list-checkpoints` command to see available checkpoints."""
     try:
         print_dry_run_message(dry_run)
+        init_gcu_profile(profile)
 
-        GenericUpdater().rollback(checkpoint_name, verbose, dry_run, ignore_non_yang_tables, ignore_path)
+        GenericUpdater(validation_processes=validation_processes,
+                       sort_algorithm=Algorithm[sort_algorithm.upper()],
+                       profile=profile is not None).rollback(checkpoint_name, verbose, dry_run,
+                                                             ignore_non_yang_tables, ignore_path)
 
         click.secho("Config rolled back successfully.", fg="cyan", underline=True)
     except Exception as ex:
         click.secho("Failed to rollback config", fg="red", underline=True, err=True)
         ctx.fail(ex)
+    finally:
+        write_gcu_profile(profile)
 
 @config.command()
 @click.argument('checkpoint-name', type=str, required=True)
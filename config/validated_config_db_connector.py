@@ -1,19 +1,32 @@
 import jsonpatch
+import contextlib
 import copy
+from collections import OrderedDict
 from jsonpointer import JsonPointer
 
 from sonic_py_common import device_info
 from generic_config_updater.generic_updater import GenericUpdater, ConfigFormat
-from generic_config_updater.gu_common import EmptyTableError, genericUpdaterLogging
+from generic_config_updater.gu_common import EmptyTableError, genericUpdaterLogging, serialize_config_db
 
 class ValidatedConfigDBConnector(object):
     
     def __init__(self, config_db_connector):
         self.connector = config_db_connector
         self.yang_enabled = device_info.is_yang_config_validation_enabled(self.connector)
+        # {table: (entries in ConfigDB, entries after the writes)} of the tables written within batch()
+        self.batch_tables = None
+        # Calls deferred by after_batch() until the batch is applied
+        self.batch_calls = None
 
     def __getattr__(self, name):
         if self.yang_enabled:
+            if self.batch_tables is not None:
+                if name == "set_entry":
+                    return self.batched_set_entry
+                if name == "delete_table":
+                    return self.batched_delete_table
+                if name == "mod_entry":
+                    return self.batched_mod_entry
             if name == "set_entry":
                 return self.validated_set_entry
             if name == "delete_table":
@@ -22,6 +35,51 @@ class ValidatedConfigDBConnector(object):
                 return self.validated_mod_entry
         return self.connector.__getattribute__(name)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collects the set_entry, mod_entry and delete_table calls made within the block, then validates and
+        applies them as a single patch when the block exits. Nothing is written if the block raises.
+        Reads within the block are served by ConfigDB, they do not see the collected writes.
+
+        Without YANG validation the writes are made as they are called. A batch within a batch joins it.
+        """
+        if not self.yang_enabled or self.batch_tables is not None:
+            yield self
+            return
+
+        self.batch_tables = OrderedDict()
+        self.batch_calls = []
+        try:
+            yield self
+            batch_tables = self.batch_tables
+            batch_calls = self.batch_calls
+        finally:
+            self.batch_tables = None
+            self.batch_calls = None
+
+        gcu_patch = self.create_batch_gcu_patch(batch_tables)
+        if gcu_patch.patch:
+            format = ConfigFormat.CONFIGDB.name
+            config_format = ConfigFormat[format.upper()]
+            GenericUpdater().apply_patch(patch=gcu_patch, config_format=config_format, verbose=False,
+                                         dry_run=False, ignore_non_yang_tables=False, ignore_paths=None,
+                                         sort=False)
+
+        for func, args in batch_calls:
+            func(*args)
+
+    def after_batch(self, func, *args):
+        """
+        Calls func(*args) once the writes of the current batch are applied, or right away outside of a batch.
+        Used for writes that do not go through this connector, so that they are not left behind when the
+        batch block raises or its patch is rejected.
+        """
+        if self.batch_calls is None:
+            func(*args)
+        else:
+            self.batch_calls.append((func, args))
+
     def stringify_value(self, value):
         if isinstance(value, dict):
             value = {str(k):str(v) for k, v in value.items()}
@@ -130,3 +188,72 @@ class ValidatedConfigDBConnector(object):
 
         gcu_patch = self.create_gcu_patch(op, table, key, value)
         self.apply_patch(gcu_patch, table)
+
+    def get_batch_entries(self, table):
+        if table not in self.batch_tables:
+            entries = serialize_config_db({table: self.connector.get_table(table)})[table]
+            self.batch_tables[table] = (entries, copy.deepcopy(entries))
+        return self.batch_tables[table][1]
+
+    def get_batch_key(self, key):
+        return '|'.join(key) if isinstance(key, tuple) else key
+
+    def batched_delete_table(self, table):
+        self.get_batch_entries(table).clear()
+
+    def batched_mod_entry(self, table, key, value):
+        entries = self.get_batch_entries(table)
+        key = self.get_batch_key(key)
+        if value is None:
+            entries.pop(key, None)
+        elif isinstance(value, dict) and len(value) == 1 and list(value.values())[0] == "":
+            entries.get(key, {}).pop(list(value.keys())[0], None)
+        else:
+            entry = entries.setdefault(key, {})
+            for field, field_value in value.items():
+                entry[str(field)] = self.stringify_value(field_value)
+
+    def batched_set_entry(self, table, key, value):
+        entries = self.get_batch_entries(table)
+        key = self.get_batch_key(key)
+        if value is None or (isinstance(value, dict) and len(value) == 1 and list(value.values())[0] == ""):
+            entries.pop(key, None)
+        else:
+            _, entries[key] = self.make_path_value_jsonpatch_compatible(table, key, value)
+
+    def create_batch_gcu_patch(self, batch_tables):
+        """Creates the patch turning the tables written within batch() from their ConfigDB entries to the
+        entries after the writes. A table left without entries is removed, as ConfigDB does not hold empty
+        tables"""
+        gcu_json_input = []
+        for table, (old_entries, new_entries) in batch_tables.items():
+            table_path = JsonPointer.from_parts([table]).path
+            if not new_entries:
+                if old_entries:
+                    gcu_json_input.append({"op": "remove", "path": table_path})
+                continue
+            if not old_entries:
+                gcu_json_input.append({"op": "add", "path": table_path, "value": new_entries})
+                continue
+
+            for key in old_entries:
+                if key not in new_entries:
+                    gcu_json_input.append({"op": "remove", "path": JsonPointer.from_parts([table, key]).path})
+            for key, entry in new_entries.items():
+                old_entry = old_entries.get(key)
+                if old_entry is None:
+                    gcu_json_input.append({"op": "add",
+                                           "path": JsonPointer.from_parts([table, key]).path,
+                                           "value": entry})
+                    continue
+                for field in old_entry:
+                    if field not in entry:
+                        gcu_json_input.append({"op": "remove",
+                                               "path": JsonPointer.from_parts([table, key, field]).path})
+                for field, field_value in entry.items():
+                    if old_entry.get(field) != field_value:
+                        gcu_json_input.append({"op": "add",
+                                               "path": JsonPointer.from_parts([table, key, field]).path,
+                                               "value": field_value})
+
+        return jsonpatch.JsonPatch(gcu_json_input)
@@ -55,33 +55,34 @@ def add_vlan(db, vid, multiple):
         vid_list.append(int(vid))
 
     if ADHOC_VALIDATION:
+        # The VLANs are validated and added together when the batch exits
+        with config_db.batch():
+            # loop will execute till an exception occurs
+            for vid in vid_list:
 
-        # loop will execute till an exception occurs
-        for vid in vid_list:
+                if not clicommon.is_vlanid_in_range(vid):
+                    ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
 
-            if not clicommon.is_vlanid_in_range(vid):
-                ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
+                # Multiple VLANs need to be referenced
+                vlan = 'Vlan{}'.format(vid)
 
-            # Multiple VLANs need to be referenced
-            vlan = 'Vlan{}'.format(vid)
+                # Defualt VLAN checker
+                if vid == 1:
+                    ctx.fail("{} is default VLAN".format(vlan))  # TODO: MISSING CONSTRAINT IN YANG MODEL
 
-            # Defualt VLAN checker
-            if vid == 1:
-                ctx.fail("{} is default VLAN".format(vlan))  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                log.log_info("'vlan add {}' executing...".format(vid))
 
-            log.log_info("'vlan add {}' executing...".format(vid))
+                if clicommon.check_if_vlanid_exist(db.cfgdb, vlan):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                    ctx.fail("{} already exists.".format(vlan))
 
-            if clicommon.check_if_vlanid_exist(db.cfgdb, vlan):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} already exists.".format(vlan))
+                if clicommon.check_if_vlanid_exist(db.cfgdb, vlan, "DHCP_RELAY"):
+                    ctx.fail("DHCPv6 relay config for {} already exists".format(vlan))
 
-            if clicommon.check_if_vlanid_exist(db.cfgdb, vlan, "DHCP_RELAY"):
-                ctx.fail("DHCPv6 relay config for {} already exists".format(vlan))
+                # Enable STP on VLAN if PVST is enabled globally
+                config_db.after_batch(stp.vlan_enable_stp, db.cfgdb, vlan)
 
-            # Enable STP on VLAN if PVST is enabled globally
-            stp.vlan_enable_stp(db.cfgdb, vlan)
-
-            # set dhcpv4_relay table
-            set_dhcp_relay_table('VLAN', config_db, vlan, {'vlanid': str(vid)})
+                # set dhcpv4_relay table
+                set_dhcp_relay_table('VLAN', config_db, vlan, {'vlanid': str(vid)})
 
 
 def is_dhcpv6_relay_config_exist(db, vlan_name):
@@ -101,11 +102,16 @@ def delete_db_entry(entry_name, db_connector, db_name):
         db_connector.delete(db_name, entry_name)
 
 
-def enable_stp_on_port(db, port):
+def is_stp_needed_on_port(db, port):
     if stp.is_global_stp_enabled(db) is True:
         vlan_list_for_intf = stp.get_vlan_list_for_interface(db, port)
-        if len(vlan_list_for_intf) == 0:
-            stp.interface_enable_stp(db, port)
+        return len(vlan_list_for_intf) == 0
+    return False
+
+
+def enable_stp_on_port(db, port):
+    if is_stp_needed_on_port(db, port):
+        stp.interface_enable_stp(db, port)
 
 
 def disable_stp_on_vlan_port(db, vlan, port):
@@ -290,67 +296,79 @@ def add_vlan_member(db, vid, port, untagged, multiple, except_flag):
         ctx.fail("{} cannot have more than one untagged Vlan.".format(port))
     config_db = ValidatedConfigDBConnector(db.cfgdb)
     if ADHOC_VALIDATION:
-        for vid in vid_list:
-            vlan = 'Vlan{}'.format(vid)
-            # default vlan checker
-            if vid == 1:
-                ctx.fail("{} is default VLAN".format(vlan))
-            log.log_info("'vlan member add {} {}' executing...".format(vid, port))
-            if not clicommon.is_vlanid_in_range(vid):
-                ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
-            if clicommon.check_if_vlanid_exist(db.cfgdb, vlan) is False:
-                ctx.fail("{} does not exist".format(vlan))
-            if clicommon.get_interface_naming_mode() == "alias":  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                alias = port
-                iface_alias_converter = clicommon.InterfaceAliasConverter(db)
-                port = iface_alias_converter.alias_to_name(alias)
-                if port is None:
-                    ctx.fail("cannot find port name for alias {}".format(alias))
-            if clicommon.is_port_mirror_dst_port(db.cfgdb, port):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is configured as mirror destination port".format(port))
-            if clicommon.is_port_vlan_member(db.cfgdb, port, vlan):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is already a member of {}".format(port, vlan))
-            if clicommon.is_valid_port(db.cfgdb, port):
-                is_port = True
-            elif clicommon.is_valid_portchannel(db.cfgdb, port):
-                is_port = False
-            else:
-                ctx.fail("{} does not exist".format(port))
-            if (is_port and clicommon.is_port_router_interface(db.cfgdb, port)) or \
-                (not is_port and clicommon.is_pc_router_interface(
-                    db.cfgdb, port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is a router interface!".format(port))
-            portchannel_member_table = db.cfgdb.get_table('PORTCHANNEL_MEMBER')
-            if (is_port and clicommon.interface_is_in_portchannel(
-                 portchannel_member_table, port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is part of portchannel!".format(port))
-            if (clicommon.interface_is_untagged_member(
-                    db.cfgdb, port) and untagged):  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is already untagged member!".format(port))
-            # checking mode status of port if its access, trunk or routed
-            if is_port:
-                port_data = config_db.get_entry('PORT', port)
-            # if not port then is a port channel
-            elif not is_port:
-                port_data = config_db.get_entry('PORTCHANNEL', port)
-            existing_mode = None
-            if "mode" in port_data:
-                existing_mode = port_data["mode"]
-            if existing_mode == "routed":
-                ctx.fail("{} is in routed mode!\nUse switchport mode command to change port mode".format(port))
-            mode_type = "access" if untagged else "trunk"
-            if existing_mode == "access" and mode_type == "trunk":  # TODO: MISSING CONSTRAINT IN YANG MODEL
-                ctx.fail("{} is in access mode! Tagged Members cannot be added".format(port))
-            elif existing_mode == mode_type or (existing_mode == "trunk" and mode_type == "access"):
-                pass
-
-            # If port is being made L2 port, enable STP
-            enable_stp_on_port(db.cfgdb, port)
-
-            try:
-                config_db.set_entry('VLAN_MEMBER', (vlan, port), {'tagging_mode': "untagged" if untagged else "tagged"})
-            except ValueError:
-                ctx.fail("{} invalid or does not exist, or {} invalid or does not exist".format(vlan, port))
+        # Ports made L2 ports by this command, STP is enabled on them once the members are added
+        stp_ports = []
+        # The members are validated and added together when the batch exits
+        try:
+            with config_db.batch():
+                for vid in vid_list:
+                    vlan = 'Vlan{}'.format(vid)
+                    # default vlan checker
+                    if vid == 1:
+                        ctx.fail("{} is default VLAN".format(vlan))
+                    log.log_info("'vlan member add {} {}' executing...".format(vid, port))
+                    if not clicommon.is_vlanid_in_range(vid):
+                        ctx.fail("Invalid VLAN ID {} (2-4094)".format(vid))
+                    if clicommon.check_if_vlanid_exist(db.cfgdb, vlan) is False:
+                        ctx.fail("{} does not exist".format(vlan))
+                    if clicommon.get_interface_naming_mode() == "alias":  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        alias = port
+                        iface_alias_converter = clicommon.InterfaceAliasConverter(db)
+                        port = iface_alias_converter.alias_to_name(alias)
+                        if port is None:
+                            ctx.fail("cannot find port name for alias {}".format(alias))
+                    if clicommon.is_port_mirror_dst_port(db.cfgdb, port):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        ctx.fail("{} is configured as mirror destination port".format(port))
+                    if clicommon.is_port_vlan_member(db.cfgdb, port, vlan):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        ctx.fail("{} is already a member of {}".format(port, vlan))
+                    if clicommon.is_valid_port(db.cfgdb, port):
+                        is_port = True
+                    elif clicommon.is_valid_portchannel(db.cfgdb, port):
+                        is_port = False
+                    else:
+                        ctx.fail("{} does not exist".format(port))
+                    if (is_port and clicommon.is_port_router_interface(db.cfgdb, port)) or \
+                        (not is_port and clicommon.is_pc_router_interface(
+                            db.cfgdb, port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        ctx.fail("{} is a router interface!".format(port))
+                    portchannel_member_table = db.cfgdb.get_table('PORTCHANNEL_MEMBER')
+                    if (is_port and clicommon.interface_is_in_portchannel(
+                         portchannel_member_table, port)):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        ctx.fail("{} is part of portchannel!".format(port))
+                    if (clicommon.interface_is_untagged_member(
+                            db.cfgdb, port) and untagged):  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        ctx.fail("{} is already untagged member!".format(port))
+                    # checking mode status of port if its access, trunk or routed
+                    if is_port:
+                        port_data = config_db.get_entry('PORT', port)
+                    # if not port then is a port channel
+                    elif not is_port:
+                        port_data = config_db.get_entry('PORTCHANNEL', port)
+                    existing_mode = None
+                    if "mode" in port_data:
+                        existing_mode = port_data["mode"]
+                    if existing_mode == "routed":
+                        ctx.fail("{} is in routed mode!\nUse switchport mode command to change port mode".format(port))
+                    mode_type = "access" if untagged else "trunk"
+                    if existing_mode == "access" and mode_type == "trunk":  # TODO: MISSING CONSTRAINT IN YANG MODEL
+                        ctx.fail("{} is in access mode! Tagged Members cannot be added".format(port))
+                    elif existing_mode == mode_type or (existing_mode == "trunk" and mode_type == "access"):
+                        pass
+
+                    # If port is being made L2 port, enable STP
+                    if port not in stp_ports and is_stp_needed_on_port(db.cfgdb, port):
+                        stp_ports.append(port)
+
+                    try:
+                        config_db.set_entry('VLAN_MEMBER', (vlan, port),
+                                            {'tagging_mode': "untagged" if untagged else "tagged"})
+                    except ValueError:
+                        ctx.fail("{} invalid or does not exist, or {} invalid or does not exist".format(vlan, port))
+        except ValueError:
+            ctx.fail("VLAN invalid or does not exist, or {} invalid or does not exist".format(port))
+
+        for stp_port in stp_ports:
+            stp.interface_enable_stp(db.cfgdb, stp_port)
 
 
 @vlan_member.command('del')
@@ -6,10 +6,12 @@ import importlib
 import os
 import tempfile
 from collections import defaultdict
-from swsscommon.swsscommon import ConfigDBConnector
+from jsonpatch import JsonPatch, JsonPatchException
+from jsonpointer import JsonPointerException
+from swsscommon.swsscommon import ConfigDBPipeConnector
 from sonic_py_common import multi_asic
-from .gu_common import GenericConfigUpdaterError, genericUpdaterLogging
-from .gu_common import get_config_db_as_json
+from .gu_common import genericUpdaterLogging, genericUpdaterProfiling
+from .gu_common import JsonChange, PathAddressing, get_config_db_as_json, serialize_config_db
 
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 UPDATER_CONF_FILE = f"{SCRIPT_DIR}/gcu_services_validator.conf.json"
@@ -37,12 +39,13 @@ def log_error(m):
 
 
 def get_config_db(scope=multi_asic.DEFAULT_NAMESPACE):
-    config_db = ConfigDBConnector(use_unix_socket_path=True, namespace=scope)
+    config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=scope)
     config_db.connect()
     return config_db
 
 
 def set_config(config_db, tbl, key, data):
+    genericUpdaterProfiling.count("config_db_writes")
     config_db.set_entry(tbl, key, data)
 
 
@@ -59,6 +62,41 @@ def prune_empty_table(data):
     return data
 
 
+def prune_empty_entries(data):
+    # An entry with no fields is stored as a lone "NULL" field, which
+    # get_entry cannot tell apart from a missing entry.
+    #
+    # Hence when comparing entries read with get_entry, drop the empty ones.
+    #
+    return prune_empty_table({tbl: {key: entry for key, entry in entries.items() if entry}
+                              for tbl, entries in data.items()})
+
+
+def get_change_scope(change):
+    """
+    Returns the CONFIG_DB entries a change may touch as {table: set of keys},
+    where a table maps to None if the change may touch any of its keys.
+    Returns None if the scope is not known, i.e. the change is not a JsonChange
+    holding a JsonPatch, or it operates on the whole config.
+    """
+    if not isinstance(change, JsonChange) or not isinstance(change.patch, JsonPatch):
+        return None
+
+    scope = {}
+    for operation in change.patch:
+        for field in ["path", "from"]:
+            if field not in operation:
+                continue
+            tokens = PathAddressing().get_path_tokens(operation[field])
+            if not tokens:
+                return None
+            if len(tokens) == 1:
+                scope[tokens[0]] = None
+            elif scope.get(tokens[0], set()) is not None:
+                scope.setdefault(tokens[0], set()).add(tokens[1])
+    return scope
+
+
 class DryRunChangeApplier:
 
     def __init__(self, config_wrapper):
@@ -70,14 +108,22 @@ class DryRunChangeApplier:
     def remove_backend_tables_from_config(self, data):
         return data
 
+    def clear_running_config(self):
+        pass
+
 
 class ChangeApplier:
 
     updater_conf = None
 
-    def __init__(self, scope=multi_asic.DEFAULT_NAMESPACE):
+    def __init__(self, scope=multi_asic.DEFAULT_NAMESPACE, cache_running_config=False):
         self.scope = scope
         self.config_db = get_config_db(self.scope)
+        # When set, the running config read for a change is reused by the next ones, until something
+        # is written or clear_running_config is called. The owner must clear it once its changes are
+        # applied, as CONFIG_DB may be written by others in between.
+        self.cache_running_config = cache_running_config
+        self.running_config = None
         self.backend_tables = [
             "BUFFER_PG",
             "BUFFER_PROFILE",
@@ -98,7 +144,7 @@ class ChangeApplier:
 
         return method_to_call(old_cfg, upd_cfg, keys)
 
-    def _services_validate(self, old_cfg, upd_cfg, keys):
+    def _get_validate_cmds(self, keys):
         lst_svcs = set()
         lst_cmds = set()
         if not keys:
@@ -114,21 +160,29 @@ class ChangeApplier:
         services = ChangeApplier.updater_conf["services"]
         for svc in lst_svcs:
             lst_cmds.update(services.get(svc, {}).get("validate_commands", []))
+        return lst_cmds
 
+    def _run_validate_cmds(self, lst_cmds, old_cfg, upd_cfg, keys):
         for cmd in lst_cmds:
-            ret = self._invoke_cmd(cmd, old_cfg, upd_cfg, keys)
+            genericUpdaterProfiling.count("service_validations")
+            with genericUpdaterProfiling.phase("service_validation"):
+                ret = self._invoke_cmd(cmd, old_cfg, upd_cfg, keys)
             if not ret:
                 log_error("service invoked: {} failed with ret={}".format(cmd, ret))
                 return ret
             log_debug("service invoked: {}".format(cmd))
         return 0
 
+    def _services_validate(self, old_cfg, upd_cfg, keys):
+        return self._run_validate_cmds(self._get_validate_cmds(keys), old_cfg, upd_cfg, keys)
+
     def _upd_data(self, tbl, run_tbl, upd_tbl, upd_keys):
         for key in set(run_tbl.keys()).union(set(upd_tbl.keys())):
             run_data = run_tbl.get(key, None)
             upd_data = upd_tbl.get(key, None)
 
             if run_data != upd_data:
+                self.running_config = None
                 set_config(self.config_db, tbl, key, upd_data)
                 upd_keys[tbl][key] = {}
                 log_debug("Patch affected tbl={} key={}".format(tbl, key))
@@ -137,8 +191,106 @@ class ChangeApplier:
         log_error("run_data vs expected_data: {}".format(
             str(jsondiff.diff(run_data, upd_data))[0:40]))
 
-    def apply(self, change):
-        run_data = get_config_db_as_json(self.scope)
+    def clear_running_config(self):
+        self.running_config = None
+
+    def _get_running_config(self):
+        if not self.cache_running_config:
+            return get_config_db_as_json(self.scope)
+        # The config read to verify a change is reused by the next change, unless something was written
+        if self.running_config is None:
+            self.running_config = get_config_db_as_json(self.scope)
+        return copy.deepcopy(self.running_config)
+
+    def _read_entries(self, scope):
+        # Reads only the entries in scope, as {table: {key: entry}}. Entries read with get_entry
+        # are left out when empty, and the tables are kept even when none of their entries is
+        # found, so new keys can be added.
+        data = {}
+        with genericUpdaterProfiling.phase("config_db_read"):
+            for tbl, keys in scope.items():
+                if keys is None:
+                    genericUpdaterProfiling.count("config_db_reads")
+                    data[tbl] = serialize_config_db({tbl: self.config_db.get_table(tbl)})[tbl]
+                else:
+                    genericUpdaterProfiling.count("config_db_reads", len(keys))
+                    entries = {key: self.config_db.get_entry(tbl, key) for key in keys}
+                    data[tbl] = {key: entry for key, entry in entries.items() if entry}
+        return data
+
+    def _get_upd_keys(self, run_data, upd_data):
+        upd_keys = defaultdict(dict)
+        for tbl in sorted(set(run_data.keys()).union(set(upd_data.keys()))):
+            run_tbl = run_data.get(tbl, {})
+            upd_tbl = upd_data.get(tbl, {})
+            for key in set(run_tbl.keys()).union(set(upd_tbl.keys())):
+                if run_tbl.get(key, None) != upd_tbl.get(key, None):
+                    upd_keys[tbl][key] = {}
+                    log_debug("Patch affected tbl={} key={}".format(tbl, key))
+        return upd_keys
+
+    def _write_entries(self, run_data, upd_data, upd_keys):
+        mod_data = defaultdict(dict)
+        for tbl in upd_keys:
+            for key in upd_keys[tbl]:
+                run_entry = run_data.get(tbl, {}).get(key, None)
+                upd_entry = upd_data.get(tbl, {}).get(key, None)
+                if run_entry and upd_entry is not None and set(run_entry) - set(upd_entry):
+                    # mod_config only adds & updates fields, set_entry removes the others
+                    set_config(self.config_db, tbl, key, upd_entry)
+                else:
+                    mod_data[tbl][key] = upd_entry
+        if mod_data:
+            # ConfigDBPipeConnector writes all of them in a single pipelined transaction
+            genericUpdaterProfiling.count("config_db_writes")
+            self.config_db.mod_config(dict(mod_data))
+
+    @staticmethod
+    def _overlay(config, scope, data):
+        # Replaces the entries in scope of config with the ones in data
+        for tbl, keys in scope.items():
+            if keys is None:
+                config[tbl] = copy.deepcopy(data.get(tbl, {}))
+                continue
+            for key in keys:
+                if key in data.get(tbl, {}):
+                    config.setdefault(tbl, {})[key] = copy.deepcopy(data[tbl][key])
+                else:
+                    config.get(tbl, {}).pop(key, None)
+        return prune_empty_table(config)
+
+    def _apply_scoped(self, scope, run_data, upd_data):
+        upd_keys = self._get_upd_keys(run_data, upd_data)
+        has_updates = bool(upd_keys)
+
+        # The validators look at the whole config, so it is only read when there is one to invoke
+        lst_cmds = self._get_validate_cmds(upd_keys)
+        if lst_cmds:
+            old_cfg = self._get_running_config()
+            upd_cfg = self._overlay(copy.deepcopy(old_cfg), scope, upd_data)
+
+        if has_updates:
+            self._write_entries(run_data, upd_data, upd_keys)
+
+        ret = self._run_validate_cmds(lst_cmds, old_cfg, upd_cfg, upd_keys) if lst_cmds else 0
+
+        verify_scope = {tbl: keys for tbl, keys in scope.items() if tbl not in self.backend_tables}
+        if not ret:
+            run_data = prune_empty_entries(self._read_entries(verify_scope))
+            exp_data = prune_empty_entries(upd_data)
+            self.remove_backend_tables_from_config(exp_data)
+            if exp_data != run_data:
+                self._report_mismatch(run_data, exp_data)
+                ret = -1
+
+        if ret or verify_scope.keys() != scope.keys():
+            self.running_config = None
+        elif self.running_config is not None:
+            self._overlay(self.running_config, scope, upd_data)
+        return ret
+
+    def _apply_full(self, change):
+        run_data = self._get_running_config()
         upd_data = prune_empty_table(change.apply(copy.deepcopy(run_data)))
         upd_keys = defaultdict(dict)
 
@@ -147,12 +299,29 @@ class ChangeApplier:
 
         ret = self._services_validate(run_data, upd_data, upd_keys)
         if not ret:
-            run_data = get_config_db_as_json(self.scope)
+            run_data = self._get_running_config()
             self.remove_backend_tables_from_config(upd_data)
             self.remove_backend_tables_from_config(run_data)
             if upd_data != run_data:
                 self._report_mismatch(run_data, upd_data)
                 ret = -1
+        return ret
+
+    def apply(self, change):
+        # When the change tells which entries it touches, only those are read, written and verified
+        scope = get_change_scope(change)
+        ret = None
+        if scope is not None:
+            run_data = self._read_entries(scope)
+            try:
+                upd_data = prune_empty_table(change.apply(copy.deepcopy(run_data)))
+            except (JsonPatchException, JsonPointerException) as e:
+                # e.g. the patch updates an entry with no fields, which _read_entries leaves out
+                log_debug("Change does not apply to the entries in its scope: {}".format(e))
+            else:
+                ret = self._apply_scoped(scope, run_data, upd_data)
+        if ret is None:
+            ret = self._apply_full(change)
         if ret:
             log_error("Failed to apply Json change")
         return ret
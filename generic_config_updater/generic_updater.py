@@ -6,9 +6,9 @@ import subprocess
 from datetime import datetime, timezone
 from enum import Enum
 from .gu_common import HOST_NAMESPACE, GenericConfigUpdaterError, EmptyTableError, ConfigWrapper, \
-                    DryRunConfigWrapper, PatchWrapper, genericUpdaterLogging
-from .patch_sorter import StrictPatchSorter, NonStrictPatchSorter, ConfigSplitter, \
-                        TablesWithoutYangConfigSplitter, IgnorePathsFromYangConfigSplitter
+                    DryRunConfigWrapper, PatchWrapper, genericUpdaterLogging, genericUpdaterProfiling
+from .patch_sorter import StrictPatchSorter, NonStrictPatchSorter, PatchSorter, ConfigSplitter, \
+                        TablesWithoutYangConfigSplitter, IgnorePathsFromYangConfigSplitter, Algorithm
 from .change_applier import ChangeApplier, DryRunChangeApplier
 from sonic_py_common import multi_asic
 
@@ -99,7 +99,8 @@ class PatchApplier:
         self.config_wrapper = config_wrapper if config_wrapper is not None else ConfigWrapper(scope=self.scope)
         self.patch_wrapper = patch_wrapper if patch_wrapper is not None else PatchWrapper(scope=self.scope)
         self.patchsorter = patchsorter if patchsorter is not None else StrictPatchSorter(self.config_wrapper, self.patch_wrapper)
-        self.changeapplier = changeapplier if changeapplier is not None else ChangeApplier(scope=self.scope)
+        self.changeapplier = changeapplier if changeapplier is not None else \
+            ChangeApplier(scope=self.scope, cache_running_config=True)
 
     def apply(self, patch, sort=True):
         scope = self.scope if self.scope else HOST_NAMESPACE
@@ -130,28 +131,37 @@ class PatchApplier:
         # Generate list of changes to apply
         if sort:
             self.logger.log_notice(f"{scope}: sorting patch updates.")
-            changes = self.patchsorter.sort(patch)
+            with genericUpdaterProfiling.phase("sort"):
+                changes = self.patchsorter.sort(patch)
         else:
             self.logger.log_notice(f"{scope}: converting patch to JsonChange.")
             changes = [JsonChange(jsonpatch.JsonPatch([element])) for element in patch]
 
         changes_len = len(changes)
+        genericUpdaterProfiling.count("changes", changes_len)
         self.logger.log_notice(f"The {scope} patch was converted into {changes_len} " \
                           f"change{'s' if changes_len != 1 else ''}{':' if changes_len > 0 else '.'}")
 
         # Apply changes in order
         self.logger.log_notice(f"{scope}: applying {changes_len} change{'s' if changes_len != 1 else ''} " \
                                f"in order{':' if changes_len > 0 else '.'}")
-        for change in changes:
-            self.logger.log_notice(f"  * {change}")
-            self.changeapplier.apply(change)
+        with genericUpdaterProfiling.phase("apply_changes"):
+            try:
+                for change in changes:
+                    self.logger.log_notice(f"  * {change}")
+                    self.changeapplier.apply(change)
+            finally:
+                # The running config cached by the applier is not reused by the next patch
+                self.changeapplier.clear_running_config()
 
         # Validate config updated successfully
         self.logger.log_notice(f"{scope}: verifying patch updates are reflected on ConfigDB.")
-        new_config = self.config_wrapper.get_config_db_as_json()
-        self.changeapplier.remove_backend_tables_from_config(target_config)
-        self.changeapplier.remove_backend_tables_from_config(new_config)
-        if not (self.patch_wrapper.verify_same_json(target_config, new_config)):
+        with genericUpdaterProfiling.phase("verify"):
+            new_config = self.config_wrapper.get_config_db_as_json()
+            self.changeapplier.remove_backend_tables_from_config(target_config)
+            self.changeapplier.remove_backend_tables_from_config(new_config)
+            is_same_json = self.patch_wrapper.verify_same_json(target_config, new_config)
+        if not is_same_json:
             raise GenericConfigUpdaterError(f"{scope}: after applying patch to config, there are still some parts not updated")
 
         self.logger.log_notice(f"{scope} patch application completed.")
@@ -173,7 +183,8 @@ class ConfigReplacer:
         old_config = self.config_wrapper.get_config_db_as_json()
 
         self.logger.log_notice("Generating patch between target config and current config db.")
-        patch = self.patch_wrapper.generate_patch(old_config, target_config)
+        with genericUpdaterProfiling.phase("generate_patch"):
+            patch = self.patch_wrapper.generate_patch(old_config, target_config)
         self.logger.log_debug(f"Generated patch: {patch}.") # debug since the patch will printed again in 'patch_applier.apply'
 
         self.logger.log_notice("Applying patch using 'Patch Applier'.")
@@ -490,8 +501,10 @@ class ConfigLockDecorator(Decorator):
 
 
 class GenericUpdateFactory:
-    def __init__(self, scope=multi_asic.DEFAULT_NAMESPACE):
+    def __init__(self, scope=multi_asic.DEFAULT_NAMESPACE, validation_processes=0, sort_algorithm=Algorithm.DFS):
         self.scope = scope
+        self.validation_processes = validation_processes
+        self.sort_algorithm = sort_algorithm
 
     def create_patch_applier(self, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths):
         self.init_verbose_logging(verbose)
@@ -596,11 +609,16 @@ class GenericUpdateFactory:
         if dry_run:
             return DryRunChangeApplier(config_wrapper)
         else:
-            return ChangeApplier(scope=self.scope)
+            return ChangeApplier(scope=self.scope, cache_running_config=True)
 
     def get_patch_sorter(self, ignore_non_yang_tables, ignore_paths, config_wrapper, patch_wrapper):
+        inner_patch_sorter = None
+        if self.validation_processes:
+            inner_patch_sorter = PatchSorter(config_wrapper, patch_wrapper,
+                                             validation_processes=self.validation_processes)
+
         if not ignore_non_yang_tables and not ignore_paths:
-            return StrictPatchSorter(config_wrapper, patch_wrapper)
+            return StrictPatchSorter(config_wrapper, patch_wrapper, inner_patch_sorter, self.sort_algorithm)
 
         inner_config_splitters = []
         if ignore_non_yang_tables:
@@ -611,25 +629,40 @@ class GenericUpdateFactory:
 
         config_splitter = ConfigSplitter(config_wrapper, inner_config_splitters)
 
-        return NonStrictPatchSorter(config_wrapper, patch_wrapper, config_splitter)
+        return NonStrictPatchSorter(config_wrapper, patch_wrapper, config_splitter, patch_sorter=inner_patch_sorter,
+                                    algorithm=self.sort_algorithm)
 
 
 class GenericUpdater:
-    def __init__(self, generic_update_factory=None, scope=multi_asic.DEFAULT_NAMESPACE):
-        self.generic_update_factory = \
-            generic_update_factory if generic_update_factory is not None else GenericUpdateFactory(scope=scope)
+    def __init__(self, generic_update_factory=None, scope=multi_asic.DEFAULT_NAMESPACE, validation_processes=0,
+                 sort_algorithm=Algorithm.DFS, profile=False):
+        self.generic_update_factory = generic_update_factory if generic_update_factory is not None else \
+            GenericUpdateFactory(scope=scope, validation_processes=validation_processes, sort_algorithm=sort_algorithm)
+        # Record the time spent per phase of apply_patch, replace and rollback in genericUpdaterProfiling,
+        # under the scope name, the caller gets it with its report()
+        self.profile_scope = scope if scope else HOST_NAMESPACE
+        self.profile = profile
+
+    def profiled(self):
+        return genericUpdaterProfiling.profiled(self.profile_scope, self.profile)
 
     def apply_patch(self, patch, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths, sort=True):
-        patch_applier = self.generic_update_factory.create_patch_applier(config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths)
-        patch_applier.apply(patch, sort)
+        with self.profiled(), genericUpdaterProfiling.phase("apply_patch"):
+            patch_applier = self.generic_update_factory.create_patch_applier(
+                config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths)
+            patch_applier.apply(patch, sort)
 
     def replace(self, target_config, config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths):
-        config_replacer = self.generic_update_factory.create_config_replacer(config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths)
-        config_replacer.replace(target_config)
+        with self.profiled(), genericUpdaterProfiling.phase("replace"):
+            config_replacer = self.generic_update_factory.create_config_replacer(
+                config_format, verbose, dry_run, ignore_non_yang_tables, ignore_paths)
+            config_replacer.replace(target_config)
 
     def rollback(self, checkpoint_name, verbose, dry_run, ignore_non_yang_tables, ignore_paths):
-        config_rollbacker = self.generic_update_factory.create_config_rollbacker(verbose, dry_run, ignore_non_yang_tables, ignore_paths)
-        config_rollbacker.rollback(checkpoint_name)
+        with self.profiled(), genericUpdaterProfiling.phase("rollback"):
+            config_rollbacker = self.generic_update_factory.create_config_rollbacker(
+                verbose, dry_run, ignore_non_yang_tables, ignore_paths)
+            config_rollbacker.rollback(checkpoint_name)
 
     def checkpoint(self, checkpoint_name, verbose):
         config_rollbacker = self.generic_update_factory.create_config_rollbacker(verbose)
@@ -1,6 +1,13 @@
+import contextlib
 import json
 import jsonpatch
 import importlib
+import glob
+import hashlib
+import pickle
+import tempfile
+import threading
+import time
 from jsonpointer import JsonPointer
 import sonic_yang
 import sonic_yang_ext
@@ -10,13 +17,17 @@ import copy
 import re
 import os
 from sonic_py_common import logger, multi_asic
+from swsscommon.swsscommon import ConfigDBPipeConnector
+from collections import OrderedDict
 from enum import Enum
 
 YANG_DIR = "/usr/local/yang-models"
+YANG_MODEL_CACHE_DIR = "/var/cache/generic_config_updater"
 SYSLOG_IDENTIFIER = "GenericConfigUpdater"
 SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
 GCU_FIELD_OP_CONF_FILE = f"{SCRIPT_DIR}/gcu_field_operation_validators.conf.json"
 HOST_NAMESPACE = "localhost"
+CONFIG_DB_KEY_SEPARATOR = "|"
 
 
 class GenericConfigUpdaterError(Exception):
@@ -55,10 +66,28 @@ class JsonChange:
 
 
 def get_config_db_as_json(scope=None):
-    text = get_config_db_as_text(scope=scope)
-    config_db_json = json.loads(text)
-    config_db_json.pop("bgpraw", None)
-    return config_db_json
+    """
+    Reads the running CONFIG_DB in-process, in the same format as `sonic-cfggen -d --print-data`.
+    ConfigDBPipeConnector reads all the tables in a single pipelined request.
+    """
+    namespace = scope if scope is not None else multi_asic.DEFAULT_NAMESPACE
+    with genericUpdaterProfiling.phase("config_db_read"):
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+        config_db.connect()
+        config = config_db.get_config()
+        genericUpdaterProfiling.count("config_db_reads")
+    config.pop("bgpraw", None)
+    return serialize_config_db(config)
+
+
+def serialize_config_db(config):
+    """
+    Converts the output of ConfigDBConnector.get_config to its JSON form, i.e. with multi-part
+    keys such as ('Vlan1000', 'Ethernet0') joined as 'Vlan1000|Ethernet0'
+    """
+    return {table: {CONFIG_DB_KEY_SEPARATOR.join(key) if isinstance(key, tuple) else key: entry
+                    for key, entry in entries.items()}
+            for table, entries in config.items()}
 
 
 def get_config_db_as_text(scope=None):
@@ -66,8 +95,10 @@ def get_config_db_as_text(scope=None):
         cmd = ['sonic-cfggen', '-d', '--print-data', '-n', scope]
     else:
         cmd = ['sonic-cfggen', '-d', '--print-data']
-    result = subprocess.Popen(cmd, shell=False, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    text, err = result.communicate()
+    with genericUpdaterProfiling.phase("config_db_read"):
+        result = subprocess.Popen(cmd, shell=False, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        text, err = result.communicate()
+        genericUpdaterProfiling.count("config_db_reads")
     return_code = result.returncode
     if return_code:
         raise GenericConfigUpdaterError(f"Failed to get running config for namespace: {scope},"
@@ -144,17 +175,19 @@ class ConfigWrapper:
         supplemental_yang_validators = [self.validate_bgp_peer_group,
                                         self.validate_lanes]
 
+        genericUpdaterProfiling.count("yang_validations")
         try:
-            tmp_config_db_as_json = copy.deepcopy(config_db_as_json)
+            with genericUpdaterProfiling.phase("yang_validation"):
+                tmp_config_db_as_json = copy.deepcopy(config_db_as_json)
 
-            sy.loadData(tmp_config_db_as_json)
+                sy.loadData(tmp_config_db_as_json)
 
-            sy.validate_data_tree()
+                sy.validate_data_tree()
 
-            for supplemental_yang_validator in supplemental_yang_validators:
-                success, error = supplemental_yang_validator(config_db_as_json)
-                if not success:
-                    return success, error
+                for supplemental_yang_validator in supplemental_yang_validators:
+                    success, error = supplemental_yang_validator(config_db_as_json)
+                    if not success:
+                        return success, error
         except sonic_yang.SonicYangException as ex:
             return False, ex
 
@@ -347,9 +380,11 @@ class ConfigWrapper:
         # sonic_yang_with_loaded_models will only be initialized once the first time this method is called
         if self.sonic_yang_with_loaded_models is None:
             sonic_yang_print_log_enabled = genericUpdaterLogging.get_verbose()
-            loaded_models_sy = sonic_yang.SonicYang(self.yang_dir, print_log_enabled=sonic_yang_print_log_enabled)
-            loaded_models_sy.loadYangModel() # This call takes a long time (100s of ms) because it reads files from disk
-            self.sonic_yang_with_loaded_models = loaded_models_sy
+            # Loading the models takes a long time (100s of ms) because it reads files from disk. Every
+            # ConfigWrapper has its own SonicYang and libyang context, only the parsed models are shared by
+            # all the ConfigWrappers of the process and cached on disk
+            with genericUpdaterProfiling.phase("yang_model_load"):
+                self.sonic_yang_with_loaded_models = yangModelCache.get(self.yang_dir, sonic_yang_print_log_enabled)
 
         return copy.copy(self.sonic_yang_with_loaded_models)
 
@@ -460,8 +495,13 @@ class PathAddressing:
     PATH_SEPARATOR = "/"
     XPATH_SEPARATOR = "/"
 
+    # Number of recently queried configs whose ReverseRefIndex is kept
+    REF_INDEX_CACHE_SIZE = 4
+
     def __init__(self, config_wrapper=None):
         self.config_wrapper = config_wrapper
+        # {config serialized with sorted keys: ReverseRefIndex} of the recently queried configs, least recent first
+        self._ref_indexes = OrderedDict()
 
     def get_path_tokens(self, path):
         return JsonPointer(path).parts
@@ -604,15 +644,24 @@ class PathAddressing:
             /ACL_TABLE/EVERFLOW6/ports/1
         """
         # TODO: Also fetch references by must statement (check similar statements)
-        return self._find_leafref_paths(path, config)
+        return self._get_ref_index(config).find_ref_paths(path, config)
 
-    def _find_leafref_paths(self, path, config):
-        sy = self._create_sonic_yang_with_loaded_models()
-
-        tmp_config = copy.deepcopy(config)
-
-        sy.loadData(tmp_config)
+    def _get_ref_index(self, config):
+        """
+        Returns the ReverseRefIndex of the given config, reusing the index of a recently queried equal config.
+        """
+        config_text = json.dumps(config, sort_keys=True)
+        ref_index = self._ref_indexes.get(config_text)
+        if ref_index is None:
+            ref_index = ReverseRefIndex(self, config_text)
+            self._ref_indexes[config_text] = ref_index
+            if len(self._ref_indexes) > PathAddressing.REF_INDEX_CACHE_SIZE:
+                self._ref_indexes.popitem(last=False)
+        else:
+            self._ref_indexes.move_to_end(config_text)
+        return ref_index
 
+    def _find_leafref_paths(self, path, config, sy):
         xpath = self.convert_path_to_xpath(path, config, sy)
 
         leaf_xpaths = self._get_inner_leaf_xpaths(xpath, sy)
@@ -1100,6 +1149,40 @@ class PathAddressing:
 
         return None
 
+
+class ReverseRefIndex:
+    """
+    The references within one config, looked up lazily. The config is loaded into a SonicYang on the first
+    query only, and the paths referencing the leaves under a given path are looked up the first time that
+    path is queried. Later queries of the same path are dictionary lookups.
+    """
+    def __init__(self, path_addressing, config_text):
+        self.path_addressing = path_addressing
+        # The config serialized, the queried config may be modified after the index is created
+        self.config_text = config_text
+        self.sy = None
+        # {path: sorted paths referencing any leaf under it}
+        self.ref_paths = {}
+
+    def find_ref_paths(self, path, config):
+        """
+        Returns the sorted paths referencing any leaf under the given path. <config> is the indexed config.
+        """
+        ref_paths = self.ref_paths.get(path)
+        if ref_paths is None:
+            ref_paths = self.path_addressing._find_leafref_paths(path, config, self._get_sonic_yang())
+            self.ref_paths[path] = ref_paths
+        return list(ref_paths)
+
+    def _get_sonic_yang(self):
+        if self.sy is None:
+            sy = self.path_addressing._create_sonic_yang_with_loaded_models()
+            # loadData gets a private copy of the config, parsed from the serialized one
+            sy.loadData(json.loads(self.config_text))
+            self.sy = sy
+        return self.sy
+
+
 class TitledLogger(logger.Logger):
     def __init__(self, syslog_identifier, title, verbose, print_all_to_console):
         super().__init__(syslog_identifier)
@@ -1126,3 +1209,239 @@ class GenericUpdaterLogging:
         return TitledLogger(SYSLOG_IDENTIFIER, title, self._verbose, print_all_to_console)
 
 genericUpdaterLogging = GenericUpdaterLogging()
+
+
+class GenericUpdaterProfiling:
+    """
+    Process-wide record of the time spent in each phase of a config update and of the number of times
+    some operations are made, such as CONFIG_DB round trips or validator invocations, kept per scope.
+
+    Phases nest, e.g. 'yang_validation' is also part of 'sort' when the sorter validates the target config,
+    so the phase times are not meant to add up. The CPU time is the time of this process, the time spent by
+    validation worker processes or sonic-cfggen is only part of the wall time.
+
+    Nothing is recorded outside of a profiled() block, a phase then costs one thread-local lookup. The
+    blocks are per thread, so scopes updated by parallel threads are recorded apart.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._records = {}
+
+    @contextlib.contextmanager
+    def profiled(self, scope, enabled=True):
+        """
+        Records the phases and counters of this thread within the block under the given scope, or nothing
+        if not enabled. The state of the thread before the block is restored when it exits.
+        """
+        record = None
+        if enabled:
+            with self._lock:
+                record = self._records.setdefault(scope, {"phases": {}, "counters": {}})
+        previous = getattr(self._local, "record", None)
+        self._local.record = record
+        try:
+            yield
+        finally:
+            self._local.record = previous
+
+    def _get_record(self):
+        return getattr(self._local, "record", None)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        record = self._get_record()
+        if record is None:
+            yield
+            return
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            with self._lock:
+                totals = record["phases"].setdefault(name, {"calls": 0, "wall_time": 0.0, "cpu_time": 0.0})
+                totals["calls"] += 1
+                totals["wall_time"] += wall_time
+                totals["cpu_time"] += cpu_time
+
+    def count(self, name, value=1):
+        record = self._get_record()
+        if record is None:
+            return
+
+        with self._lock:
+            record["counters"][name] = record["counters"].get(name, 0) + value
+
+    def report(self):
+        """
+        Returns {scope: {"phases": {phase: {"calls", "wall_time", "cpu_time"}}, "counters": {counter: value}}},
+        with the times in seconds.
+        """
+        with self._lock:
+            return copy.deepcopy(self._records)
+
+
+genericUpdaterProfiling = GenericUpdaterProfiling()
+
+
+class YangModelCache:
+    """
+    Process-wide cache of the YANG models of a directory parsed by SonicYang, backed by an on-disk cache.
+
+    Every get() returns a new SonicYang with its own libyang context, so SonicYang objects used by different
+    threads never share one. Only the parsed models, the fields set by loadYangModel such as yJson and
+    confDbYangMap, are shared. These are only read once loaded. When they are cached, only the YANG schemas
+    are loaded into the new context and the parsing is skipped.
+
+    The parsed models are reused as long as the mtime and size of the directory's YANG files are unchanged.
+    They are private SonicYang state, so the on-disk cache is keyed by a hash of both the YANG files' content
+    and the sonic_yang sources. Any problem with the on-disk cache, such as a file that cannot be unpickled,
+    falls back to loadYangModel.
+    """
+    # SonicYang fields holding the parsed models, the libyang context is not serializable and is rebuilt
+    MODEL_FIELDS = ["yangFiles", "yJson", "confDbYangMap", "preProcessedYang"]
+    CACHE_FILE = "yang_models.pickle"
+
+    def __init__(self, cache_dir=YANG_MODEL_CACHE_DIR):
+        self.cache_dir = cache_dir
+        # {yang dir: (fingerprint, parsed models)}
+        self._models = {}
+        self._library_hash = None
+        self._lock = threading.Lock()
+
+    def get(self, yang_dir, print_log_enabled=False):
+        yang_files = sorted(glob.glob(os.path.join(yang_dir, "*.yang")))
+        fingerprint = self._get_fingerprint(yang_dir, yang_files)
+        key = os.path.realpath(yang_dir)
+        with self._lock:
+            cached = self._models.get(key)
+            if cached is None or cached[0] != fingerprint:
+                sy, models = self._load(yang_dir, yang_files, print_log_enabled)
+                self._models[key] = (fingerprint, models)
+                return sy
+            models = cached[1]
+
+        # Outside of the lock, every SonicYang loads the schemas into its own context
+        sy = sonic_yang.SonicYang(yang_dir, print_log_enabled=print_log_enabled)
+        self._load_models(sy, yang_dir, models)
+        return sy
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def _get_fingerprint(self, yang_dir, yang_files):
+        stats = []
+        for path in [yang_dir] + yang_files:
+            st = os.stat(path)
+            stats.append((path, st.st_mtime_ns, st.st_size))
+        return tuple(stats)
+
+    def _get_library_hash(self):
+        if self._library_hash is None:
+            digest = hashlib.sha256()
+            for module in [sonic_yang, sonic_yang_ext]:
+                with open(module.__file__, "rb") as f:
+                    digest.update(f.read())
+            self._library_hash = digest.hexdigest()
+        return self._library_hash
+
+    def _get_content_hash(self, yang_files):
+        digest = hashlib.sha256()
+        digest.update(self._get_library_hash().encode())
+        for path in yang_files:
+            digest.update(os.path.basename(path).encode())
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def _load_models(self, sy, yang_dir, models):
+        """
+        Loads the YANG schemas of <yang_dir> into the context of <sy>, and sets the parsed <models> on it.
+        """
+        # glob order, same as loadYangModel
+        for yang_file in glob.glob(os.path.join(yang_dir, "*.yang")):
+            if sy.ctx.parse_module_path(yang_file, ly.LYS_IN_YANG) is None:
+                raise GenericConfigUpdaterError(f"Could not load module {yang_file}")
+        for field, value in models.items():
+            setattr(sy, field, value)
+
+    def _load(self, yang_dir, yang_files, print_log_enabled):
+        """
+        Returns a SonicYang with the models of <yang_dir> loaded and its parsed models, read from the on-disk
+        cache when possible.
+        """
+        logger = genericUpdaterLogging.get_logger(title="YANG model cache")
+        sy = sonic_yang.SonicYang(yang_dir, print_log_enabled=print_log_enabled)
+
+        try:
+            content_hash = self._get_content_hash(yang_files)
+            models = self._read_cache_file(content_hash)
+        except Exception as ex:
+            logger.log_debug(f"Not using the on-disk YANG model cache: {ex}")
+            content_hash, models = None, None
+
+        if models is not None:
+            try:
+                self._load_models(sy, yang_dir, models)
+                logger.log_debug(f"Loaded YANG models of {yang_dir} from the on-disk cache")
+                return sy, models
+            except Exception as ex:
+                logger.log_debug(f"Failed to use the on-disk YANG model cache: {ex}")
+                sy = sonic_yang.SonicYang(yang_dir, print_log_enabled=print_log_enabled)
+
+        sy.loadYangModel()
+        models = {field: getattr(sy, field) for field in self.MODEL_FIELDS if hasattr(sy, field)}
+
+        if content_hash is not None:
+            try:
+                self._write_cache_file(content_hash, models)
+            except Exception as ex:
+                logger.log_debug(f"Failed to write the on-disk YANG model cache: {ex}")
+        return sy, models
+
+    def _read_cache_file(self, content_hash):
+        path = os.path.join(self.cache_dir, self.CACHE_FILE)
+        if not os.path.exists(path):
+            return None
+
+        # Only trust a cache file written by this user and not writable by others
+        st = os.stat(path)
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("content_hash") != content_hash:
+                return None
+            models = cached["models"]
+            if not set(models).issubset(self.MODEL_FIELDS):
+                return None
+        except Exception as ex:
+            # Truncated, or written by a version this one cannot read
+            logger = genericUpdaterLogging.get_logger(title="YANG model cache")
+            logger.log_debug(f"Ignoring the on-disk YANG model cache: {ex}")
+            return None
+        return models
+
+    def _write_cache_file(self, content_hash, models):
+        os.makedirs(self.cache_dir, mode=0o755, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=self.CACHE_FILE)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"content_hash": content_hash, "models": models}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, os.path.join(self.cache_dir, self.CACHE_FILE))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+
+yangModelCache = YangModelCache()
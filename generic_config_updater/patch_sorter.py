@@ -1,23 +1,96 @@
+import concurrent.futures
 import copy
+import heapq
+import itertools
 import json
 import jsonpatch
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
 from collections import deque, OrderedDict
 from enum import Enum
 from .gu_common import OperationWrapper, OperationType, GenericConfigUpdaterError, \
-                       JsonChange, PathAddressing, genericUpdaterLogging
+                       JsonChange, PathAddressing, genericUpdaterLogging, genericUpdaterProfiling
+
+
+class ConfigHash:
+    """
+    Structural hash of a config tree, kept as a tree of nodes mirroring the config so it can be
+    updated when a single path of the config changes.
+
+    The hash of a dict is the sum of the hashes of its (key, child) pairs, so changing one child only
+    needs its old and new hash, and equal configs get equal hashes regardless of key order. Lists are
+    hashed in order and are small leaf-lists in practice, so a list is rehashed as a whole.
+
+    Nodes are never modified: updated() copies the nodes along the changed path and shares the rest
+    with the original hash, which stays valid for the original config.
+    """
+    __slots__ = ["value", "children"]
+
+    MASK = (1 << 64) - 1
+
+    def __init__(self, value, children=None):
+        self.value = value
+        # {key: ConfigHash} for dicts holding dicts or lists, None otherwise. Dicts of scalars such as
+        # table rows are small, they are rehashed as a whole instead of keeping a node per field.
+        self.children = children
+
+    @staticmethod
+    def build(config):
+        if isinstance(config, dict):
+            if any(isinstance(child, (dict, list)) for child in config.values()):
+                children = {key: ConfigHash.build(child) for key, child in config.items()}
+                total = sum(hash((key, child.value)) for key, child in children.items())
+                return ConfigHash(total & ConfigHash.MASK, children)
+            total = sum(hash((key, hash(child))) for key, child in config.items())
+            return ConfigHash(total & ConfigHash.MASK)
+        if isinstance(config, list):
+            return ConfigHash(hash(("list",) + tuple(ConfigHash.build(item).value for item in config)))
+        return ConfigHash(hash(config))
+
+    def updated(self, config, tokens):
+        """
+        Returns the hash of <config>, which is the config hashed by self with only the element at
+        <tokens> path added, replaced or removed.
+        """
+        if not tokens or self.children is None or not isinstance(config, dict):
+            return ConfigHash.build(config)
+
+        key = tokens[0]
+        children = dict(self.children)
+        total = self.value
+        old_child = children.pop(key, None)
+        if old_child is not None:
+            total -= hash((key, old_child.value))
+        if key in config:
+            if old_child is None:
+                new_child = ConfigHash.build(config[key])
+            else:
+                new_child = old_child.updated(config[key], tokens[1:])
+            children[key] = new_child
+            total += hash((key, new_child.value))
+
+        return ConfigHash(total & ConfigHash.MASK, children)
 
 class Diff:
     """
     A class that contains the diff info between current and target configs.
     """
-    def __init__(self, current_config, target_config):
+    def __init__(self, current_config, target_config, current_hash=None, target_hash=None):
         self.current_config = current_config
         self.target_config = target_config
+        # ConfigHash of each config, built on first use of __hash__ and updated by apply_move
+        self._current_hash = current_hash
+        self._target_hash = target_hash
 
     def __hash__(self):
-        cc = json.dumps(self.current_config, sort_keys=True)
-        tc = json.dumps(self.target_config, sort_keys=True)
-        return hash((cc,tc))
+        if self._current_hash is None:
+            self._current_hash = ConfigHash.build(self.current_config)
+        if self._target_hash is None:
+            self._target_hash = ConfigHash.build(self.target_config)
+        return hash((self._current_hash.value, self._target_hash.value))
 
     def __eq__(self, other):
         """Overrides the default implementation"""
@@ -26,12 +99,83 @@ class Diff:
 
         return False
 
-    # TODO: Can be optimized to apply the move in place. JsonPatch supports that using the option 'in_place=True'
-    # Check: https://python-json-patch.readthedocs.io/en/latest/tutorial.html#applying-a-patch
-    # NOTE: in case move is applied in place, we will need to support `undo_move` as well.
     def apply_move(self, move):
         new_current_config = move.apply(self.current_config)
-        return Diff(new_current_config, self.target_config)
+        new_current_hash = None
+        if self._current_hash is not None:
+            # Only the path of the move changed, the hash of the rest of the config is reused
+            new_current_hash = self._current_hash.updated(new_current_config, move.get_path_tokens())
+        return Diff(new_current_config, self.target_config, new_current_hash, self._target_hash)
+
+    def apply_move_in_place(self, move):
+        """
+        Applies the move to current_config without copying the whole config, and returns the undo record
+        to pass to undo_move. Moves applied in place must be undone in the reverse order.
+
+        Only the dict/list holding the changed element is copied, the copy is then put in place of the
+        original in its parent. Nothing the original config refers to is modified other than that parent,
+        so the key order is kept after undo and iterating over the config while moves are applied and
+        undone stays safe.
+        """
+        tokens = move.get_path_tokens()
+        undo = (self.current_config, self._current_hash, None, None, None)
+        if not tokens:
+            self.current_config = move.apply(self.current_config)
+        else:
+            grandparent, parent_token, parent = None, None, self.current_config
+            for token in tokens[:-1]:
+                grandparent, parent_token = parent, Diff._to_index(parent, token)
+                parent = parent[parent_token]
+
+            new_parent = Diff._apply_operation(parent, move.op_type, tokens[-1], move.value)
+            if grandparent is None:
+                self.current_config = new_parent
+            else:
+                grandparent[parent_token] = new_parent
+                undo = (self.current_config, self._current_hash, grandparent, parent_token, parent)
+
+        if self._current_hash is not None:
+            self._current_hash = self._current_hash.updated(self.current_config, tokens)
+        return undo
+
+    def undo_move(self, undo):
+        """
+        Reverts a move applied by apply_move_in_place, given its undo record.
+        """
+        current_config, current_hash, grandparent, parent_token, parent = undo
+        if grandparent is not None:
+            grandparent[parent_token] = parent
+        self.current_config = current_config
+        self._current_hash = current_hash
+
+    @staticmethod
+    def _to_index(container, token):
+        if isinstance(container, list):
+            return len(container) if token == "-" else int(token)
+        return token
+
+    @staticmethod
+    def _apply_operation(container, op_type, token, value):
+        """
+        Returns a shallow copy of <container> with the operation applied to its <token> element.
+        """
+        index = Diff._to_index(container, token)
+        if isinstance(container, list):
+            new_container = list(container)
+            if op_type == OperationType.REMOVE:
+                del new_container[index]
+            elif op_type == OperationType.ADD:
+                new_container.insert(index, copy.deepcopy(value))
+            else:
+                new_container[index] = copy.deepcopy(value)
+            return new_container
+
+        new_container = dict(container)
+        if op_type == OperationType.REMOVE:
+            del new_container[index]
+        else:
+            new_container[index] = copy.deepcopy(value)
+        return new_container
 
     def has_no_diff(self):
         return self.current_config == self.target_config
@@ -274,6 +418,12 @@ class JsonMove:
     def apply(self, config):
         return self.patch.apply(config)
 
+    def get_path_tokens(self):
+        """
+        Returns the tokens of the path changed by this move in the config it is applied to.
+        """
+        return PathAddressing().get_path_tokens(self.path)
+
     def __str__(self):
         return str(self.patch)
 
@@ -289,12 +439,116 @@ class JsonMove:
     def __hash__(self):
         return hash((self.op_type, self.path, json.dumps(self.value)))
 
+
+# MoveWrapper of a MoveValidationPool worker process, set when the worker starts
+_worker_move_wrapper = None
+# (state id, Diff) of the last state a MoveValidationPool worker loaded
+_worker_state = None
+
+
+def _init_move_validation_worker(move_validators):
+    global _worker_move_wrapper, _worker_state
+    _worker_move_wrapper = MoveWrapper([], [], [], move_validators)
+    _worker_state = None
+
+
+def _validate_move_in_worker(move, state_id, state_path):
+    global _worker_state
+    if _worker_state is None or _worker_state[0] != state_id:
+        with open(state_path, 'rb') as f:
+            _worker_state = (state_id, Diff(*pickle.load(f)))
+    return _worker_move_wrapper.validate(move, _worker_state[1])
+
+
+class MoveValidationPool:
+    """
+    Validates candidate moves in a pool of worker processes.
+
+    The workers are forked once the YANG models are loaded, so they start with the models and the move
+    validators already in memory. Forking a process running other threads is unsafe, so the pool must not
+    be used from a multi-threaded process such as apply-patch --parallel.
+
+    The configs of a state are pickled once to a file of the pool, and each worker loads them on the first
+    move of that state it validates, so only the moves are sent with each task. Moves are taken from the
+    generator in batches of one move per worker, and the valid ones are returned in generator order, so the
+    sorting result is the same as when the moves are validated one at a time.
+    """
+    def __init__(self, move_validators, processes, config_wrapper=None):
+        self.move_validators = move_validators
+        self.processes = processes
+        self.config_wrapper = config_wrapper
+        self.executor = None
+        self.state_dir = None
+        # (hash of the diff, state id, path) of the state last written for the workers
+        self.state = None
+        self.state_count = 0
+
+    def start(self):
+        if self.executor is not None:
+            return
+        if self.config_wrapper is not None:
+            self.config_wrapper.create_sonic_yang_with_loaded_models()
+        self.state_dir = tempfile.mkdtemp(prefix="gcu-move-validation-")
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.processes,
+                                                               mp_context=multiprocessing.get_context("fork"),
+                                                               initializer=_init_move_validation_worker,
+                                                               initargs=(self.move_validators,))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.state_dir is not None:
+            shutil.rmtree(self.state_dir, ignore_errors=True)
+            self.state_dir = None
+            self.state = None
+
+    def write_state(self, diff):
+        """
+        Writes the configs of <diff> for the workers unless they are the ones last written, and returns
+        the (state id, path) to send with the moves
+        """
+        diff_hash = hash(diff)
+        if self.state is not None and self.state[0] == diff_hash:
+            return self.state[1:]
+
+        self.state_count += 1
+        path = os.path.join(self.state_dir, "state-{}.pickle".format(self.state_count))
+        with open(path, 'wb') as f:
+            pickle.dump((diff.current_config, diff.target_config), f, pickle.HIGHEST_PROTOCOL)
+        # The tasks of the previous state are all done, no worker reads its file anymore
+        if self.state is not None:
+            os.remove(self.state[2])
+        self.state = (diff_hash, self.state_count, path)
+        return self.state[1:]
+
+    def get_valid_moves(self, moves, diff):
+        self.start()
+        moves = iter(moves)
+        while True:
+            batch = list(itertools.islice(moves, self.processes))
+            if not batch:
+                return
+            genericUpdaterProfiling.count("move_validations", len(batch))
+            with genericUpdaterProfiling.phase("move_validation"):
+                # The diff is only read here, the caller may update it once a move is returned
+                state_id, state_path = self.write_state(diff)
+                futures = [self.executor.submit(_validate_move_in_worker, move, state_id, state_path)
+                           for move in batch]
+                results = [future.result() for future in futures]
+            for move, is_valid in zip(batch, results):
+                if is_valid:
+                    yield move
+
+
 class MoveWrapper:
-    def __init__(self, move_generators, move_non_extendable_generators, move_extenders, move_validators):
+    def __init__(self, move_generators, move_non_extendable_generators, move_extenders, move_validators,
+                 validation_pool=None):
         self.move_generators = move_generators
         self.move_non_extendable_generators = move_non_extendable_generators
         self.move_extenders = move_extenders
         self.move_validators = move_validators
+        self.validation_pool = validation_pool
 
     def generate(self, diff):
         """
@@ -338,14 +592,33 @@ class MoveWrapper:
                 moves.extend(self._extend_moves(move, diff))
 
     def validate(self, move, diff):
-        for validator in self.move_validators:
-            if not validator.validate(move, diff):
-                return False
-        return True
+        genericUpdaterProfiling.count("move_validations")
+        with genericUpdaterProfiling.phase("move_validation"):
+            for validator in self.move_validators:
+                if not validator.validate(move, diff):
+                    return False
+            return True
+
+    def get_valid_moves(self, moves, diff):
+        """
+        Returns the valid moves out of the given moves, in the same order. Moves are validated lazily, so
+        the caller can stop at the first valid move without validating the remaining ones, unless a
+        validation pool is used which validates them in batches.
+        """
+        if self.validation_pool is not None:
+            return self.validation_pool.get_valid_moves(moves, diff)
+        return (move for move in moves if self.validate(move, diff))
+
+    def close(self):
+        if self.validation_pool is not None:
+            self.validation_pool.close()
 
     def simulate(self, move, diff):
         return diff.apply_move(move)
 
+    def simulate_in_place(self, move, diff):
+        return diff.apply_move_in_place(move)
+
     def _generate_moves(self, diff):
         for generator in self.move_generators:
             for move in generator.generate(diff):
@@ -1538,8 +1811,14 @@ class DfsSorter:
     def __init__(self, move_wrapper):
         self.visited = {}
         self.move_wrapper = move_wrapper
+        # Number of states the moves were generated from, reported to compare the sort algorithms
+        self.explored_states = 0
 
     def sort(self, diff):
+        # Moves are explored in place on a private copy of the current config, and undone on backtracking
+        return self._sort(Diff(copy.deepcopy(diff.current_config), diff.target_config))
+
+    def _sort(self, diff):
         if diff.has_no_diff():
             return []
 
@@ -1548,14 +1827,17 @@ class DfsSorter:
             return None
         self.visited[diff_hash] = True
 
+        self.explored_states += 1
         moves = self.move_wrapper.generate(diff)
 
-        for move in moves:
-            if self.move_wrapper.validate(move, diff):
-                new_diff = self.move_wrapper.simulate(move, diff)
-                new_moves = self.sort(new_diff)
-                if new_moves is not None:
-                    return [move] + new_moves
+        for move in self.move_wrapper.get_valid_moves(moves, diff):
+            undo = self.move_wrapper.simulate_in_place(move, diff)
+            try:
+                new_moves = self._sort(diff)
+            finally:
+                diff.undo_move(undo)
+            if new_moves is not None:
+                return [move] + new_moves
 
         return None
 
@@ -1563,6 +1845,7 @@ class BfsSorter:
     def __init__(self, move_wrapper):
         self.visited = {}
         self.move_wrapper = move_wrapper
+        self.explored_states = 0
 
     def sort(self, diff):
         diff_queue = deque([])
@@ -1583,14 +1866,14 @@ class BfsSorter:
             if diff.has_no_diff():
                 return prv_moves
 
+            self.explored_states += 1
             moves = self.move_wrapper.generate(diff)
-            for move in moves:
-                if self.move_wrapper.validate(move, diff):
-                    new_diff = self.move_wrapper.simulate(move, diff)
-                    new_prv_moves = prv_moves + [move]
+            for move in self.move_wrapper.get_valid_moves(moves, diff):
+                new_diff = self.move_wrapper.simulate(move, diff)
+                new_prv_moves = prv_moves + [move]
 
-                    diff_queue.append(new_diff)
-                    prv_moves_queue.append(new_prv_moves)
+                diff_queue.append(new_diff)
+                prv_moves_queue.append(new_prv_moves)
 
         return None
 
@@ -1599,8 +1882,13 @@ class MemoizationSorter:
         self.visited = {}
         self.move_wrapper = move_wrapper
         self.mem = {}
+        self.explored_states = 0
 
     def sort(self, diff):
+        # Moves are explored in place on a private copy of the current config, and undone on backtracking
+        return self._sort(Diff(copy.deepcopy(diff.current_config), diff.target_config))
+
+    def _sort(self, diff):
         if diff.has_no_diff():
             return []
 
@@ -1611,29 +1899,157 @@ class MemoizationSorter:
             return None
         self.visited[diff_hash] = True
 
+        self.explored_states += 1
         moves = self.move_wrapper.generate(diff)
 
         bst_moves = None
-        for move in moves:
-            if self.move_wrapper.validate(move, diff):
-                new_diff = self.move_wrapper.simulate(move, diff)
-                new_moves = self.sort(new_diff)
-                if new_moves != None and (bst_moves is None or len(bst_moves) > len(new_moves)+1):
-                    bst_moves = [move] + new_moves
+        for move in self.move_wrapper.get_valid_moves(moves, diff):
+            undo = self.move_wrapper.simulate_in_place(move, diff)
+            try:
+                new_moves = self._sort(diff)
+            finally:
+                diff.undo_move(undo)
+            if new_moves is not None and (bst_moves is None or len(bst_moves) > len(new_moves)+1):
+                bst_moves = [move] + new_moves
 
         self.mem[diff_hash] = bst_moves
         return bst_moves
 
+
+class AStarSorter:
+    """
+    Best-first search ordering the states by the number of moves taken so far plus the estimated number of
+    moves left, i.e. the number of leaves still different from the target config. Ties are broken by the
+    number of tables still to be updated, as the dependencies forcing an order on the moves are between
+    tables, then by the order the moves were generated in.
+
+    The estimate is not a lower bound since one move can update many leaves, so the sort is fast but the
+    moves found are not guaranteed to be the fewest. If the search explores more than max_explored_states
+    states without finding the target config, the diff is sorted by DfsSorter instead.
+    """
+    DEFAULT_MAX_EXPLORED_STATES = 1000
+
+    def __init__(self, move_wrapper, max_explored_states=DEFAULT_MAX_EXPLORED_STATES):
+        self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter - A*", print_all_to_console=True)
+        self.visited = {}
+        self.move_wrapper = move_wrapper
+        self.max_explored_states = max_explored_states
+        self.explored_states = 0
+
+    def sort(self, diff):
+        original_diff = diff
+        table_diffs = self._get_table_diffs(diff)
+        seq = itertools.count()
+        # Entries are (estimated total moves, tables left, sequence, moves so far, diff hash, parent diff,
+        # {table: leaves left}), the sequence is unique so the entries never compare the items after it.
+        # An entry does not hold its own config copy: its diff is rebuilt from the parent diff and the last
+        # move when it is popped, so the memory held is one config per explored state rather than one per
+        # pushed state.
+        heap = [(sum(table_diffs.values()), len(table_diffs), next(seq), [], hash(diff), None, table_diffs)]
+
+        while heap:
+            _, _, _, prv_moves, diff_hash, parent_diff, table_diffs = heapq.heappop(heap)
+
+            if diff_hash in self.visited:
+                continue
+            self.visited[diff_hash] = True
+
+            diff = original_diff if parent_diff is None else self.move_wrapper.simulate(prv_moves[-1], parent_diff)
+            if not table_diffs and diff.has_no_diff():
+                return prv_moves
+
+            if self.explored_states >= self.max_explored_states:
+                return self._fallback_sort(original_diff)
+
+            self.explored_states += 1
+            moves = self.move_wrapper.generate(diff)
+            for move in self.move_wrapper.get_valid_moves(moves, diff):
+                new_diff = self.move_wrapper.simulate(move, diff)
+                new_diff_hash = hash(new_diff)
+                if new_diff_hash in self.visited:
+                    continue
+                new_table_diffs = self._update_table_diffs(table_diffs, new_diff, move)
+                new_prv_moves = prv_moves + [move]
+                heapq.heappush(heap, (len(new_prv_moves) + sum(new_table_diffs.values()), len(new_table_diffs),
+                                      next(seq), new_prv_moves, new_diff_hash, diff, new_table_diffs))
+
+        return None
+
+    def _fallback_sort(self, diff):
+        self.logger.log_info(f"No sorting found after exploring {self.explored_states} states, "
+                             f"falling back to DFS.")
+        dfs_sorter = DfsSorter(self.move_wrapper)
+        try:
+            return dfs_sorter.sort(diff)
+        finally:
+            self.explored_states += dfs_sorter.explored_states
+
+    def _get_table_diffs(self, diff):
+        """
+        Returns {table: number of leaves different from the target config} for the tables not matching it.
+        """
+        current_config, target_config = diff.current_config, diff.target_config
+        if not isinstance(current_config, dict) or not isinstance(target_config, dict):
+            return {"": 1} if current_config != target_config else {}
+
+        table_diffs = {}
+        for table in current_config.keys() | target_config.keys():
+            count = self._count_diff_leaves(current_config.get(table), target_config.get(table))
+            if count:
+                table_diffs[table] = count
+        return table_diffs
+
+    def _update_table_diffs(self, table_diffs, diff, move):
+        """
+        Returns the table diffs of <diff>, given <table_diffs> of the diff <move> was applied to. Only the
+        table of the move is counted again.
+        """
+        tokens = move.get_path_tokens()
+        if not tokens or "" in table_diffs:
+            return self._get_table_diffs(diff)
+
+        table = tokens[0]
+        new_table_diffs = dict(table_diffs)
+        count = self._count_diff_leaves(diff.current_config.get(table), diff.target_config.get(table))
+        if count:
+            new_table_diffs[table] = count
+        else:
+            new_table_diffs.pop(table, None)
+        return new_table_diffs
+
+    @staticmethod
+    def _count_diff_leaves(current, target):
+        if current is None:
+            return AStarSorter._count_leaves(target)
+        if target is None:
+            return AStarSorter._count_leaves(current)
+        if isinstance(current, dict) and isinstance(target, dict):
+            return sum(AStarSorter._count_diff_leaves(current.get(key), target.get(key))
+                       for key in current.keys() | target.keys())
+        return 0 if current == target else 1
+
+    @staticmethod
+    def _count_leaves(config):
+        if config is None:
+            return 0
+        if isinstance(config, dict):
+            # An empty dict still takes a move to add or remove
+            return max(1, sum(AStarSorter._count_leaves(value) for value in config.values()))
+        return 1
+
 class Algorithm(Enum):
     DFS = 1
     BFS = 2
     MEMOIZATION = 3
+    ASTAR = 4
 
 class SortAlgorithmFactory:
-    def __init__(self, operation_wrapper, config_wrapper, path_addressing):
+    def __init__(self, operation_wrapper, config_wrapper, path_addressing, validation_processes=0):
         self.operation_wrapper = operation_wrapper
         self.config_wrapper = config_wrapper
         self.path_addressing = path_addressing
+        # Number of worker processes validating the candidate moves, 0 to validate them in this process
+        self.validation_processes = validation_processes
 
     def create(self, algorithm=Algorithm.DFS):
         move_generators = [RemoveCreateOnlyDependencyMoveGenerator(self.path_addressing),
@@ -1652,7 +2068,12 @@ class SortAlgorithmFactory:
                            RemoveCreateOnlyDependencyMoveValidator(self.path_addressing),
                            NoEmptyTableMoveValidator(self.path_addressing)]
 
-        move_wrapper = MoveWrapper(move_generators, move_non_extendable_generators, move_extenders, move_validators)
+        validation_pool = None
+        if self.validation_processes:
+            validation_pool = MoveValidationPool(move_validators, self.validation_processes, self.config_wrapper)
+
+        move_wrapper = MoveWrapper(move_generators, move_non_extendable_generators, move_extenders, move_validators,
+                                   validation_pool)
 
         if algorithm == Algorithm.DFS:
             sorter = DfsSorter(move_wrapper)
@@ -1660,19 +2081,24 @@ class SortAlgorithmFactory:
             sorter = BfsSorter(move_wrapper)
         elif algorithm == Algorithm.MEMOIZATION:
             sorter = MemoizationSorter(move_wrapper)
+        elif algorithm == Algorithm.ASTAR:
+            sorter = AStarSorter(move_wrapper)
         else:
             raise ValueError(f"Algorithm {algorithm} is not supported")
 
         return sorter
 
 class StrictPatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, inner_patch_sorter=None):
+    def __init__(self, config_wrapper, patch_wrapper, inner_patch_sorter=None, algorithm=Algorithm.DFS):
         self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter - Strict", print_all_to_console=True)
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
         self.inner_patch_sorter = inner_patch_sorter if inner_patch_sorter else PatchSorter(config_wrapper, patch_wrapper)
+        # Algorithm used when sort is not given one
+        self.algorithm = algorithm
 
-    def sort(self, patch, algorithm=Algorithm.DFS):
+    def sort(self, patch, algorithm=None):
+        algorithm = algorithm if algorithm else self.algorithm
         current_config = self.config_wrapper.get_config_db_as_json()
 
         # Validate patch is only updating tables with yang models
@@ -1854,15 +2280,19 @@ class ChangeWrapper:
         return adjusted_changes
 
 class NonStrictPatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, config_splitter, change_wrapper=None, patch_sorter=None):
+    def __init__(self, config_wrapper, patch_wrapper, config_splitter, change_wrapper=None, patch_sorter=None,
+                 algorithm=Algorithm.DFS):
         self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter - Non-Strict", print_all_to_console=True)
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
         self.config_splitter = config_splitter
         self.change_wrapper = change_wrapper if change_wrapper else ChangeWrapper(patch_wrapper, config_splitter)
         self.inner_patch_sorter = patch_sorter if patch_sorter else PatchSorter(config_wrapper, patch_wrapper)
+        # Algorithm used when sort is not given one
+        self.algorithm = algorithm
 
-    def sort(self, patch, algorithm=Algorithm.DFS):
+    def sort(self, patch, algorithm=None):
+        algorithm = algorithm if algorithm else self.algorithm
         current_config = self.config_wrapper.get_config_db_as_json()
         target_config = self.patch_wrapper.simulate_patch(patch, current_config)
 
@@ -1915,13 +2345,13 @@ class NonStrictPatchSorter:
         return changes
 
 class PatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None):
+    def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None, validation_processes=0):
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
         self.operation_wrapper = OperationWrapper()
         self.path_addressing = PathAddressing(self.config_wrapper)
         self.sort_algorithm_factory = sort_algorithm_factory if sort_algorithm_factory else \
-            SortAlgorithmFactory(self.operation_wrapper, config_wrapper, self.path_addressing)
+            SortAlgorithmFactory(self.operation_wrapper, config_wrapper, self.path_addressing, validation_processes)
 
     def sort(self, patch, algorithm=Algorithm.DFS, preloaded_current_config=None):
         current_config = preloaded_current_config if preloaded_current_config else self.config_wrapper.get_config_db_as_json()
@@ -1930,7 +2360,12 @@ class PatchSorter:
         diff = Diff(current_config, target_config)
 
         sort_algorithm = self.sort_algorithm_factory.create(algorithm)
-        moves = sort_algorithm.sort(diff)
+        try:
+            with genericUpdaterProfiling.phase("sort_search"):
+                moves = sort_algorithm.sort(diff)
+            genericUpdaterProfiling.count("sort_explored_states", sort_algorithm.explored_states)
+        finally:
+            sort_algorithm.move_wrapper.close()
 
         if moves is None:
             raise GenericConfigUpdaterError("There is no possible sorting")
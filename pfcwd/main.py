@@ -9,6 +9,7 @@ from sonic_py_common.multi_asic import get_external_ports
 from tabulate import tabulate
 from utilities_common import multi_asic as multi_asic_util
 from utilities_common import constants
+from utilities_common.bulk_db import BulkDbReader
 from utilities_common.general import load_db_config
 from sonic_py_common import logger
 
@@ -123,7 +124,7 @@ class PfcwdCli(object):
         self.db = None
         self.config_db = None
         self.multi_asic = multi_asic_util.MultiAsic(
-            display, namespace, db
+            display, namespace, db, config_db_pipe=True
         )
         self.table = []
         self.all_ports = []
@@ -139,17 +140,20 @@ class PfcwdCli(object):
                 self.multi_asic.display_option
             )
 
+        # Resolve the queues and read all their counters in one pipelined pass
+        queue_oids = self.db.get_all(
+            self.db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP'
+        ) or {}
+        queues = [queue for queue in queues if queue in queue_oids]
+        all_stats = BulkDbReader(self.db).get_all(
+            self.db.COUNTERS_DB,
+            ['COUNTERS:' + queue_oids[queue] for queue in queues]
+        )
+
         for queue in queues:
             stats_list = []
-            queue_oid = self.db.get(
-                self.db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP', queue
-            )
-            if queue_oid is None:
-                continue
-            stats = self.db.get_all(
-                self.db.COUNTERS_DB, 'COUNTERS:' + queue_oid
-            )
-            if stats is None:
+            stats = all_stats.get('COUNTERS:' + queue_oids[queue])
+            if not stats:
                 continue
             for stat in STATS_DESCRIPTION:
                 line = stats.get(stat[1], '0') + '/' + stats.get(stat[2], '0')
@@ -257,19 +261,43 @@ class PfcwdCli(object):
             sys.exit(1)
         self.start_cmd(action, restoration_time, ports, detection_time)
 
+    def get_pfc_enabled_ports(self, ports):
+        """
+        Return the ports of <ports> with PFC enabled, warn about the others
+        """
+        port_qos_map = self.config_db.get_table(PORT_QOS_MAP)
+        enabled_ports = []
+        for port in ports:
+            if port_qos_map.get(port, {}).get('pfc_enable') is None:
+                log.log_warning("SKIPPED: PFC is not enabled on port: {}".format(port), also_print_to_console=True)
+                continue
+            if port not in enabled_ports:
+                enabled_ports.append(port)
+        return enabled_ports
 
-    def verify_pfc_enable_status_per_port(self, port, pfcwd_info):
-        pfc_status = self.config_db.get_entry(PORT_QOS_MAP, port).get('pfc_enable')
-        if pfc_status is None:
-            log.log_warning("SKIPPED: PFC is not enabled on port: {}".format(port), also_print_to_console=True)
-            return
-
-        self.config_db.mod_entry(
-            CONFIG_DB_PFC_WD_TABLE_NAME, port, None
-        )
-        self.config_db.mod_entry(
-            CONFIG_DB_PFC_WD_TABLE_NAME, port, pfcwd_info
-        )
+    def start_ports(self, ports, pfcwd_info, global_info=None):
+        """
+        Replace the PFC_WD entries of the PFC enabled ports of <ports> with
+        <pfcwd_info>, and update the GLOBAL entry with <global_info>, in one
+        pipelined CONFIG_DB batch
+        """
+        ports = self.get_pfc_enabled_ports(ports)
+
+        # Delete the existing entries first, in their own batch, so that
+        # orchagent tears their watchdog down and starts it again with the
+        # new values rather than seeing an update of the entry
+        pfcwd_table = self.config_db.get_table(CONFIG_DB_PFC_WD_TABLE_NAME)
+        existing_ports = [port for port in ports if port in pfcwd_table]
+        if existing_ports:
+            self.config_db.mod_config({
+                CONFIG_DB_PFC_WD_TABLE_NAME: {port: None for port in existing_ports}
+            })
+
+        entries = {port: pfcwd_info for port in ports}
+        if global_info:
+            entries['GLOBAL'] = global_info
+        if entries:
+            self.config_db.mod_config({CONFIG_DB_PFC_WD_TABLE_NAME: entries})
 
     @multi_asic_util.run_on_multi_asic
     def start_cmd(self, action, restoration_time, ports, detection_time):
@@ -298,14 +326,13 @@ class PfcwdCli(object):
                 "detection time: {} ms".format(2 * detection_time)
             )
 
+        start_ports = []
         for port in ports:
             if port == "all":
-                for p in all_ports:
-                    self.verify_pfc_enable_status_per_port(p, pfcwd_info)
-            else:
-                if port not in all_ports:
-                    continue
-                self.verify_pfc_enable_status_per_port(port, pfcwd_info)
+                start_ports.extend(all_ports)
+            elif port in all_ports:
+                start_ports.append(port)
+        self.start_ports(start_ports, pfcwd_info)
 
     @multi_asic_util.run_on_multi_asic
     def interval(self, poll_interval):
@@ -362,10 +389,11 @@ class PfcwdCli(object):
         if len(ports) == 0:
             ports = all_ports
 
-        for port in ports:
-            if port not in all_ports:
-                continue
-            self.config_db.mod_entry(CONFIG_DB_PFC_WD_TABLE_NAME, port, None)
+        stop_ports = {port: None for port in ports if port in all_ports}
+        if stop_ports:
+            self.config_db.mod_config(
+                {CONFIG_DB_PFC_WD_TABLE_NAME: stop_ports}
+            )
 
     @multi_asic_util.run_on_multi_asic
     def start_default(self):
@@ -394,14 +422,8 @@ class PfcwdCli(object):
             'action': DEFAULT_ACTION
         }
 
-        for port in active_ports:
-            self.verify_pfc_enable_status_per_port(port, pfcwd_info)
-
-        pfcwd_info = {}
-        pfcwd_info['POLL_INTERVAL'] = DEFAULT_POLL_INTERVAL * multiply
-        self.config_db.mod_entry(
-            CONFIG_DB_PFC_WD_TABLE_NAME, "GLOBAL", pfcwd_info
-        )
+        global_info = {'POLL_INTERVAL': DEFAULT_POLL_INTERVAL * multiply}
+        self.start_ports(active_ports, pfcwd_info, global_info)
 
     @multi_asic_util.run_on_multi_asic
     def counter_poll(self, counter_poll):
@@ -27,6 +27,8 @@ try:
 except ImportError:
     from sonic_py_common import port_util
 
+from utilities_common.fdb import FdbReader, strip_oid
+
 
 DB_READ_SCRIPT = """
 -- this script is to read required tables from db:
@@ -327,7 +329,7 @@ def read_tables_from_db(appl_db):
     neighbors = tables["neighbors"]
     mux_states = tables["mux_states"]
     hw_mux_states = tables["hw_mux_states"]
-    asic_fdb = {k: v.lstrip("oid:0x") for k, v in tables["asic_fdb"].items()}
+    asic_fdb = {k: strip_oid(v) for k, v in tables["asic_fdb"].items()}
     asic_route_table = tables["asic_route_table"]
     asic_neigh_table = tables["asic_neigh_table"]
     WRITE_LOG_DEBUG("neighbors: %s", json.dumps(neighbors, indent=4))
@@ -339,14 +341,12 @@ def read_tables_from_db(appl_db):
     return neighbors, mux_states, hw_mux_states, asic_fdb, asic_route_table, asic_neigh_table
 
 
-def get_if_br_oid_to_port_name_map():
+def get_if_br_oid_to_port_name_map(db, if_br_oid_map):
     """Return port bridge oid to port name map."""
-    db = swsscommon.SonicV2Connector(host="127.0.0.1")
     try:
         port_name_map = port_util.get_interface_oid_map(db)[1]
     except IndexError:
         port_name_map = {}
-    if_br_oid_map = port_util.get_bridge_port_map(db)
     if_br_oid_to_port_name_map = {}
     for if_br_oid, if_oid in if_br_oid_map.items():
         if if_oid in port_name_map:
@@ -498,8 +498,13 @@ if __name__ == "__main__":
         sys.exit(0)
 
     mux_server_to_port_map = get_mux_server_to_port_map(mux_cables)
-    if_oid_to_port_name_map = get_if_br_oid_to_port_name_map()
+    # NOTE: the neighbors, mux states and ASIC tables must come from one
+    # snapshot, so they are read by the atomic db read script; the bridge
+    # ports they point to are resolved after it
     neighbors, mux_states, hw_mux_states, asic_fdb, asic_route_table, asic_neigh_table = read_tables_from_db(appl_db)
+    db = swsscommon.SonicV2Connector(host="127.0.0.1")
+    db.connect(db.ASIC_DB)
+    if_oid_to_port_name_map = get_if_br_oid_to_port_name_map(db, FdbReader(db).read_bridge_ports())
     mac_to_port_name_map = get_mac_to_port_name_map(asic_fdb, if_oid_to_port_name_map)
 
     check_results = check_neighbor_consistency(
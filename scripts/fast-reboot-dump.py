@@ -14,6 +14,8 @@ import traceback
 import ipaddress
 from builtins import str #for unicode conversion in python2
 
+from utilities_common.fdb import FdbReader, strip_oid
+
 
 ARP_CHUNK = binascii.unhexlify('08060001080006040001') # defines a part of the packet for ARP Request
 ARP_PAD = binascii.unhexlify('00' * 18)
@@ -61,22 +63,6 @@ def get_vlan_ifaces():
 
     return vlans
 
-def get_bridge_port_id_2_port_id(db):
-    bridge_port_id_2_port_id = {}
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
-        port_type = value['SAI_BRIDGE_PORT_ATTR_TYPE']
-        if port_type != 'SAI_BRIDGE_PORT_TYPE_PORT':
-            continue
-        port_id = value['SAI_BRIDGE_PORT_ATTR_PORT_ID']
-        # ignore admin status
-        bridge_id = key.replace('ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:', '')
-        bridge_port_id_2_port_id[bridge_id] = port_id
-
-    return bridge_port_id_2_port_id
-
 def get_lag_by_member(member_name, app_db):
     keys = app_db.keys(app_db.APPL_DB, 'LAG_MEMBER_TABLE:*')
     keys = [] if keys is None else keys
@@ -126,55 +112,29 @@ def get_map_port_id_2_iface_name(asic_db, app_db):
 
     return port_id_2_iface
 
-def get_map_bridge_port_id_2_iface_name(asic_db, app_db):
-    bridge_port_id_2_port_id = get_bridge_port_id_2_port_id(asic_db)
-    port_id_2_iface = get_map_port_id_2_iface_name(asic_db, app_db)
-
-    bridge_port_id_2_iface_name = {}
-
-    for bridge_port_id, port_id in bridge_port_id_2_port_id.items():
-        if port_id in port_id_2_iface:
-            bridge_port_id_2_iface_name[bridge_port_id] = port_id_2_iface[port_id]
-        else:
-            print("Not found")
 
-    return bridge_port_id_2_iface_name
-
-def get_vlan_oid_by_vlan_id(db, vlan_id):
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:oid:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        value = db.get_all(db.ASIC_DB, key)
-        if 'SAI_VLAN_ATTR_VLAN_ID' in value and int(value['SAI_VLAN_ATTR_VLAN_ID']) == vlan_id:
-            return key.replace('ASIC_STATE:SAI_OBJECT_TYPE_VLAN:', '')
-
-    raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
-
-def get_fdb(db, vlan_name, vlan_id, bridge_id_2_iface):
+def get_fdb(fdb_index, vlan_name, vlan_id):
     fdb_types = {
       'SAI_FDB_ENTRY_TYPE_DYNAMIC': 'dynamic',
       'SAI_FDB_ENTRY_TYPE_STATIC' : 'static'
     }
 
-    bvid = get_vlan_oid_by_vlan_id(db, vlan_id)
+    if fdb_index.get_bvid(vlan_id) is None:
+        raise Exception('Not found bvi oid for vlan_id: %d' % vlan_id)
+
     available_macs = set()
     map_mac_ip = {}
     fdb_entries = []
-    keys = db.keys(db.ASIC_DB, 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:{*\"bvid\":\"%s\"*}' % bvid)
-    keys = [] if keys is None else keys
-    for key in keys:
-        key_obj = json.loads(key.replace('ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:', ''))
-        mac = str(key_obj['mac'])
+    for entry in fdb_index.get_by_vlan(vlan_id):
+        mac = str(entry.mac)
         if not is_mac_unicast(mac):
             continue
         available_macs.add((vlan_name, mac.lower()))
         fdb_mac = mac.replace(':', '-')
-        # get attributes
-        value = db.get_all(db.ASIC_DB, key)
-        fdb_type = fdb_types[value['SAI_FDB_ENTRY_ATTR_TYPE']]
-        if value['SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID'] not in bridge_id_2_iface:
+        fdb_type = fdb_types[entry.type]
+        if entry.port is None:
             continue
-        fdb_port = bridge_id_2_iface[value['SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID']]
+        fdb_port = entry.port
 
         obj = {
           'FDB_TABLE:Vlan%d:%s' % (vlan_id, fdb_mac) : {
@@ -212,11 +172,15 @@ def generate_fdb_entries_logic(asic_db, app_db, vlan_ifaces):
     all_available_macs = set()
     map_mac_ip_per_vlan = {}
 
-    bridge_id_2_iface = get_map_bridge_port_id_2_iface_name(asic_db, app_db)
+    # Read the whole FDB once, rather than once per VLAN
+    port_id_2_iface = get_map_port_id_2_iface_name(asic_db, app_db)
+    fdb_index = FdbReader(asic_db).read(
+        {strip_oid(port_id): iface for port_id, iface in port_id_2_iface.items()},
+        bridge_port_types=['SAI_BRIDGE_PORT_TYPE_PORT'])
 
     for vlan in vlan_ifaces:
         vlan_id = int(vlan.replace('Vlan', ''))
-        fdb_entry, available_macs, map_mac_ip_per_vlan[vlan] = get_fdb(asic_db, vlan, vlan_id, bridge_id_2_iface)
+        fdb_entry, available_macs, map_mac_ip_per_vlan[vlan] = get_fdb(fdb_index, vlan, vlan_id)
         all_available_macs |= available_macs
         fdb_entries.extend(fdb_entry)
 
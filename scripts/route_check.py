@@ -19,6 +19,10 @@ How:
     5) Rule out local interfaces & default routes
     6) If still outstanding diffs, report failure.
 
+    In daemon mode (-d), the DBs are read once and then kept current from
+    the subscribe updates; only diffs lasting longer than --settle-time
+    are reported.
+
 To verify:
     Run this tool in SONiC switch and watch the result. In case of failure
     checkout the result to validate the failure.
@@ -40,6 +44,7 @@ import ipaddress
 import json
 import os
 import re
+import socket
 import sys
 import syslog
 import time
@@ -47,6 +52,7 @@ import signal
 import traceback
 import subprocess
 import concurrent.futures
+from collections import Counter
 
 from ipaddress import ip_network
 from swsscommon import swsscommon
@@ -81,6 +87,20 @@ FRR_WAIT_TIME = 15
 
 REDIS_TIMEOUT_MSECS = 0
 
+# Packed prefixes (see pack_prefix) carry the prefix length in the low 8
+# bits, the address above it and this bit to tell IPv6 from IPv4
+PACKED_PREFIX_LEN_BITS = 8
+PACKED_IPV6 = 1 << (128 + PACKED_PREFIX_LEN_BITS)
+
+# Characters read at a time from the "show ip route json" output
+FRR_READ_CHUNK = 64 * 1024
+
+# Daemon mode: report mismatches which last longer than this
+DEFAULT_SETTLE_SECS = 30
+# Daemon mode: how often the settled mismatches are looked at
+DAEMON_CHECK_INTERVAL = 1
+DAEMON_SELECT_TIMEOUT_MSECS = 1000
+
 class Level(Enum):
     ERR = 'ERR'
     INFO = 'INFO'
@@ -185,52 +205,81 @@ def is_default_route(ip):
     return t.is_unspecified and ip.split("/")[1] == "0"
 
 
-def cmps(s1, s2):
-    """
-    helper to compare two strings
-    :param s1: left string
-    :param s2: right string
-    :return comparison result as -1/0/1
-    """
-    if (s1 == s2):
-        return 0
-    if (s1 < s2):
-        return -1
-    return 1
-
-
-def diff_sorted_lists(t1, t2):
-    """
-    helper to compare two sorted lists.
-    :param t1: list 1
-    :param t2: list 2
-    :return (<t1 entries that are not in t2>, <t2 entries that are not in t1>)
-    """
-    t1_x = t2_x = 0
-    t1_miss = []
-    t2_miss = []
-    t1_len = len(t1);
-    t2_len = len(t2);
-    while t1_x < t1_len and t2_x < t2_len:
-        d = cmps(t1[t1_x], t2[t2_x])
-        if (d == 0):
-            t1_x += 1
-            t2_x += 1
-        elif (d < 0):
-            t1_miss.append(t1[t1_x])
-            t1_x += 1
-        else:
-            t2_miss.append(t2[t2_x])
-            t2_x += 1
+def pack_prefix(prefix):
+    """
+    helper to pack an IP prefix into one int: the address shifted left by
+    8 bits, the prefix length in the low 8 bits and PACKED_IPV6 set for
+    IPv6. It is a fraction of the size of the string and equal prefixes
+    pack to the same int, however the address is written.
+    :param prefix: IP with or without prefix length as string
+    :return packed prefix as int; the length defaults to /32 or /128
+    """
+    ip, _, length = prefix.partition(PREFIX_SEPARATOR)
+    if ip.find(IPV6_SEPARATOR) == -1:
+        addr = int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
+        return (addr << PACKED_PREFIX_LEN_BITS) | int(length or 32)
+    addr = int.from_bytes(socket.inet_pton(socket.AF_INET6, ip), 'big')
+    return PACKED_IPV6 | (addr << PACKED_PREFIX_LEN_BITS) | int(length or 128)
 
-    while t1_x < t1_len:
-        t1_miss.append(t1[t1_x])
-        t1_x += 1
 
-    while t2_x < t2_len:
-        t2_miss.append(t2[t2_x])
-        t2_x += 1
-    return t1_miss, t2_miss
+def unpack_prefix(packed):
+    """
+    helper to turn a packed prefix back into a string
+    :param packed: prefix packed by pack_prefix
+    :return prefix as string, in the same form as str(ip_network())
+    """
+    length = packed & ((1 << PACKED_PREFIX_LEN_BITS) - 1)
+    if packed & PACKED_IPV6:
+        addr = ipaddress.IPv6Address((packed ^ PACKED_IPV6) >> PACKED_PREFIX_LEN_BITS)
+    else:
+        addr = ipaddress.IPv4Address(packed >> PACKED_PREFIX_LEN_BITS)
+    return "{}{}{}".format(addr, PREFIX_SEPARATOR, length)
+
+
+class PrefixSet(object):
+    """
+    Set of IP prefixes, held packed (see pack_prefix) so that a full
+    routing table stays small and diffs are plain set operations.
+    Prefixes are added, looked up and returned as strings.
+    """
+
+    def __init__(self, prefixes=()):
+        self.packed = set(pack_prefix(prefix) for prefix in prefixes)
+
+    def add(self, prefix):
+        self.packed.add(pack_prefix(prefix))
+
+    def __contains__(self, prefix):
+        try:
+            return pack_prefix(prefix) in self.packed
+        except (OSError, ValueError):
+            return False
+
+    def __len__(self):
+        return len(self.packed)
+
+    def __iter__(self):
+        return (unpack_prefix(packed) for packed in self.packed)
+
+    def sorted(self):
+        return sorted(self)
+
+    def difference(self, other):
+        """
+        :param other: PrefixSet to compare against
+        :return sorted list of the prefixes in this set but not in <other>
+        """
+        return sorted(unpack_prefix(packed) for packed in self.packed - other.packed)
+
+
+def filter_out_prefixes(routes, prefixes):
+    """
+    helper to drop the routes present in a PrefixSet
+    :param routes: list of routes as strings
+    :param prefixes: PrefixSet of routes to drop
+    :return filtered list
+    """
+    return [rt for rt in routes if rt not in prefixes]
 
 
 def checkout_rt_entry(k):
@@ -277,6 +326,10 @@ def get_subscribe_updates(selector, subs):
     return (sorted(adds), sorted(deletes))
 
 
+def is_debug_enabled():
+    return report_level >= syslog.LOG_DEBUG
+
+
 def is_vrf(k):
     return k.startswith("Vrf")
 
@@ -284,49 +337,51 @@ def is_vrf(k):
 def get_appdb_routes(namespace):
     """
     helper to read route table from APPL-DB.
-    :return list of sorted routes with prefix ensured
+    :return PrefixSet of routes
     """
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     print_message(syslog.LOG_DEBUG, "APPL DB connected for routes")
     tbl = swsscommon.Table(db, 'ROUTE_TABLE')
     keys = tbl.getKeys()
 
-    valid_rt = []
+    valid_rt = PrefixSet()
     for k in keys:
         if (is_vrf(k)):
             k = k.split(":", 1)[1]
 
         if not is_local(k):
-            valid_rt.append(add_prefix_ifnot(k.lower()))
+            valid_rt.add(k)
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": sorted(valid_rt)}, indent=4))
-    return sorted(valid_rt)
+    if is_debug_enabled():
+        print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": valid_rt.sorted()}, indent=4))
+    return valid_rt
 
 
 def get_asicdb_routes(namespace):
     """
     helper to read present route entries from ASIC-DB and
     as well initiate selector for ASIC-DB:ASIC-state updates.
-    :return (selector,  subscriber, <list of sorted routes>)
+    :return (selector,  subscriber, <PrefixSet of routes>)
     """
     db = swsscommon.DBConnector(ASIC_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     subs = swsscommon.SubscriberStateTable(db, ASIC_TABLE_NAME)
     print_message(syslog.LOG_DEBUG, "ASIC DB {} connected".format(namespace))
 
-    rt = []
+    rt = PrefixSet()
     while True:
         k, _, _ = subs.pop()
         if not k:
             break
         res, e = checkout_rt_entry(k)
         if res:
-            rt.append(e)
+            rt.add(e)
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"ASIC_ROUTE_ENTRY": sorted(rt)}, indent=4))
+    if is_debug_enabled():
+        print_message(syslog.LOG_DEBUG, json.dumps({"ASIC_ROUTE_ENTRY": rt.sorted()}, indent=4))
 
     selector = swsscommon.Select()
     selector.addSelectable(subs)
-    return (selector, subs, sorted(rt))
+    return (selector, subs, rt)
 
 
 def is_suppress_fib_pending_enabled(namespace):
@@ -339,17 +394,103 @@ def is_suppress_fib_pending_enabled(namespace):
     return state == 'enabled'
 
 
-def fetch_routes(cmd):
+def iter_json_object(stream, chunk_size=FRR_READ_CHUNK):
     """
-    Fetch routes using the given command.
+    helper to parse a JSON object from a text stream one member at a time,
+    so that only the member being parsed is held in memory.
+    :param stream: text stream holding a JSON object
+    :return generator of (key, value) of the object members
     """
-    output = subprocess.check_output(cmd, text=True)
-    return json.loads(output)
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def read_more():
+        nonlocal buf, pos, eof
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def next_char():
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not read_more():
+                raise ValueError("Unexpected end of JSON output")
+
+    def decode():
+        nonlocal pos
+        while True:
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if not read_more():
+                    raise
+                continue
+            # A number or literal ending the buffer may continue in the next chunk
+            if end == len(buf) and not eof and read_more():
+                continue
+            pos = end
+            return value
 
+    if next_char() != '{':
+        raise ValueError("JSON output is not an object")
+    pos += 1
+    if next_char() == '}':
+        return
 
-def get_frr_routes_parallel(namespace):
+    while True:
+        next_char()
+        key = decode()
+        if next_char() != ':':
+            raise ValueError("Expected ':' in JSON output")
+        pos += 1
+        next_char()
+        yield key, decode()
+
+        c = next_char()
+        pos += 1
+        if c == '}':
+            return
+        if c != ',':
+            raise ValueError("Expected ',' or '}}' in JSON output, got {}".format(c))
+
+
+def fetch_routes(cmd, route_filter=None):
+    """
+    Fetch routes using the given command. The JSON output is parsed while
+    it is read, keeping only the route entries <route_filter> accepts.
+    :return {prefix: [route entries]} holding the prefixes with entries left
+    """
+    routes = {}
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    try:
+        for prefix, entries in iter_json_object(proc.stdout):
+            if route_filter is not None:
+                entries = [entry for entry in entries if route_filter(entry)]
+            if entries:
+                routes[prefix] = entries
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+    return routes
+
+
+def get_frr_routes_parallel(namespace, route_filter=None):
     """
     Read routes from zebra through CLI command for IPv4 and IPv6 in parallel
+    :param route_filter: called with every route entry, only the entries
+    it returns True for are kept
     :return combined IPv4 and IPv6 routes dictionary.
     """
     if namespace == multi_asic.DEFAULT_NAMESPACE:
@@ -360,8 +501,8 @@ def get_frr_routes_parallel(namespace):
         v6_route_cmd = ['show', 'ipv6', 'route', '-n', namespace, 'json']
 
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_v4 = executor.submit(fetch_routes, v4_route_cmd)
-        future_v6 = executor.submit(fetch_routes, v6_route_cmd)
+        future_v4 = executor.submit(fetch_routes, v4_route_cmd, route_filter)
+        future_v6 = executor.submit(fetch_routes, v6_route_cmd, route_filter)
 
         # Wait for both results to complete
         v4_routes = future_v4.result()
@@ -376,26 +517,27 @@ def get_frr_routes_parallel(namespace):
 def get_interfaces(namespace):
     """
     helper to read interface table from APPL-DB.
-    :return sorted list of IP addresses with added prefix
+    :return PrefixSet of IP addresses with added prefix
     """
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     print_message(syslog.LOG_DEBUG, "APPL DB connected for interfaces")
     tbl = swsscommon.Table(db, 'INTF_TABLE')
     keys = tbl.getKeys()
 
-    intf = []
+    intf = PrefixSet()
     for k in keys:
         lst = re.split(':', k.lower(), maxsplit=1)
         if len(lst) == 1:
             # No IP address in key; ignore
             continue
 
-        ip = add_prefix(lst[1].split("/", -1)[0])
+        ip = lst[1].split("/", -1)[0]
         if not is_local(ip):
-            intf.append(ip)
+            intf.add(ip)
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"APPL_DB_INTF": sorted(intf)}, indent=4))
-    return sorted(intf)
+    if is_debug_enabled():
+        print_message(syslog.LOG_DEBUG, json.dumps({"APPL_DB_INTF": intf.sorted()}, indent=4))
+    return intf
 
 
 def filter_out_local_interfaces(namespace, keys):
@@ -561,36 +703,39 @@ def is_feature_bgp_enabled(namespace):
             bgp_enabled = True
     return bgp_enabled
 
-def check_frr_pending_routes(namespace):
+
+def check_frr_pending_routes(namespace, retries=FRR_CHECK_RETRIES):
     """
     Check FRR routes for offload flag presence by executing "show ip route json"
     Returns a list of routes that have no offload flag.
     """
 
+    def is_missed(entry):
+        if entry['protocol'] in ('connected', 'kernel'):
+            return False
+
+        # TODO: Also handle VRF routes. Currently this script does not check for VRF routes so it would be
+        # incorrect for us to assume they are installed in ASIC_DB, so we don't handle them.
+        if entry['vrfName'] != 'default':
+            return False
+
+        # skip if this bgp source prefix is not selected as best
+        if not entry.get('selected', False):
+            return False
+
+        return not entry.get('offloaded', False)
+
     missed_rt = []
-    retries = FRR_CHECK_RETRIES
     for i in range(retries):
         missed_rt = []
-        frr_routes = get_frr_routes_parallel(namespace)
+        # Only the missed entries are kept while the FRR output is parsed
+        frr_routes = get_frr_routes_parallel(namespace, is_missed)
 
         for _, entries in frr_routes.items():
-            for entry in entries:
-                if entry['protocol'] in ('connected', 'kernel'):
-                    continue
-
-                # TODO: Also handle VRF routes. Currently this script does not check for VRF routes so it would be incorrect for us
-                # to assume they are installed in ASIC_DB, so we don't handle them.
-                if entry['vrfName'] != 'default':
-                    continue
+            missed_rt.extend(entries)
 
-                # skip if this bgp source prefix is not selected as best
-                if not entry.get('selected', False):
-                    continue
-
-                if not entry.get('offloaded', False):
-                    missed_rt.append(entry)
-
-        if not missed_rt:
+        # No wait after the last attempt, there is nothing left to retry
+        if not missed_rt or i == retries - 1:
             break
 
         time.sleep(FRR_WAIT_TIME)
@@ -704,6 +849,33 @@ def filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss):
     return rt_appl_miss, rt_asic_miss
 
 
+def filter_out_expected_misses(namespace, rt_appl_miss, rt_asic_miss):
+    """
+    helper to drop the APPL-DB / ASIC-DB route misses which are expected:
+    default, VNET, standalone tunnel & SOC IP routes missing in APPL-DB,
+    local interface & VOQ neighbor routes missing in ASIC-DB and, on
+    dualtor, VLAN neighbor routes.
+    :return (rt_appl_miss, rt_asic_miss) filtered
+    """
+    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
+    rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
+    rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
+    rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
+
+    if rt_appl_miss:
+        rt_appl_miss = filter_out_local_interfaces(namespace, rt_appl_miss)
+
+    if rt_appl_miss:
+        rt_appl_miss = filter_out_voq_neigh_routes(namespace, rt_appl_miss)
+
+    # NOTE: On dualtor environment, ignore any route miss for the
+    # neighbors learned from the vlan subnet.
+    if rt_appl_miss or rt_asic_miss:
+        rt_appl_miss, rt_asic_miss = filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss)
+
+    return rt_appl_miss, rt_asic_miss
+
+
 def check_routes_for_namespace(namespace):
     """
     Process a Single Namespace:
@@ -739,38 +911,26 @@ def check_routes_for_namespace(namespace):
     intf_appl = get_interfaces(namespace)
 
     # Diff APPL-DB routes & ASIC-DB routes
-    rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
+    rt_appl_miss = rt_appl.difference(rt_asic)
+    rt_asic_miss = rt_asic.difference(rt_appl)
 
     # Check missed ASIC routes against APPL-DB INTF_TABLE
-    _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
-    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
-    rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
-    rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
-    rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
+    rt_asic_miss = filter_out_prefixes(rt_asic_miss, intf_appl)
 
     # Check APPL-DB INTF_TABLE with ASIC table route entries
-    intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
-
-    if rt_appl_miss:
-        rt_appl_miss = filter_out_local_interfaces(namespace, rt_appl_miss)
-
-    if rt_appl_miss:
-        rt_appl_miss = filter_out_voq_neigh_routes(namespace, rt_appl_miss)
+    intf_appl_miss = intf_appl.difference(rt_asic)
 
-    # NOTE: On dualtor environment, ignore any route miss for the
-    # neighbors learned from the vlan subnet.
-    if rt_appl_miss or rt_asic_miss:
-        rt_appl_miss, rt_asic_miss = filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss)
+    rt_appl_miss, rt_asic_miss = filter_out_expected_misses(namespace, rt_appl_miss, rt_asic_miss)
 
     if rt_appl_miss or rt_asic_miss:
         # Look for subscribe updates for a second
         adds, deletes = get_subscribe_updates(selector, subs)
 
     # Drop all those for which SET received
-    rt_appl_miss, _ = diff_sorted_lists(rt_appl_miss, adds)
+    rt_appl_miss = filter_out_prefixes(rt_appl_miss, PrefixSet(adds))
 
     # Drop all those for which DEL received
-    rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, deletes)
+    rt_asic_miss = filter_out_prefixes(rt_asic_miss, PrefixSet(deletes))
 
     if rt_appl_miss:
         results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
@@ -796,16 +956,23 @@ def check_routes_for_namespace(namespace):
     return results, adds, deletes
 
 
+def get_namespaces_to_check(namespace):
+    """
+    :return the namespace given on the command line, or all of them
+    """
+    if namespace is not multi_asic.DEFAULT_NAMESPACE and namespace in multi_asic.get_namespace_list():
+        return [namespace]
+
+    namespace_list = multi_asic.get_namespace_list()
+    print_message(syslog.LOG_INFO, "Checking routes for namespaces: ", namespace_list)
+    return namespace_list
+
+
 def check_routes(namespace):
     """
     Main function to parallelize route checks across all namespaces.
     """
-    namespace_list = []
-    if namespace is not multi_asic.DEFAULT_NAMESPACE and namespace in multi_asic.get_namespace_list():
-        namespace_list.append(namespace)
-    else:
-        namespace_list = multi_asic.get_namespace_list()
-        print_message(syslog.LOG_INFO, "Checking routes for namespaces: ", namespace_list)
+    namespace_list = get_namespaces_to_check(namespace)
 
     results = {}
     all_adds = {}
@@ -839,6 +1006,255 @@ def check_routes(namespace):
         print_message(syslog.LOG_INFO, "All good!")
         return 0, None
 
+
+class RouteView(object):
+    """
+    Routes of one table, kept current from its SET / DEL updates.
+    A prefix may be present in several VRFs, so every (VRF, prefix) entry
+    is tracked and the VRFs holding each prefix are counted.
+    """
+
+    def __init__(self):
+        self.entries = set()
+        self.prefixes = Counter()
+        self.vrfs = {}
+
+    def _entry(self, vrf, packed):
+        vrf_id = self.vrfs.setdefault(vrf, len(self.vrfs))
+        return (vrf_id << (PACKED_IPV6.bit_length())) | packed
+
+    def update(self, vrf, prefix, is_set):
+        """
+        Apply a SET (is_set) or DEL of <prefix> in <vrf>
+        :return the packed prefix if the table changed, else None
+        """
+        packed = pack_prefix(prefix)
+        entry = self._entry(vrf, packed)
+        if is_set == (entry in self.entries):
+            return None
+
+        if is_set:
+            self.entries.add(entry)
+            self.prefixes[packed] += 1
+        else:
+            self.entries.discard(entry)
+            self.prefixes[packed] -= 1
+            if not self.prefixes[packed]:
+                del self.prefixes[packed]
+        return packed
+
+    def has(self, packed):
+        return packed in self.prefixes
+
+    def __contains__(self, prefix):
+        try:
+            return pack_prefix(prefix) in self.prefixes
+        except (OSError, ValueError):
+            return False
+
+
+class RouteChecker(object):
+    """
+    Continuous route check of one namespace, for daemon mode.
+
+    sync() reads APPL-DB ROUTE_TABLE & INTF_TABLE and ASIC-DB route entries
+    once, through SubscriberStateTables. From then on process_updates()
+    only applies the updates those subscribers receive, rechecking the
+    prefixes they touch, so the cost follows the route churn rather than
+    the table size. A prefix out of sync is only reported by check() once
+    it stayed so for the settle time. FRR is asked for routes pending
+    offload only after APPL-DB routes changed and settled again.
+    """
+
+    def __init__(self, namespace, settle_time):
+        self.namespace = namespace
+        self.settle_time = settle_time
+        self.appl = RouteView()
+        self.asic = RouteView()
+        self.intf = RouteView()
+        # {packed prefix: time since when it is out of sync}
+        self.pending = {}
+        self.frr_missed = {}
+        self.frr_dirty = True
+        self.last_appl_change = 0
+        # (misses, filtered misses) of the last check, the filters read the
+        # whole config, so they are only run again when the misses change
+        self.filtered_misses = None
+
+        appl_db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
+        asic_db = swsscommon.DBConnector(ASIC_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
+        self.subscribers = [
+            (swsscommon.SubscriberStateTable(appl_db, 'ROUTE_TABLE'), self.on_appl_route),
+            (swsscommon.SubscriberStateTable(appl_db, 'INTF_TABLE'), self.on_intf),
+            (swsscommon.SubscriberStateTable(asic_db, ASIC_TABLE_NAME), self.on_asic_route),
+        ]
+
+    def sync(self, now=None):
+        """
+        Initial full read: the subscribers first return every existing entry
+        """
+        now = time.time() if now is None else now
+        self.process_updates(now)
+        self.last_appl_change = now
+        print_message(syslog.LOG_INFO, "Route check daemon synced namespace '{}': {} APPL-DB, {} ASIC-DB routes".format(
+            self.namespace, len(self.appl.prefixes), len(self.asic.prefixes)))
+
+    def process_updates(self, now=None):
+        now = time.time() if now is None else now
+        for subs, handler in self.subscribers:
+            while True:
+                key, op, _ = subs.pop()
+                if not key:
+                    break
+                packed = handler(key, op == 'SET', now)
+                if packed is not None:
+                    self.recheck(packed, now)
+
+    def on_appl_route(self, key, is_set, now):
+        vrf = ''
+        if is_vrf(key):
+            vrf, key = key.split(":", 1)
+        if is_local(key):
+            return None
+        packed = self.appl.update(vrf, key, is_set)
+        if packed is not None:
+            self.frr_dirty = True
+            self.last_appl_change = now
+        return packed
+
+    def on_intf(self, key, is_set, now):
+        lst = re.split(':', key.lower(), maxsplit=1)
+        if len(lst) == 1:
+            # No IP address in key; ignore
+            return None
+        ip = lst[1].split("/", -1)[0]
+        if is_local(ip):
+            return None
+        return self.intf.update(lst[0], ip, is_set)
+
+    def on_asic_route(self, key, is_set, now):
+        res, e = checkout_rt_entry(key)
+        if not res:
+            return None
+        vr = key.partition('"vr":"')[2].split('"', 1)[0]
+        return self.asic.update(vr, e, is_set)
+
+    def recheck(self, packed, now):
+        # Out of sync: in APPL-DB routes or interfaces but not in ASIC-DB,
+        # or the other way round
+        if (self.appl.has(packed) or self.intf.has(packed)) != self.asic.has(packed):
+            self.pending.setdefault(packed, now)
+        else:
+            self.pending.pop(packed, None)
+
+    def check_frr(self, now):
+        if not self.frr_dirty or now - self.last_appl_change < self.settle_time:
+            return
+        self.frr_dirty = False
+        missed = check_frr_pending_routes(self.namespace, retries=1)
+        self.frr_missed = {entry['prefix']: entry for entry in missed}
+
+    def filter_out_expected_misses(self, rt_appl_miss, rt_asic_miss):
+        misses = (rt_appl_miss, rt_asic_miss)
+        if self.filtered_misses is None or self.filtered_misses[0] != misses:
+            filtered = filter_out_expected_misses(self.namespace, list(rt_appl_miss), list(rt_asic_miss))
+            self.filtered_misses = (misses, filtered)
+        rt_appl_miss, rt_asic_miss = self.filtered_misses[1]
+        return list(rt_appl_miss), list(rt_asic_miss)
+
+    def check(self, now=None):
+        """
+        :return results as check_routes_for_namespace does, for the
+        mismatches older than the settle time
+        """
+        now = time.time() if now is None else now
+        results = {}
+        rt_appl_miss = []
+        rt_asic_miss = []
+        intf_appl_miss = []
+
+        for packed, since in self.pending.items():
+            if now - since < self.settle_time:
+                continue
+            prefix = unpack_prefix(packed)
+            if self.asic.has(packed):
+                rt_asic_miss.append(prefix)
+            elif self.appl.has(packed):
+                rt_appl_miss.append(prefix)
+            if self.intf.has(packed) and not self.asic.has(packed):
+                intf_appl_miss.append(prefix)
+
+        if rt_appl_miss or rt_asic_miss:
+            rt_appl_miss, rt_asic_miss = self.filter_out_expected_misses(sorted(rt_appl_miss), sorted(rt_asic_miss))
+
+        if rt_appl_miss:
+            results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+
+        if intf_appl_miss:
+            results["missed_INTF_TABLE_entries"] = sorted(intf_appl_miss)
+
+        if rt_asic_miss:
+            results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
+
+        self.check_frr(now)
+        if self.frr_missed:
+            results["missed_FRR_routes"] = list(self.frr_missed.values())
+            if not rt_appl_miss and not rt_asic_miss and is_suppress_fib_pending_enabled(self.namespace):
+                mitigate_installed_not_offloaded_frr_routes(self.namespace, results["missed_FRR_routes"], self.appl)
+                # Ask FRR again once the offload notifications went through
+                self.frr_dirty = True
+                self.last_appl_change = now
+
+        return results
+
+
+def run_daemon(namespace, settle_time, max_cycles=None):
+    """
+    Daemon mode: sync every namespace once, then keep checking them from
+    the DB updates, reporting whenever the set of settled mismatches
+    changes.
+    :param max_cycles: stop after that many select cycles (unit tests)
+    :return same as check_routes, for the last check
+    """
+    checkers = [RouteChecker(ns, settle_time) for ns in get_namespaces_to_check(namespace)]
+    selector = swsscommon.Select()
+    for checker in checkers:
+        checker.sync()
+        for subs, _ in checker.subscribers:
+            selector.addSelectable(subs)
+
+    reported = None
+    ret, res = 0, None
+    next_check = 0
+    cycles = 0
+    while True:
+        selector.select(DAEMON_SELECT_TIMEOUT_MSECS)
+        now = time.time()
+        for checker in checkers:
+            checker.process_updates(now)
+
+        if now >= next_check:
+            next_check = now + DAEMON_CHECK_INTERVAL
+            results = {}
+            for checker in checkers:
+                result = checker.check(now)
+                if result:
+                    results[checker.namespace] = result
+
+            ret, res = (-1, results) if results else (0, None)
+            if results != reported:
+                if results:
+                    print_message(syslog.LOG_WARNING, "Failure results: {",  json.dumps(results, indent=4), "}")
+                    print_message(syslog.LOG_WARNING, "Failed. Look at reported mismatches above")
+                else:
+                    print_message(syslog.LOG_INFO, "All good!")
+                reported = results
+
+        cycles += 1
+        if max_cycles is not None and cycles >= max_cycles:
+            return ret, res
+
+
 def main():
     """
     main entry point, which mainly parses the args and call check_routes
@@ -852,6 +1268,10 @@ def main():
     parser.add_argument("-i", "--interval", type=int, default=0, help="Scan interval in seconds")
     parser.add_argument("-s", "--log_to_syslog", action="store_true", default=True, help="Write message to syslog")
     parser.add_argument('-n','--namespace',   default=multi_asic.DEFAULT_NAMESPACE, help='Verify routes for this specific namespace')
+    parser.add_argument("-d", "--daemon", action="store_true", default=False,
+                        help="Keep checking from DB updates instead of rescanning the tables")
+    parser.add_argument("--settle-time", type=int, default=DEFAULT_SETTLE_SECS,
+                        help="Daemon mode: seconds a mismatch must last before it is reported")
     args = parser.parse_args()
 
     namespace = args.namespace
@@ -882,6 +1302,9 @@ def main():
         print_message(syslog.LOG_INFO, "BGP feature is disabled, exiting without checking routes!!")
         return 0, None
 
+    if args.daemon:
+        return run_daemon(namespace, args.settle_time, max_cycles=1 if UNIT_TESTING else None)
+
     while True:
         signal.alarm(TIMEOUT_SECONDS)
         ret, res= check_routes(namespace)
@@ -316,11 +316,10 @@ def expected(db, interfacename, namespace):
         click.echo("DEVICE_NEIGHBOR_METADATA information is not present.")
         return
 
-    for port in natsorted(list(neighbor_dict.keys())):
-        temp_port = port
-        if clicommon.get_interface_naming_mode() == "alias":
-            port = clicommon.InterfaceAliasConverter().name_to_alias(port)
-            neighbor_dict[port] = neighbor_dict.pop(temp_port)
+    if clicommon.get_interface_naming_mode() == "alias":
+        iface_alias_converter = clicommon.InterfaceAliasConverter()
+        for port in natsorted(list(neighbor_dict.keys())):
+            neighbor_dict[iface_alias_converter.name_to_alias(port)] = neighbor_dict.pop(port)
     header = ['LocalPort', 'Neighbor', 'NeighborPort',
               'NeighborLoopback', 'NeighborMgmt', 'NeighborType']
     body = []
@@ -429,10 +428,14 @@ def mpls(ctx, interfacename, namespace, display):
     header = ['Interface', 'MPLS State']
     body = []
 
+    iface_alias_converter = None
+    if clicommon.get_interface_naming_mode() == "alias":
+        iface_alias_converter = clicommon.InterfaceAliasConverter()
+
     # Output name and alias for all interfaces
     for intf_name in natsorted(list(intfs_data.keys())):
-        if clicommon.get_interface_naming_mode() == "alias":
-            alias = clicommon.InterfaceAliasConverter().name_to_alias(intf_name)
+        if iface_alias_converter is not None:
+            alias = iface_alias_converter.name_to_alias(intf_name)
             body.append([alias, intfs_data[intf_name]])
         else:
             body.append([intf_name, intfs_data[intf_name]])
@@ -98,6 +98,10 @@ class Teamshow(object):
         """
              Get teamshow results by parsing the output of teamdctl and combining port channel status.
         """
+        iface_alias_converter = None
+        if clicommon.get_interface_naming_mode() == "alias":
+            iface_alias_converter = clicommon.InterfaceAliasConverter()
+
         for team in self.teams:
             info = {}
             team_id = self.get_team_id(team)
@@ -130,8 +134,8 @@ class Teamshow(object):
                     status = self.get_portchannel_member_status(team, port)
                     pstate = self.db.get_all(self.db.STATE_DB, PORT_CHANNEL_MEMBER_STATE_TABLE_PREFIX+team+'|'+port)
                     selected = True if pstate['runner.aggregator.selected'] == "true" else False
-                    if clicommon.get_interface_naming_mode() == "alias":
-                        alias = clicommon.InterfaceAliasConverter().name_to_alias(port)
+                    if iface_alias_converter is not None:
+                        alias = iface_alias_converter.name_to_alias(port)
                         info["ports"] += alias + "("
                     else:
                         info["ports"] += port + "("
@@ -0,0 +1,71 @@
+import os
+from unittest import mock
+
+from .mock_tables import dbconnector
+from swsscommon.swsscommon import SonicV2Connector
+
+from utilities_common.bulk_db import BulkDbReader
+
+
+class TestBulkDbReader(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "1"
+        dbconnector.load_database_config()
+
+    def setup_method(self):
+        self.db = SonicV2Connector(host='127.0.0.1')
+        self.db.connect(self.db.APPL_DB)
+        self.db.connect(self.db.COUNTERS_DB)
+
+    def test_get_all(self):
+        reader = BulkDbReader(self.db)
+        keys = ['COUNTERS:oid:0x1000000000012', 'COUNTERS:oid:0x1000000000013', 'COUNTERS:oid:0xdead']
+        result = reader.get_all(self.db.COUNTERS_DB, keys)
+        assert list(result.keys()) == keys[:2]
+        for key in keys[:2]:
+            assert result[key] == self.db.get_all(self.db.COUNTERS_DB, key)
+        assert reader.round_trips == 1
+
+    def test_get_all_batches(self):
+        reader = BulkDbReader(self.db, batch_size=2)
+        keys = reader.keys(self.db.APPL_DB, 'PORT_TABLE:*')
+        assert len(keys) > 4
+        reader.round_trips = 0
+        result = reader.get_all(self.db.APPL_DB, keys)
+        assert len(result) == len(keys)
+        assert reader.round_trips == (len(keys) + 1) // 2
+
+    def test_get(self):
+        reader = BulkDbReader(self.db)
+        result = reader.get(self.db.COUNTERS_DB, ['COUNTERS_PORT_NAME_MAP', 'COUNTERS_QUEUE_NAME_MAP'], 'Ethernet0')
+        assert result == {'COUNTERS_PORT_NAME_MAP': 'oid:0x1000000000012'}
+
+    def test_get_fields(self):
+        reader = BulkDbReader(self.db)
+        result = reader.get_fields(self.db.APPL_DB, ['PORT_TABLE:Ethernet0', 'PORT_TABLE:Ethernet999'],
+                                   ['admin_status', 'mtu', 'no_such_field'])
+        assert result == {'PORT_TABLE:Ethernet0': {'admin_status': 'up', 'mtu': '9100'}}
+
+    def test_keys(self):
+        reader = BulkDbReader(self.db)
+        keys = reader.keys(self.db.APPL_DB, 'PORT_TABLE:*')
+        assert sorted(keys) == sorted(self.db.keys(self.db.APPL_DB, 'PORT_TABLE:*'))
+
+    def test_get_table(self):
+        reader = BulkDbReader(self.db)
+        table = reader.get_table(self.db.APPL_DB, 'PORT_TABLE:Ethernet0')
+        assert table['PORT_TABLE:Ethernet0']['alias'] == 'Ethernet0'
+
+    def test_fallback_without_pipeline(self):
+        reader = BulkDbReader(self.db)
+        client = mock.MagicMock(spec=['hgetall', 'hget', 'keys'])
+        client.hgetall.side_effect = lambda key: {'f': key} if key != 'missing' else {}
+        with mock.patch.object(reader, 'get_client', return_value=client):
+            result = reader.get_all(self.db.COUNTERS_DB, ['a', 'missing', 'b'])
+        assert result == {'a': {'f': 'a'}, 'b': {'f': 'b'}}
+        assert reader.round_trips == 3
+
+    @classmethod
+    def teardown_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "0"
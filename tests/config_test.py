@@ -2000,6 +2000,22 @@ class TestGenericUpdateCommands(unittest.TestCase):
         self.assertNotEqual(unexpected_exit_code, result.exit_code)
         self.assertTrue(any_error_message in result.output)
 
+    def test_apply_patch__parallel_with_validation_processes__error_displayed(self):
+        # Arrange
+        mock_generic_updater = mock.Mock()
+        with mock.patch('config.main.GenericUpdater', return_value=mock_generic_updater):
+            with mock.patch('builtins.open', mock.mock_open(read_data=self.any_patch_as_text)):
+
+                # Act
+                result = self.runner.invoke(config.config.commands["apply-patch"],
+                                            [self.any_path, "--parallel", "--validation-processes", "2"],
+                                            catch_exceptions=False)
+
+        # Assert
+        self.assertNotEqual(0, result.exit_code)
+        self.assertIn("--validation-processes cannot be used with --parallel", result.output)
+        mock_generic_updater.apply_patch.assert_not_called()
+
     def test_apply_patch__optional_parameters_passed_correctly(self):
         self.validate_apply_patch_optional_parameter(
             ["--format", ConfigFormat.SONICYANG.name],
@@ -2246,6 +2262,31 @@ class TestGenericUpdateCommands(unittest.TestCase):
         self.assertNotEqual(unexpected_exit_code, result.exit_code)
         self.assertTrue(any_error_message in result.output)
 
+    def test_rollback__profile__profile_report_saved_as_json(self):
+        # Arrange
+        expected_exit_code = 0
+        mock_generic_updater = mock.Mock()
+
+        def rollback(*args):
+            with config.genericUpdaterProfiling.profiled("localhost"):
+                config.genericUpdaterProfiling.count("changes", 2)
+
+        mock_generic_updater.rollback.side_effect = rollback
+        with mock.patch('config.main.GenericUpdater', return_value=mock_generic_updater) as mock_generic_updater_class:
+            with self.runner.isolated_filesystem():
+
+                # Act
+                result = self.runner.invoke(config.config.commands["rollback"],
+                                            [self.any_checkpoint_name, "--profile", "profile.json"],
+                                            catch_exceptions=False)
+                with open("profile.json") as fh:
+                    profile = json.load(fh)
+
+        # Assert
+        self.assertEqual(expected_exit_code, result.exit_code)
+        self.assertEqual(True, mock_generic_updater_class.call_args.kwargs["profile"])
+        self.assertEqual({"changes": 2}, profile["localhost"]["counters"])
+
     def test_rollback__optional_parameters_passed_correctly(self):
         self.validate_rollback_optional_parameter(
             ["--verbose"],
@@ -21,6 +21,7 @@ from .bgp_commands_input.bgp_network_test_vector import (
 from . import config_int_ip_common
 import utilities_common.constants as constants
 import config.main as config
+import generic_config_updater.gu_common as gu_common
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(test_path)
@@ -67,6 +68,15 @@ def setup_env():
     if "PYTHONPATH" not in os.environ:
         os.environ["PYTHONPATH"] = os.getcwd()
 
+
+@pytest.fixture(scope='session', autouse=True)
+def setup_yang_model_cache_dir(tmp_path_factory):
+    # Keep the on-disk YANG model cache of the tests that load the real
+    # models out of /var/cache
+    with mock.patch.object(gu_common.yangModelCache, 'cache_dir',
+                           str(tmp_path_factory.mktemp('yang_model_cache'))):
+        yield
+
 @pytest.fixture
 def get_cmd_module():
     import config.main as config
@@ -0,0 +1,91 @@
+import datetime
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from utilities_common import counter_snapshot, netstat
+from utilities_common.counter_snapshot import CounterSnapshot, SnapshotError, load_snapshot, save_snapshot
+from utilities_common.netstat import STATUS_NA
+
+COLUMNS = ['totalpacket', 'totalbytes', 'droppacket']
+
+CNSTAT = {
+    'time': datetime.datetime(2025, 1, 1, 12, 0, 0),
+    'Ethernet0:0': {'queuetype': 'UC', 'totalpacket': '1', 'totalbytes': '1,000', 'droppacket': STATUS_NA},
+    'Ethernet0:1': {'queuetype': 'MC', 'totalpacket': str(2**64 - 2), 'totalbytes': '0', 'droppacket': '7'},
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return mock.MagicMock(get_directory=mock.MagicMock(return_value=str(tmp_path)))
+
+
+class TestCounterSnapshot(object):
+    def test_save_load(self, cache):
+        save_snapshot(cache, 'queuestat', CNSTAT, COLUMNS)
+        snapshot = load_snapshot(cache, 'queuestat')
+
+        assert snapshot.time == '2025-01-01T12:00:00'
+        assert snapshot.rows == ['Ethernet0:0', 'Ethernet0:1']
+        assert snapshot.columns == COLUMNS
+        assert snapshot.get('Ethernet0:0', 'totalbytes') == 1000
+        assert snapshot.get('Ethernet0:0', 'droppacket') == STATUS_NA
+        assert snapshot.get('Ethernet0:1', 'totalpacket') == 2**64 - 2
+        assert snapshot.get('Ethernet4:0', 'totalpacket') == STATUS_NA
+        assert 'Ethernet0:1' in snapshot
+        assert snapshot.to_cnstat_dict(['Ethernet0:1', 'Ethernet4:0']) == {
+            'time': '2025-01-01T12:00:00',
+            'Ethernet0:1': {'totalpacket': str(2**64 - 2), 'totalbytes': '0', 'droppacket': '7'},
+        }
+        snapshot.close()
+
+    def test_empty(self, cache):
+        save_snapshot(cache, 'empty', {}, [])
+        snapshot = load_snapshot(cache, 'empty')
+        assert snapshot.rows == []
+        assert snapshot.time is None
+        assert snapshot.to_cnstat_dict() == {'time': None}
+
+    def test_legacy_json(self, cache, tmp_path):
+        legacy = {'time': '2025-01-01T12:00:00', 'Ethernet0': {'rx_ok': '10', 'tx_ok': STATUS_NA}}
+        with open(os.path.join(str(tmp_path), 'portstat'), 'w') as f:
+            json.dump(legacy, f)
+
+        snapshot = load_snapshot(cache, 'portstat')
+        assert snapshot.to_cnstat_dict() == legacy
+
+        export_path = os.path.join(str(tmp_path), 'export.json')
+        snapshot.export_json(export_path)
+        with open(export_path) as f:
+            assert json.load(f) == legacy
+
+        assert load_snapshot(cache, 'missing') is None
+
+    @pytest.mark.parametrize('use_numpy', [True, False])
+    def test_to_matrix(self, cache, use_numpy):
+        if use_numpy:
+            pytest.importorskip('numpy')
+        save_snapshot(cache, 'queuestat', CNSTAT, COLUMNS)
+        with mock.patch.object(netstat, 'numpy', netstat.numpy if use_numpy else None):
+            matrix = load_snapshot(cache, 'queuestat').to_matrix()
+
+        assert matrix.get('Ethernet0:0', 'totalbytes') == 1000
+        assert matrix.get('Ethernet0:0', 'droppacket') == STATUS_NA
+        assert matrix.get('Ethernet0:1', 'droppacket') == 7
+
+    def test_bad_file(self, cache, tmp_path):
+        path = os.path.join(str(tmp_path), 'bad' + counter_snapshot.SNAPSHOT_SUFFIX)
+        with open(path, 'wb') as f:
+            f.write(b'{"time": "2025"}')
+        with pytest.raises(SnapshotError):
+            load_snapshot(cache, 'bad')
+
+        save_snapshot(cache, 'truncated', CNSTAT, COLUMNS)
+        path = counter_snapshot.get_snapshot_path(cache, 'truncated')
+        with open(path, 'rb+') as f:
+            f.truncate(os.path.getsize(path) - 1)
+        with pytest.raises(SnapshotError):
+            CounterSnapshot.load(path)
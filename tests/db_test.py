@@ -0,0 +1,70 @@
+import os
+from importlib import reload
+
+from .mock_tables import dbconnector
+
+from utilities_common.db import Db
+
+
+class TestDb(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "1"
+
+    def test_lazy_connect(self):
+        db = Db()
+        assert db.metrics.connections == 0
+        assert list(db.cfgdb_clients) == ['']
+        assert db.cfgdb_clients.connected() == []
+
+        assert 'Ethernet0' in db.cfgdb.get_table('PORT')
+        assert db.metrics.connections == 1
+        assert db.cfgdb is db.cfgdb_clients['']
+
+        entry = db.db.get_all(db.db.APPL_DB, 'PORT_TABLE:Ethernet0')
+        assert entry['alias'] == 'Ethernet0'
+        db.db.get_all(db.db.APPL_DB, 'PORT_TABLE:Ethernet4')
+        assert db.metrics.connections == 2
+        assert list(db.metrics.latencies) == [('', 'CONFIG_DB'), ('', 'APPL_DB')]
+        assert db.metrics.connect_time >= 0
+        assert db.metrics.as_dict()['latencies'].keys() == {'default/CONFIG_DB', 'default/APPL_DB'}
+
+    def test_connect_all(self):
+        db = Db()
+        db.connect_all()
+        assert db.metrics.connections == len(db.db_list) + 2
+        assert 'CHASSIS_APP_DB' not in db.db_list
+
+
+class TestDbMultiAsic(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "2"
+        os.environ["UTILITIES_UNIT_TESTING_TOPOLOGY"] = "multi_asic"
+        from .mock_tables import mock_multi_asic
+        reload(mock_multi_asic)
+        dbconnector.load_namespace_config()
+
+    def test_lazy_connect_namespace(self):
+        db = Db()
+        assert list(db.db_clients) == ['', 'asic0', 'asic1']
+        assert 'asic1' in db.cfgdb_clients
+        assert db.metrics.connections == 0
+
+        entry = db.db_clients['asic1'].get_all('APPL_DB', 'PORT_TABLE:Ethernet64')
+        assert entry['alias'] == 'Ethernet1/17'
+        assert db.db_clients.connected() == ['asic1']
+        assert list(db.metrics.latencies) == [('asic1', 'APPL_DB')]
+
+        for ns, config_db in db.cfgdb_clients.items():
+            assert config_db.get_table('DEVICE_METADATA')
+        assert db.cfgdb_clients.connected() == ['', 'asic0', 'asic1']
+        assert db.metrics.connections == 4
+
+    @classmethod
+    def teardown_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "0"
+        os.environ["UTILITIES_UNIT_TESTING_TOPOLOGY"] = ""
+        from .mock_tables import mock_single_asic
+        reload(mock_single_asic)
+        dbconnector.load_database_config()
@@ -317,6 +317,18 @@ class TestDualtorNeighborCheck(object):
             assert asic_route_table == result[4]
             assert asic_neigh_table == result[5]
 
+    def test_get_if_br_oid_to_port_name_map(self, mock_log_functions):
+        with patch("dualtor_neighbor_check.port_util.get_interface_oid_map") as mock_get_interface_oid_map:
+            mock_get_interface_oid_map.return_value = ({}, {"1000000000002": "Ethernet4"})
+            mock_db = MagicMock()
+
+            result = dualtor_neighbor_check.get_if_br_oid_to_port_name_map(
+                mock_db, {"3a00000000064b": "1000000000002", "3a00000000064c": "1000000000003"}
+            )
+
+            mock_get_interface_oid_map.assert_called_once_with(mock_db)
+            assert result == {"3a00000000064b": "Ethernet4"}
+
     def test_get_mux_server_to_port_map(self, mock_log_functions):
         mux_cables = {
             "Ethernet4": {
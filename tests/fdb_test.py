@@ -0,0 +1,76 @@
+import os
+
+from .mock_tables import dbconnector
+from swsscommon.swsscommon import SonicV2Connector
+
+from utilities_common.fdb import FdbReader
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+mock_db_path = os.path.join(test_path, "fdbshow_input")
+
+
+class TestFdbReader(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "1"
+        dbconnector.load_database_config()
+        dbconnector.dedicated_dbs['ASIC_DB'] = os.path.join(mock_db_path, 'asic_db')
+
+    def setup_method(self):
+        self.db = SonicV2Connector(host='127.0.0.1')
+        self.db.connect(self.db.ASIC_DB)
+
+    def test_read(self):
+        index = FdbReader(self.db).read({'1000000000528': 'Ethernet0', '1000000000549': 'Ethernet4'})
+
+        assert index.bridge_ports == {
+            '3a0000000005cb': '1000000000528',
+            '3a0000000006cd': '1000000000549',
+            '3a0000000007ef': '1000000000fff'
+        }
+        assert index.vlans == {
+            'oid:0x260000000005c5': 2,
+            'oid:0x260000000006c6': 3,
+            'oid:0x260000000007c7': 4
+        }
+        # the entry with an empty key is skipped
+        assert len(index) == 7
+
+        entry = index.get(2, '11:22:33:44:55:66')
+        assert entry.port == 'Ethernet0'
+        assert entry.bvid == 'oid:0x260000000005c5'
+        assert entry.type == 'SAI_FDB_ENTRY_TYPE_DYNAMIC'
+
+        # keyed by VLAN id rather than bvid
+        assert index.get(5, '77:66:55:44:22:11').port == 'Ethernet4'
+
+        # unknown bridge port, and port without a name
+        entry = index.get(4, '77:55:44:33:22:11')
+        assert (entry.port_id, entry.port) == (None, None)
+        assert index.get(4, '77:66:44:33:22:11').port_id == '1000000000fff'
+
+        # neither VLAN id nor bvid
+        assert index.get_by_mac('77:66:55:33:22:11')[0].vlan is None
+
+    def test_lookups(self):
+        index = FdbReader(self.db).read({'1000000000528': 'Ethernet0', '1000000000549': 'Ethernet4'})
+
+        assert sorted(entry.mac for entry in index.get_by_vlan(4)) == \
+            ['66:55:44:33:22:11', '77:55:44:33:22:11', '77:66:44:33:22:11']
+        assert sorted(entry.mac for entry in index.get_by_port('Ethernet4')) == \
+            ['11:22:33:66:55:44', '77:66:55:44:22:11']
+        assert index.get_by_mac('11:22:33:44:55:66') == index.get_by_mac('11:22:33:44:55:66'.upper())
+        assert index.get_bvid(3) == 'oid:0x260000000006c6'
+        assert index.get_bvid(1000) is None
+        assert index.get(1000, '11:22:33:44:55:66') is None
+
+    def test_read_bridge_port_types(self):
+        reader = FdbReader(self.db)
+
+        assert reader.read_bridge_ports(['SAI_BRIDGE_PORT_TYPE_1Q_ROUTER']) == {}
+        assert len(reader.read_bridge_ports(['SAI_BRIDGE_PORT_TYPE_PORT'])) == 3
+
+    @classmethod
+    def teardown_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "0"
+        dbconnector.dedicated_dbs.clear()
@@ -1,6 +1,7 @@
 import copy
 import json
 import jsondiff
+import jsonpatch
 import os
 import unittest
 from collections import defaultdict
@@ -72,27 +73,12 @@ DB_HANDLE = "config_db"
 def debug_print(msg):
     print(msg)
 
-# Mimics os.system call for `sonic-cfggen -d --print-data` output
-def subprocess_Popen_cfggen(cmd, *args, **kwargs):
-    global running_config
-
-    stdout = kwargs.get('stdout', None)
-
-    if stdout is None:
-        output = json.dumps(running_config, indent=4)
-    elif isinstance(stdout, int) and stdout == -1:
-        output = json.dumps(running_config, indent=4)
-    else:
-        raise ValueError("stdout must be set to subprocess.PIPE or omitted for capturing output")
 
-    class MockPopen:
-        def __init__(self):
-            self.returncode = 0
-
-        def communicate(self):
-            return output.encode(), "".encode()
+# Mimics ConfigDBPipeConnector.get_config, i.e. reading the running config
+def get_config():
+    global running_config
 
-    return MockPopen()
+    return copy.deepcopy(running_config)
 
 
 # mimics config_db.set_entry
@@ -222,14 +208,14 @@ def vlan_validate(old_cfg, new_cfg, keys):
 
 class TestChangeApplier(unittest.TestCase):
 
-    @patch("generic_config_updater.gu_common.subprocess.Popen")
+    @patch("generic_config_updater.gu_common.ConfigDBPipeConnector")
     @patch("generic_config_updater.change_applier.get_config_db")
     @patch("generic_config_updater.change_applier.set_config")
-    def test_change_apply(self, mock_set, mock_db, mock_subprocess_Popen):
+    def test_change_apply(self, mock_set, mock_db, mock_connector):
         global read_data, running_config, json_changes, json_change_index
         global start_running_config
 
-        mock_subprocess_Popen.side_effect = subprocess_Popen_cfggen
+        mock_connector.return_value.get_config.side_effect = get_config
         mock_db.return_value = DB_HANDLE
         mock_set.side_effect = set_entry
 
@@ -244,7 +230,7 @@ class TestChangeApplier(unittest.TestCase):
         generic_config_updater.change_applier.set_verbose(True)
         generic_config_updater.services_validator.set_verbose(True)
 
-        applier = generic_config_updater.change_applier.ChangeApplier()
+        applier = generic_config_updater.change_applier.ChangeApplier(cache_running_config=True)
         debug_print("invoked applier")
 
         for i in range(len(json_changes)):
@@ -281,6 +267,152 @@ class TestChangeApplier(unittest.TestCase):
 
         debug_print("all good for applier")
 
+        # The running config is read at most once per change, to verify it, plus once before the first change
+        self.assertLessEqual(mock_connector.return_value.get_config.call_count, len(json_changes) + 1)
+
+
+class MockConfigDb:
+    # Mimics the ConfigDBPipeConnector calls the applier makes on a change with a known scope
+    def __init__(self, config):
+        self.config = copy.deepcopy(config)
+        self.calls = defaultdict(int)
+
+    def get_table(self, tbl):
+        self.calls["get_table"] += 1
+        return copy.deepcopy(self.config.get(tbl, {}))
+
+    def get_entry(self, tbl, key):
+        self.calls["get_entry"] += 1
+        return copy.deepcopy(self.config.get(tbl, {}).get(key, {}))
+
+    def set_entry(self, tbl, key, data):
+        self.calls["set_entry"] += 1
+        if data is None:
+            self.config[tbl].pop(key)
+            generic_config_updater.change_applier.prune_empty_table(self.config)
+        else:
+            self.config.setdefault(tbl, {})[key] = copy.deepcopy(data)
+
+    def mod_config(self, data):
+        self.calls["mod_config"] += 1
+        for tbl, entries in data.items():
+            for key, entry in entries.items():
+                if entry is None:
+                    self.config[tbl].pop(key)
+                else:
+                    self.config.setdefault(tbl, {}).setdefault(key, {}).update(entry)
+        generic_config_updater.change_applier.prune_empty_table(self.config)
+
+
+class TestChangeApplierScoped(unittest.TestCase):
+    RUNNING_CONFIG = {
+        "PORT": {
+            "Ethernet0": {"admin_status": "up", "mtu": "9100"},
+            "Ethernet4": {"admin_status": "up", "mtu": "9100"}
+        },
+        "VLAN": {
+            "Vlan1000": {"vlanid": "1000"}
+        }
+    }
+
+    def setUp(self):
+        self.config_db = MockConfigDb(self.RUNNING_CONFIG)
+        patchers = [
+            patch("generic_config_updater.change_applier.get_config_db", return_value=self.config_db),
+            patch.object(generic_config_updater.change_applier.ChangeApplier, "updater_conf",
+                         {"tables": {}, "services": {}}),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch("generic_config_updater.change_applier.get_config_db_as_json",
+                        side_effect=lambda scope: copy.deepcopy(self.config_db.config))
+        self.mock_get_config_db_as_json = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.applier = generic_config_updater.change_applier.ChangeApplier()
+
+    def create_change(self, patch_ops):
+        return generic_config_updater.gu_common.JsonChange(jsonpatch.JsonPatch(patch_ops))
+
+    def test_get_change_scope(self):
+        get_change_scope = generic_config_updater.change_applier.get_change_scope
+        self.assertEqual({"PORT": {"Ethernet0", "Ethernet4"}, "VLAN": None}, get_change_scope(self.create_change([
+            {"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"},
+            {"op": "move", "from": "/PORT/Ethernet4/mtu", "path": "/VLAN"}])))
+        self.assertIsNone(get_change_scope(self.create_change([{"op": "add", "path": "", "value": {}}])))
+        self.assertIsNone(get_change_scope(Mock()))
+
+    def test_apply__one_field__reads_writes_and_verifies_the_entry_only(self):
+        change = self.create_change([{"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"}])
+
+        self.assertEqual(0, self.applier.apply(change))
+
+        self.assertEqual("1500", self.config_db.config["PORT"]["Ethernet0"]["mtu"])
+        self.assertEqual({"get_entry": 2, "mod_config": 1}, dict(self.config_db.calls))
+        self.mock_get_config_db_as_json.assert_not_called()
+
+    def test_apply__removed_field__is_written_with_set_entry(self):
+        change = self.create_change([
+            {"op": "remove", "path": "/PORT/Ethernet0/mtu"},
+            {"op": "remove", "path": "/PORT/Ethernet4"},
+            {"op": "add", "path": "/VLAN/Vlan2000", "value": {"vlanid": "2000"}}])
+
+        self.assertEqual(0, self.applier.apply(change))
+
+        expected = copy.deepcopy(self.RUNNING_CONFIG)
+        expected["PORT"] = {"Ethernet0": {"admin_status": "up"}}
+        expected["VLAN"]["Vlan2000"] = {"vlanid": "2000"}
+        self.assertEqual(expected, self.config_db.config)
+        self.assertEqual(1, self.config_db.calls["set_entry"])
+        self.assertEqual(1, self.config_db.calls["mod_config"])
+
+    def test_apply__whole_table__reads_the_table(self):
+        change = self.create_change([{"op": "remove", "path": "/VLAN"}])
+
+        self.assertEqual(0, self.applier.apply(change))
+
+        self.assertNotIn("VLAN", self.config_db.config)
+        self.assertEqual(2, self.config_db.calls["get_table"])
+        self.assertEqual(0, self.config_db.calls["get_entry"])
+
+    def test_apply__entry_not_read__falls_back_to_the_whole_config(self):
+        # An entry with no fields reads the same as a missing one
+        self.config_db.config["VLAN"]["Vlan3000"] = {}
+        change = self.create_change([{"op": "add", "path": "/VLAN/Vlan3000/vlanid", "value": "3000"}])
+
+        with patch("generic_config_updater.change_applier.set_config") as mock_set:
+            mock_set.side_effect = lambda config_db, tbl, key, data: config_db.set_entry(tbl, key, data)
+            self.assertEqual(0, self.applier.apply(change))
+
+        self.assertEqual({"vlanid": "3000"}, self.config_db.config["VLAN"]["Vlan3000"])
+        self.assertEqual(2, self.mock_get_config_db_as_json.call_count)
+
+    def test_apply__mismatch__fails(self):
+        change = self.create_change([{"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"}])
+        self.config_db.mod_config = Mock()
+
+        self.assertEqual(-1, self.applier.apply(change))
+
+    def test_get_running_config__cache_off__external_write_seen(self):
+        self.applier._get_running_config()
+        self.config_db.config["PORT"]["Ethernet0"]["mtu"] = "1500"
+
+        self.assertEqual("1500", self.applier._get_running_config()["PORT"]["Ethernet0"]["mtu"])
+        self.assertIsNone(self.applier.running_config)
+
+    def test_get_running_config__cache_on__read_once_until_cleared(self):
+        applier = generic_config_updater.change_applier.ChangeApplier(cache_running_config=True)
+        applier._get_running_config()
+        self.config_db.config["PORT"]["Ethernet0"]["mtu"] = "1500"
+
+        self.assertEqual("9100", applier._get_running_config()["PORT"]["Ethernet0"]["mtu"])
+        self.assertEqual(1, self.mock_get_config_db_as_json.call_count)
+
+        applier.clear_running_config()
+
+        self.assertEqual("1500", applier._get_running_config()["PORT"]["Ethernet0"]["mtu"])
+        self.assertEqual(2, self.mock_get_config_db_as_json.call_count)
+
 
 class TestDryRunChangeApplier(unittest.TestCase):
     def test_apply__calls_apply_change_to_config_db(self):
@@ -292,6 +424,7 @@ class TestDryRunChangeApplier(unittest.TestCase):
         # Act
         applier.apply(change)
         applier.remove_backend_tables_from_config(change)
+        applier.clear_running_config()
 
         # Assert
         applier.config_wrapper.apply_change_to_config_db.assert_has_calls([call(change)])
@@ -33,6 +33,25 @@ def get_running_config(scope="localhost"):
     return running_config
 
 
+class MockConfigDb:
+    # Reads & writes of the change applier on the global running_config
+    def get_table(self, tbl):
+        return copy.deepcopy(running_config.get(tbl, {}))
+
+    def get_entry(self, tbl, key):
+        return copy.deepcopy(running_config.get(tbl, {}).get(key, {}))
+
+    def set_entry(self, tbl, key, data):
+        set_entry(self, tbl, key, data)
+
+    def mod_config(self, data):
+        for tbl, entries in data.items():
+            for key, entry in entries.items():
+                if entry is not None:
+                    entry = dict(running_config.get(tbl, {}).get(key, {}), **entry)
+                set_entry(self, tbl, key, entry)
+
+
 class TestFeaturePatchApplication(unittest.TestCase):
     def setUp(self):
         self.config_wrapper = ConfigWrapper()
@@ -104,6 +123,7 @@ class TestFeaturePatchApplication(unittest.TestCase):
         
         # Test patch applier
         mock_set.side_effect = set_entry
+        mock_db.return_value = MockConfigDb()
         patch_applier = self.create_patch_applier(current_config)
         patch_applier.apply(patch)
         result_config = patch_applier.config_wrapper.get_config_db_as_json()
@@ -130,6 +150,7 @@ class TestFeaturePatchApplication(unittest.TestCase):
         current_config = data["current_config"]
         patch = jsonpatch.JsonPatch(data["patch"])
         expected_error_substrings = data["expected_error_substrings"]
+        mock_db.return_value = MockConfigDb()
 
         try:
             patch_applier = self.create_patch_applier(current_config)
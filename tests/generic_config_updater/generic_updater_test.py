@@ -46,6 +46,17 @@ class TestPatchApplier(unittest.TestCase):
         patch_applier.changeapplier.apply.assert_has_calls([call(changes[0]), call(changes[1])])
         patch_applier.patch_wrapper.verify_same_json.assert_has_calls(
             [call(Files.CONFIG_DB_AFTER_MULTI_PATCH, Files.CONFIG_DB_AFTER_MULTI_PATCH)])
+        patch_applier.changeapplier.clear_running_config.assert_called_once_with()
+
+    def test_apply__change_fails__running_config_cleared(self):
+        # Arrange
+        changes = [Mock(), Mock()]
+        patch_applier = self.__create_patch_applier(changes)
+        patch_applier.changeapplier.apply.side_effect = gu.GenericConfigUpdaterError("Failed to apply")
+
+        # Act and assert
+        self.assertRaises(gu.GenericConfigUpdaterError, patch_applier.apply, Files.MULTI_OPERATION_CONFIG_DB_PATCH)
+        patch_applier.changeapplier.clear_running_config.assert_called_once_with()
 
     def __create_patch_applier(self,
                                changes=None,
@@ -401,6 +412,34 @@ class TestGenericUpdateFactory(unittest.TestCase):
         self.any_ignore_non_yang_tables=True
         self.any_ignore_paths=[""]
 
+    def test_get_patch_sorter__validation_processes__passed_to_inner_patch_sorter(self):
+        # Arrange
+        factory = gu.GenericUpdateFactory(validation_processes=4)
+        config_wrapper = Mock()
+        patch_wrapper = Mock()
+
+        # Act
+        strict_sorter = factory.get_patch_sorter(False, [], config_wrapper, patch_wrapper)
+        non_strict_sorter = factory.get_patch_sorter(True, [], config_wrapper, patch_wrapper)
+
+        # Assert
+        for patch_sorter in [strict_sorter, non_strict_sorter]:
+            self.assertEqual(4, patch_sorter.inner_patch_sorter.sort_algorithm_factory.validation_processes)
+
+    def test_get_patch_sorter__sort_algorithm__used_by_patch_sorter(self):
+        # Arrange
+        factory = gu.GenericUpdateFactory(sort_algorithm=ps.Algorithm.ASTAR)
+        config_wrapper = Mock()
+        patch_wrapper = Mock()
+
+        # Act
+        strict_sorter = factory.get_patch_sorter(False, [], config_wrapper, patch_wrapper)
+        non_strict_sorter = factory.get_patch_sorter(True, [], config_wrapper, patch_wrapper)
+
+        # Assert
+        for patch_sorter in [strict_sorter, non_strict_sorter]:
+            self.assertEqual(ps.Algorithm.ASTAR, patch_sorter.algorithm)
+
     def test_create_patch_applier__invalid_config_format__failure(self):
         # Arrange
         factory = gu.GenericUpdateFactory()
@@ -691,6 +730,31 @@ class TestGenericUpdater(unittest.TestCase):
         # Assert
         config_rollbacker.rollback.assert_has_calls([call(self.any_checkpoint_name)])
 
+    def test_rollback__profile__recorded_under_scope(self):
+        # Arrange
+        config_rollbacker = Mock()
+        config_rollbacker.rollback.side_effect = lambda *args: gu.genericUpdaterProfiling.count("changes", 2)
+        factory = Mock()
+        factory.create_config_rollbacker.return_value = config_rollbacker
+        gu.genericUpdaterProfiling.reset()
+
+        # Act
+        gu.GenericUpdater(factory, scope="asic0", profile=True).rollback(self.any_checkpoint_name, self.any_verbose,
+                                                                         self.any_dry_run,
+                                                                         self.any_ignore_non_yang_tables,
+                                                                         self.any_ignore_paths)
+        gu.GenericUpdater(factory, profile=False).rollback(self.any_checkpoint_name, self.any_verbose,
+                                                           self.any_dry_run, self.any_ignore_non_yang_tables,
+                                                           self.any_ignore_paths)
+        gu.genericUpdaterProfiling.count("changes")
+
+        # Assert
+        report = gu.genericUpdaterProfiling.report()
+        gu.genericUpdaterProfiling.reset()
+        self.assertEqual(["asic0"], list(report.keys()))
+        self.assertEqual({"changes": 2}, report["asic0"]["counters"])
+        self.assertEqual(1, report["asic0"]["phases"]["rollback"]["calls"])
+
     def test_checkpoint__creates_rollbacker_and_checkpoint(self):
         # Arrange
         config_rollbacker = Mock()
@@ -1,6 +1,11 @@
 import copy
 import json
 import jsonpatch
+import os
+import pickle
+import shutil
+import tempfile
+import threading
 import sonic_yang
 import unittest
 import mock
@@ -11,14 +16,10 @@ from .gutest_helpers import create_side_effect_dict, Files
 import generic_config_updater.gu_common as gu_common
 
 class TestDryRunConfigWrapper(unittest.TestCase):
-    @patch('generic_config_updater.gu_common.subprocess.Popen')
-    def test_get_config_db_as_json(self, mock_popen):
+    @patch('generic_config_updater.gu_common.ConfigDBPipeConnector')
+    def test_get_config_db_as_json(self, mock_connector):
         config_wrapper = gu_common.DryRunConfigWrapper()
-        mock_proc = MagicMock()
-        mock_proc.communicate = MagicMock(
-            return_value=('{"PORT": {}, "bgpraw": ""}', None))
-        mock_proc.returncode = 0
-        mock_popen.return_value = mock_proc
+        mock_connector.return_value.get_config.return_value = {"PORT": {}, "bgpraw": ""}
         actual = config_wrapper.get_config_db_as_json()
         expected = {"PORT": {}}
         self.assertDictEqual(actual, expected)
@@ -76,6 +77,27 @@ class TestConfigWrapper(unittest.TestCase):
 
         self.assertEqual("/usr/local/yang-models", gu_common.YANG_DIR)
 
+    @patch('generic_config_updater.gu_common.ConfigDBPipeConnector')
+    def test_get_config_db_as_json__read_in_process(self, mock_connector):
+        # Arrange
+        mock_connector.return_value.get_config.return_value = {
+            "VLAN_MEMBER": {("Vlan1000", "Ethernet0"): {"tagging_mode": "untagged"}},
+            "ACL_TABLE": {"EVERFLOW": {"ports": ["Ethernet0", "Ethernet4"]}},
+            "bgpraw": "",
+        }
+        config_wrapper = gu_common.ConfigWrapper(scope="asic0")
+
+        # Act
+        actual = config_wrapper.get_config_db_as_json()
+
+        # Assert
+        mock_connector.assert_called_once_with(use_unix_socket_path=True, namespace="asic0")
+        mock_connector.return_value.connect.assert_called_once_with()
+        self.assertDictEqual({
+            "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}},
+            "ACL_TABLE": {"EVERFLOW": {"ports": ["Ethernet0", "Ethernet4"]}},
+        }, actual)
+
     @patch('generic_config_updater.gu_common.subprocess.Popen')
     def test_get_config_db_as_text(self, mock_popen):
         config_wrapper = gu_common.ConfigWrapper()
@@ -494,6 +516,255 @@ class TestConfigWrapper(unittest.TestCase):
         check(sy1, config_wrapper.sonic_yang_with_loaded_models)
         check(sy2, config_wrapper.sonic_yang_with_loaded_models)
 
+
+class FakeYangContext:
+    def __init__(self):
+        self.schema_modules = []
+
+    def parse_module_path(self, yang_file, format):
+        self.schema_modules.append(os.path.basename(yang_file))
+        return yang_file
+
+
+class FakeSonicYang:
+    instances = []
+
+    def __init__(self, yang_dir, print_log_enabled=False):
+        self.yang_dir = yang_dir
+        self.loaded_models = 0
+        self.ctx = FakeYangContext()
+        FakeSonicYang.instances.append(self)
+
+    def loadYangModel(self):
+        self.loaded_models += 1
+        self.yangFiles = ["sonic-port", "sonic-vlan"]
+        self.yJson = [{"module": {"@name": name}} for name in self.yangFiles]
+        self.confDbYangMap = {"PORT": {"module": "sonic-port"}}
+        self.preProcessedYang = {}
+
+
+class TestYangModelCache(unittest.TestCase):
+    def setUp(self):
+        FakeSonicYang.instances = []
+        self.tmp_dir = tempfile.mkdtemp()
+        self.yang_dir = os.path.join(self.tmp_dir, "yang-models")
+        os.mkdir(self.yang_dir)
+        for name in ["sonic-port", "sonic-vlan"]:
+            with open(os.path.join(self.yang_dir, name + ".yang"), "w") as f:
+                f.write("module {} {{}}".format(name))
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__same_models__loaded_once_per_process(self):
+        # Arrange
+        cache = gu_common.YangModelCache(self.cache_dir)
+
+        # Act
+        sy1 = cache.get(self.yang_dir)
+        sy2 = cache.get(self.yang_dir)
+
+        # Assert
+        self.assertIsNot(sy1, sy2)
+        self.assertIsNot(sy1.ctx, sy2.ctx)
+        self.assertEqual(1, sy1.loaded_models)
+        self.assertEqual(0, sy2.loaded_models)
+        self.assertEqual(["sonic-port.yang", "sonic-vlan.yang"], sorted(sy2.ctx.schema_modules))
+        self.assertEqual(sy1.confDbYangMap, sy2.confDbYangMap)
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__concurrent_calls__own_sonic_yang_per_call_models_loaded_once(self):
+        # Arrange
+        cache = gu_common.YangModelCache(self.cache_dir)
+        thread_count = 8
+        barrier = threading.Barrier(thread_count)
+        sonic_yangs = [None] * thread_count
+
+        def get(index):
+            barrier.wait()
+            sonic_yangs[index] = cache.get(self.yang_dir)
+
+        threads = [threading.Thread(target=get, args=(index,)) for index in range(thread_count)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(thread_count, len({id(sy) for sy in sonic_yangs}))
+        self.assertEqual(thread_count, len({id(sy.ctx) for sy in sonic_yangs}))
+        self.assertEqual(1, sum(sy.loaded_models for sy in sonic_yangs))
+        for sy in sonic_yangs:
+            self.assertEqual({"PORT": {"module": "sonic-port"}}, sy.confDbYangMap)
+            if not sy.loaded_models:
+                self.assertEqual(["sonic-port.yang", "sonic-vlan.yang"], sorted(sy.ctx.schema_modules))
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__models_changed__reloaded(self):
+        # Arrange
+        cache = gu_common.YangModelCache(self.cache_dir)
+        sy1 = cache.get(self.yang_dir)
+        with open(os.path.join(self.yang_dir, "sonic-port.yang"), "a") as f:
+            f.write("\n")
+
+        # Act
+        sy2 = cache.get(self.yang_dir)
+
+        # Assert
+        self.assertIsNot(sy1, sy2)
+        self.assertEqual(1, sy2.loaded_models)
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__new_process__models_read_from_disk(self):
+        # Arrange
+        gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+
+        # Act
+        sy = gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+
+        # Assert
+        self.assertEqual(0, sy.loaded_models)
+        self.assertEqual(["sonic-port.yang", "sonic-vlan.yang"], sorted(sy.ctx.schema_modules))
+        self.assertEqual(["sonic-port", "sonic-vlan"], sy.yangFiles)
+        self.assertEqual({"PORT": {"module": "sonic-port"}}, sy.confDbYangMap)
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__models_changed_on_disk__disk_cache_not_used(self):
+        # Arrange
+        gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+        with open(os.path.join(self.yang_dir, "sonic-vlan.yang"), "w") as f:
+            f.write("module sonic-vlan { }")
+
+        # Act
+        sy = gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+
+        # Assert
+        self.assertEqual(1, sy.loaded_models)
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__sonic_yang_changed__disk_cache_not_used(self):
+        # Arrange
+        gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+        cache = gu_common.YangModelCache(self.cache_dir)
+        cache._library_hash = "other sonic_yang"
+
+        # Act
+        sy = cache.get(self.yang_dir)
+
+        # Assert
+        self.assertEqual(1, sy.loaded_models)
+
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang', FakeSonicYang)
+    def test_get__cache_file_unreadable__disk_cache_not_used(self):
+        for content in [b"garbage", pickle.dumps(["not", "a", "dict"]),
+                        pickle.dumps({"content_hash": None, "models": {}})]:
+            # Arrange
+            gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+            cache_file = os.path.join(self.cache_dir, gu_common.YangModelCache.CACHE_FILE)
+            with open(cache_file, "wb") as f:
+                f.write(content)
+
+            # Act
+            sy = gu_common.YangModelCache(self.cache_dir).get(self.yang_dir)
+
+            # Assert
+            self.assertEqual(1, sy.loaded_models)
+            # The cache file is rewritten
+            self.assertEqual(0, gu_common.YangModelCache(self.cache_dir).get(self.yang_dir).loaded_models)
+
+
+class TestGenericUpdaterProfiling(unittest.TestCase):
+    def test_phase__not_profiled__nothing_recorded(self):
+        # Arrange
+        profiling = gu_common.GenericUpdaterProfiling()
+
+        # Act
+        with profiling.phase("sort"):
+            profiling.count("move_validations")
+
+        # Assert
+        self.assertEqual({}, profiling.report())
+
+    def test_phase__profiled__calls_and_times_recorded(self):
+        # Arrange
+        profiling = gu_common.GenericUpdaterProfiling()
+
+        # Act
+        with profiling.profiled("localhost"):
+            with profiling.phase("sort"):
+                for _ in range(2):
+                    with profiling.phase("yang_validation"):
+                        profiling.count("yang_validations")
+            profiling.count("sort_explored_states", 5)
+            with self.assertRaises(ValueError):
+                with profiling.phase("apply_changes"):
+                    raise ValueError()
+        profiling.count("sort_explored_states")
+
+        # Assert
+        report = profiling.report()["localhost"]
+        self.assertEqual({"yang_validations": 2, "sort_explored_states": 5}, report["counters"])
+        self.assertEqual({"sort": 1, "yang_validation": 2, "apply_changes": 1},
+                         {phase: totals["calls"] for phase, totals in report["phases"].items()})
+        self.assertGreaterEqual(report["phases"]["sort"]["wall_time"], report["phases"]["yang_validation"]["wall_time"])
+        self.assertGreaterEqual(report["phases"]["sort"]["cpu_time"], 0)
+
+    def test_profiled__not_enabled__nothing_recorded_and_state_restored(self):
+        # Arrange
+        profiling = gu_common.GenericUpdaterProfiling()
+
+        # Act
+        with profiling.profiled("localhost"):
+            with profiling.profiled("asic0", enabled=False):
+                profiling.count("changes")
+            profiling.count("changes", 2)
+
+        # Assert
+        self.assertEqual({"localhost": {"phases": {}, "counters": {"changes": 2}}}, profiling.report())
+
+    def test_profiled__threads__recorded_per_scope(self):
+        # Arrange
+        profiling = gu_common.GenericUpdaterProfiling()
+        barrier = threading.Barrier(2)
+
+        def update(scope, changes):
+            with profiling.profiled(scope):
+                # Both threads are within their block at the same time
+                barrier.wait()
+                profiling.count("changes", changes)
+                barrier.wait()
+
+        # Act
+        threads = [threading.Thread(target=update, args=(scope, changes))
+                   for scope, changes in [("asic0", 1), ("asic1", 2)]]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        report = profiling.report()
+        self.assertEqual({"changes": 1}, report["asic0"]["counters"])
+        self.assertEqual({"changes": 2}, report["asic1"]["counters"])
+
+    def test_reset__recorded_data_cleared(self):
+        # Arrange
+        profiling = gu_common.GenericUpdaterProfiling()
+        with profiling.profiled("localhost"):
+            with profiling.phase("sort"):
+                profiling.count("move_validations")
+
+        # Act
+        profiling.reset()
+
+        # Assert
+        self.assertEqual({}, profiling.report())
+
+
 class TestPatchWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -906,6 +1177,32 @@ class TestPathAddressing(unittest.TestCase):
         # Assert
         self.assertEqual(expected, actual)
 
+    def test_find_ref_paths__config_changed__same_ref_paths_as_new_path_addressing(self):
+        # Arrange
+        config = Files.CROPPED_CONFIG_DB_AS_JSON
+        changes = [
+            [{"op": "remove", "path": "/VLAN_MEMBER/Vlan1000|Ethernet0"}],
+            [{"op": "remove", "path": "/ACL_TABLE/EVERFLOWV6/ports/0"}],
+            [{"op": "add", "path": "/ACL_TABLE/EVERFLOW/ports/1", "value": "Ethernet8"}],
+            [{"op": "remove", "path": "/VLAN_MEMBER"},
+             {"op": "remove", "path": "/VLAN"}],
+        ]
+        paths = ["", "/PORT", "/PORT/Ethernet0", "/PORT/Ethernet4", "/PORT/Ethernet8", "/VLAN/Vlan1000"]
+        # Querying the config first, so the changed configs are queried after it
+        self.path_addressing.find_ref_paths("", config)
+
+        for change in changes:
+            changed_config = jsonpatch.JsonPatch(change).apply(config)
+            new_path_addressing = gu_common.PathAddressing(gu_common.ConfigWrapper())
+            for path in paths:
+                with self.subTest(change=change, path=path):
+                    # Act
+                    actual = self.path_addressing.find_ref_paths(path, changed_config)
+
+                    # Assert
+                    expected = new_path_addressing.find_ref_paths(path, changed_config)
+                    self.assertEqual(expected, actual)
+
     def test_convert_path_to_xpath(self):
         def check(path, xpath, config=None):
             if not config:
@@ -1116,3 +1413,200 @@ class TestPathAddressing(unittest.TestCase):
         check(config={"ANOTHER_TABLE": {}, "TABLE":{"key1":{"key11":{"key111":[1,2,3,4,5]}}}},
               path="/TABLE/key1/key11/key111/5",
               expected=False)
+
+
+class FakeDataNode:
+    def __init__(self, path, nodetype, value=None, refers_to=None):
+        self._path = path
+        self.nodetype = nodetype
+        self.value = value
+        # Table whose key leaf this leaf refers to
+        self.refers_to = refers_to
+        self.children = []
+
+    def path(self):
+        return self._path
+
+    def schema(self):
+        return Mock(nodetype=Mock(return_value=self.nodetype))
+
+    def subtype(self):
+        if self.value is None:
+            return None
+        return Mock(value_str=Mock(return_value=self.value))
+
+    def tree_dfs(self):
+        yield self
+        for child in self.children:
+            yield from child.tree_dfs()
+
+
+class FakeRefSonicYang:
+    """
+    Models PORT referenced by the 'port' key of VLAN_MEMBER and by the 'ports' leaf-list of ACL_TABLE.
+    The xpaths are the config paths, with '/#<key>' appended for key leaves.
+    """
+    KEYS = {
+        "PORT": lambda key: [("name", key, None)],
+        "VLAN_MEMBER": lambda key: [("name", key.split("|")[0], None), ("port", key.split("|")[1], "PORT")],
+        "ACL_TABLE": lambda key: [("name", key, None)],
+    }
+    LEAF_LISTS = {"ports": "PORT"}
+    instances = []
+
+    def __init__(self):
+        self.confDbYangMap = {table: {} for table in FakeRefSonicYang.KEYS}
+        self.nodes = {}
+        self.queries = 0
+        self.root = Mock()
+        FakeRefSonicYang.instances.append(self)
+
+    def loadData(self, config):
+        tables = []
+        for table, entries in config.items():
+            if table not in self.confDbYangMap:
+                continue
+            table_node = self._add_node(f"/{table}", gu_common.ly.LYS_CONTAINER)
+            tables.append(table_node)
+            for key, fields in entries.items():
+                entry_node = self._add_node(f"/{table}/{key}", gu_common.ly.LYS_LIST, parent=table_node)
+                for name, value, refers_to in FakeRefSonicYang.KEYS[table](key):
+                    self._add_node(f"/{table}/{key}/#{name}", gu_common.ly.LYS_LEAF, value, refers_to, entry_node)
+                for field, value in fields.items():
+                    if isinstance(value, list):
+                        list_node = self._add_node(f"/{table}/{key}/{field}", None, parent=entry_node)
+                        for index, item in enumerate(value):
+                            self._add_node(f"/{table}/{key}/{field}/{index}", gu_common.ly.LYS_LEAFLIST, item,
+                                           FakeRefSonicYang.LEAF_LISTS.get(field), list_node)
+                    else:
+                        self._add_node(f"/{table}/{key}/{field}", gu_common.ly.LYS_LEAF, value, parent=entry_node)
+
+        self.root.tree_for.return_value = tables
+        self.root.find_path.side_effect = \
+            lambda xpath: Mock(data=Mock(return_value=[self.nodes[xpath]] if xpath in self.nodes else []))
+
+    def find_data_dependencies(self, xpath):
+        self.queries += 1
+        node = self.nodes[xpath]
+        if not xpath.endswith("/#name"):
+            return []
+        table = xpath.split("/")[1]
+        return [ref_node.path() for ref_node in self.nodes.values()
+                if ref_node.refers_to == table and ref_node.value == node.value]
+
+    def _add_node(self, path, nodetype, value=None, refers_to=None, parent=None):
+        node = FakeDataNode(path, nodetype, value, refers_to)
+        self.nodes[path] = node
+        if parent is not None:
+            parent.children.append(node)
+        return node
+
+
+class TestReverseRefIndex(unittest.TestCase):
+    def setUp(self):
+        FakeRefSonicYang.instances = []
+        self.config = {
+            "PORT": {"Ethernet0": {"lanes": "0"}, "Ethernet4": {"lanes": "4"}, "Ethernet8": {"lanes": "8"}},
+            "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}},
+            "ACL_TABLE": {"ACL1": {"ports": ["Ethernet0", "Ethernet4"]}},
+            "TABLE_WITHOUT_YANG": {"key": {"field": "Ethernet0"}}
+        }
+        self.path_addressing = self.create_path_addressing()
+
+    def create_path_addressing(self):
+        path_addressing = gu_common.PathAddressing(Mock())
+        path_addressing._create_sonic_yang_with_loaded_models = FakeRefSonicYang
+        path_addressing.convert_path_to_xpath = lambda path, config, sy: path or "/"
+        path_addressing.convert_xpath_to_path = lambda xpath, config, sy: xpath.split("/#")[0]
+        return path_addressing
+
+    def test_find_ref_paths__returns_ref_paths(self):
+        # Act and assert
+        self.assertEqual(["/ACL_TABLE/ACL1/ports/0", "/VLAN_MEMBER/Vlan1000|Ethernet0"],
+                         self.path_addressing.find_ref_paths("/PORT/Ethernet0", self.config))
+        self.assertEqual(["/ACL_TABLE/ACL1/ports/1"],
+                         self.path_addressing.find_ref_paths("/PORT/Ethernet4", self.config))
+        self.assertEqual([], self.path_addressing.find_ref_paths("/PORT/Ethernet0/lanes", self.config))
+        self.assertEqual(["/ACL_TABLE/ACL1/ports/0", "/ACL_TABLE/ACL1/ports/1", "/VLAN_MEMBER/Vlan1000|Ethernet0"],
+                         self.path_addressing.find_ref_paths("", self.config))
+
+    def test_find_ref_paths__same_config__index_reused(self):
+        # Act
+        self.path_addressing.find_ref_paths("/PORT/Ethernet0", self.config)
+        self.path_addressing.find_ref_paths("/PORT/Ethernet4", copy.deepcopy(self.config))
+        self.path_addressing.find_ref_paths("/PORT", self.config)
+
+        # Assert
+        self.assertEqual(1, len(FakeRefSonicYang.instances))
+
+    def test_find_ref_paths__config_modified_after_query__index_not_affected(self):
+        # Arrange
+        config = copy.deepcopy(self.config)
+        self.path_addressing.find_ref_paths("", config)
+
+        # Act
+        config["ACL_TABLE"]["ACL1"]["ports"].append("Ethernet8")
+        actual = self.path_addressing.find_ref_paths("/PORT/Ethernet8", config)
+
+        # Assert
+        self.assertEqual(["/ACL_TABLE/ACL1/ports/2"], actual)
+
+    def test_find_ref_paths__same_path__looked_up_once(self):
+        # Arrange
+        self.path_addressing.find_ref_paths("/PORT/Ethernet0", self.config)
+        queries = FakeRefSonicYang.instances[0].queries
+
+        # Act
+        actual = self.path_addressing.find_ref_paths("/PORT/Ethernet0", copy.deepcopy(self.config))
+
+        # Assert
+        self.assertEqual(["/ACL_TABLE/ACL1/ports/0", "/VLAN_MEMBER/Vlan1000|Ethernet0"], actual)
+        self.assertEqual(queries, FakeRefSonicYang.instances[0].queries)
+
+    def test_find_ref_paths__config_changed__same_ref_paths_as_new_path_addressing(self):
+        changes = [
+            [{"op": "remove", "path": "/VLAN_MEMBER/Vlan1000|Ethernet0"}],
+            [{"op": "add", "path": "/VLAN_MEMBER/Vlan1000|Ethernet8", "value": {}}],
+            [{"op": "remove", "path": "/ACL_TABLE/ACL1/ports/0"}],
+            [{"op": "add", "path": "/ACL_TABLE/ACL1/ports/0", "value": "Ethernet8"}],
+            [{"op": "add", "path": "/ACL_TABLE/ACL2", "value": {"ports": ["Ethernet4", "Ethernet8"]}}],
+            [{"op": "remove", "path": "/PORT/Ethernet4"}],
+            [{"op": "add", "path": "/PORT/Ethernet12", "value": {"lanes": "12"}},
+             {"op": "add", "path": "/ACL_TABLE/ACL1/ports/-", "value": "Ethernet12"}],
+            [{"op": "replace", "path": "/TABLE_WITHOUT_YANG/key/field", "value": "Ethernet4"}],
+            [{"op": "remove", "path": "/ACL_TABLE"}],
+        ]
+        paths = ["", "/PORT", "/PORT/Ethernet0", "/PORT/Ethernet4", "/PORT/Ethernet8", "/PORT/Ethernet12",
+                 "/VLAN_MEMBER", "/ACL_TABLE"]
+
+        for change in changes:
+            with self.subTest(change=change):
+                # Arrange
+                path_addressing = self.create_path_addressing()
+                for path in paths:
+                    path_addressing.find_ref_paths(path, self.config)
+                changed_config = jsonpatch.JsonPatch(change).apply(self.config)
+
+                # Act
+                actual = [path_addressing.find_ref_paths(path, changed_config) for path in paths]
+
+                # Assert
+                expected = [self.create_path_addressing().find_ref_paths(path, changed_config) for path in paths]
+                self.assertEqual(expected, actual)
+
+    def test_find_ref_paths__more_configs_than_cache_size__least_recent_dropped(self):
+        # Arrange
+        configs = []
+        for i in range(gu_common.PathAddressing.REF_INDEX_CACHE_SIZE + 1):
+            config = copy.deepcopy(self.config)
+            config["PORT"][f"Ethernet{100 + i}"] = {"lanes": str(100 + i)}
+            configs.append(config)
+
+        # Act
+        for config in configs:
+            self.path_addressing.find_ref_paths("/PORT/Ethernet0", config)
+        self.path_addressing.find_ref_paths("/PORT/Ethernet0", configs[-1])
+        self.path_addressing.find_ref_paths("/PORT/Ethernet0", configs[0])
+
+        # Assert
+        self.assertEqual(len(configs) + 1, len(FakeRefSonicYang.instances))
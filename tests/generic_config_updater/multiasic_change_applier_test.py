@@ -178,11 +178,11 @@ class TestMultiAsicChangeApplier(unittest.TestCase):
                 assert(not result)
 
     @patch('generic_config_updater.change_applier.get_config_db_as_json', autospec=True)
-    @patch('generic_config_updater.change_applier.ConfigDBConnector', autospec=True)
-    def test_apply_change_default_scope(self, mock_ConfigDBConnector, mock_get_running_config):
-        # Setup mock for ConfigDBConnector
+    @patch('generic_config_updater.change_applier.ConfigDBPipeConnector', autospec=True)
+    def test_apply_change_default_scope(self, mock_ConfigDBPipeConnector, mock_get_running_config):
+        # Setup mock for ConfigDBPipeConnector
         mock_db = MagicMock()
-        mock_ConfigDBConnector.return_value = mock_db
+        mock_ConfigDBPipeConnector.return_value = mock_db
 
         # Setup mock for json.load to return some running configuration
         mock_get_running_config.side_effect = mock_get_running_config_side_effect
@@ -196,15 +196,15 @@ class TestMultiAsicChangeApplier(unittest.TestCase):
         # Call the apply method with the change object
         applier.apply(change)
 
-        # Assert ConfigDBConnector called with the correct namespace
-        mock_ConfigDBConnector.assert_called_once_with(use_unix_socket_path=True, namespace="")
+        # Assert ConfigDBPipeConnector called with the correct namespace
+        mock_ConfigDBPipeConnector.assert_called_once_with(use_unix_socket_path=True, namespace="")
 
     @patch('generic_config_updater.change_applier.get_config_db_as_json', autospec=True)
-    @patch('generic_config_updater.change_applier.ConfigDBConnector', autospec=True)
-    def test_apply_change_given_scope(self, mock_ConfigDBConnector, mock_get_running_config):
-        # Setup mock for ConfigDBConnector
+    @patch('generic_config_updater.change_applier.ConfigDBPipeConnector', autospec=True)
+    def test_apply_change_given_scope(self, mock_ConfigDBPipeConnector, mock_get_running_config):
+        # Setup mock for ConfigDBPipeConnector
         mock_db = MagicMock()
-        mock_ConfigDBConnector.return_value = mock_db
+        mock_ConfigDBPipeConnector.return_value = mock_db
         mock_get_running_config.side_effect = mock_get_running_config_side_effect
 
         # Instantiate ChangeApplier with the default scope
@@ -216,15 +216,15 @@ class TestMultiAsicChangeApplier(unittest.TestCase):
         # Call the apply method with the change object
         applier.apply(change)
 
-        # Assert ConfigDBConnector called with the correct scope
-        mock_ConfigDBConnector.assert_called_once_with(use_unix_socket_path=True, namespace="asic0")
+        # Assert ConfigDBPipeConnector called with the correct scope
+        mock_ConfigDBPipeConnector.assert_called_once_with(use_unix_socket_path=True, namespace="asic0")
 
     @patch('generic_config_updater.change_applier.get_config_db_as_json', autospec=True)
-    @patch('generic_config_updater.change_applier.ConfigDBConnector', autospec=True)
-    def test_apply_change_failure(self, mock_ConfigDBConnector, mock_get_running_config):
-        # Setup mock for ConfigDBConnector
+    @patch('generic_config_updater.change_applier.ConfigDBPipeConnector', autospec=True)
+    def test_apply_change_failure(self, mock_ConfigDBPipeConnector, mock_get_running_config):
+        # Setup mock for ConfigDBPipeConnector
         mock_db = MagicMock()
-        mock_ConfigDBConnector.return_value = mock_db
+        mock_ConfigDBPipeConnector.return_value = mock_db
 
         # Setup mock for json.load to return some running configuration
         mock_get_running_config.side_effect = Exception("Failed to get running config")
@@ -242,11 +242,11 @@ class TestMultiAsicChangeApplier(unittest.TestCase):
         self.assertTrue('Failed to get running config' in str(context.exception))
 
     @patch('generic_config_updater.change_applier.get_config_db_as_json', autospec=True)
-    @patch('generic_config_updater.change_applier.ConfigDBConnector', autospec=True)
-    def test_apply_patch_with_empty_tables_failure(self, mock_ConfigDBConnector, mock_get_running_config):
-        # Setup mock for ConfigDBConnector
+    @patch('generic_config_updater.change_applier.ConfigDBPipeConnector', autospec=True)
+    def test_apply_patch_with_empty_tables_failure(self, mock_ConfigDBPipeConnector, mock_get_running_config):
+        # Setup mock for ConfigDBPipeConnector
         mock_db = MagicMock()
-        mock_ConfigDBConnector.return_value = mock_db
+        mock_ConfigDBPipeConnector.return_value = mock_db
 
         # Setup mock for json.load to simulate configuration where crucial tables are unexpectedly empty
         def mock_get_empty_running_config_side_effect():
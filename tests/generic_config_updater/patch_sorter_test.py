@@ -1,6 +1,10 @@
+import copy
+import os
+import weakref
 from collections import OrderedDict
 import jsonpatch
 import unittest
+from unittest import mock
 from unittest.mock import MagicMock, Mock
 
 import generic_config_updater.patch_sorter as ps
@@ -108,6 +112,98 @@ class TestDiff(unittest.TestCase):
         self.assertEqual(diff, other_diff)
         self.assertTrue(diff == other_diff)
 
+    def test_hash__applied_move__same_hash_as_new_diff(self):
+        # Arrange
+        current_config = {
+            "PORT": {"Ethernet0": {"lanes": "65", "speed": "10000"}},
+            "VLAN": {"Vlan1000": {"vlanid": "1000"}},
+            "ACL_TABLE": {"EVERFLOW": {"ports": ["Ethernet0", "Ethernet4"]}},
+        }
+        target_config = {"PORT": {"Ethernet0": {"lanes": "65"}}}
+        patches = [
+            [{"op": "replace", "path": "/PORT/Ethernet0/speed", "value": "25000"}],
+            [{"op": "remove", "path": "/VLAN/Vlan1000"}],
+            [{"op": "add", "path": "/VLAN_MEMBER", "value": {"Vlan1000|Ethernet0": {}}}],
+            [{"op": "add", "path": "/ACL_TABLE/EVERFLOW/ports/0", "value": "Ethernet8"}],
+            [{"op": "remove", "path": "/PORT"}],
+            [{"op": "replace", "path": "", "value": {}}],
+        ]
+        diff = ps.Diff(current_config, target_config)
+        hash(diff)
+
+        for patch in patches:
+            move = ps.JsonMove.from_patch(jsonpatch.JsonPatch(patch))
+
+            # Act
+            diff = diff.apply_move(move)
+
+            # Assert
+            self.assertEqual(hash(ps.Diff(diff.current_config, target_config)), hash(diff))
+
+    def test_apply_move_in_place__same_as_apply_move__undo_restores_config(self):
+        # Arrange
+        current_config = {
+            "PORT": {"Ethernet0": {"lanes": "65"}, "Ethernet4": {"lanes": "66"}, "Ethernet8": {"lanes": "67"}},
+            "ACL_TABLE": {"EVERFLOW": {"ports": ["Ethernet0", "Ethernet4"]}},
+        }
+        expected_config = copy.deepcopy(current_config)
+        port_table = current_config["PORT"]
+        patches = [
+            [{"op": "remove", "path": "/PORT/Ethernet4"}],
+            [{"op": "replace", "path": "/PORT/Ethernet0/lanes", "value": "70"}],
+            [{"op": "add", "path": "/ACL_TABLE/EVERFLOW/ports/1", "value": "Ethernet8"}],
+            [{"op": "add", "path": "/VLAN", "value": {"Vlan1000": {"vlanid": "1000"}}}],
+            [{"op": "remove", "path": "/ACL_TABLE/EVERFLOW/ports/0"}],
+        ]
+        diff = ps.Diff(current_config, {})
+        hash(diff)
+
+        # Act
+        undos = []
+        for patch in patches:
+            move = ps.JsonMove.from_patch(jsonpatch.JsonPatch(patch))
+            expected = diff.apply_move(move)
+            undos.append(diff.apply_move_in_place(move))
+
+            # Assert
+            self.assertEqual(expected.current_config, diff.current_config)
+            self.assertEqual(hash(expected), hash(diff))
+
+        for undo in reversed(undos):
+            diff.undo_move(undo)
+
+        # Assert
+        self.assertEqual(expected_config, diff.current_config)
+        self.assertEqual(list(expected_config["PORT"]), list(diff.current_config["PORT"]))
+        self.assertIs(current_config, diff.current_config)
+        self.assertIs(port_table, diff.current_config["PORT"])
+        self.assertEqual(hash(ps.Diff(expected_config, {})), hash(diff))
+
+    def test_hash__key_order__same_hash(self):
+        # Arrange
+        diff1 = ps.Diff({"PORT": {"Ethernet0": {}, "Ethernet4": {}}, "VLAN": {}}, {})
+        diff2 = ps.Diff({"VLAN": {}, "PORT": {"Ethernet4": {}, "Ethernet0": {}}}, {})
+
+        # Act and assert
+        self.assertEqual(hash(diff1), hash(diff2))
+
+
+class TestConfigHash(unittest.TestCase):
+    def test_updated__shares_unchanged_nodes(self):
+        # Arrange
+        config = {"PORT": {"Ethernet0": {"lanes": "65"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+        config_hash = ps.ConfigHash.build(config)
+        new_config = {"PORT": {"Ethernet0": {"lanes": "66"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+
+        # Act
+        new_hash = config_hash.updated(new_config, ["PORT", "Ethernet0", "lanes"])
+
+        # Assert
+        self.assertEqual(ps.ConfigHash.build(new_config).value, new_hash.value)
+        self.assertNotEqual(config_hash.value, new_hash.value)
+        self.assertIs(config_hash.children["VLAN"], new_hash.children["VLAN"])
+        self.assertEqual(ps.ConfigHash.build(config).value, config_hash.value)
+
 class TestJsonMove(unittest.TestCase):
     def setUp(self):
         self.operation_wrapper = OperationWrapper()
@@ -424,6 +520,19 @@ class TestJsonMove(unittest.TestCase):
         self.assertListEqual(expected_current_config_tokens, jsonmove.current_config_tokens)
         self.assertEqual(expected_target_config_tokens, jsonmove.target_config_tokens)
 
+
+class EvenMoveValidator:
+    # Module level, so that it can be used by the workers of a MoveValidationPool
+    def validate(self, move, diff):
+        return move % 2 == 0
+
+
+class AllowedMoveValidator:
+    # Module level, so that it can be used by the workers of a MoveValidationPool
+    def validate(self, move, diff):
+        return move in diff.current_config["ALLOWED"]
+
+
 class TestMoveWrapper(unittest.TestCase):
     def setUp(self):
         self.any_current_config = {}
@@ -741,6 +850,55 @@ class TestMoveWrapper(unittest.TestCase):
         # Act and assert
         self.assertTrue(move_wrapper.validate(self.any_move, self.any_diff))
 
+    def test_get_valid_moves__returns_valid_moves_in_order(self):
+        # Arrange
+        move_wrapper = ps.MoveWrapper([], [], [], [EvenMoveValidator()])
+
+        # Act
+        actual = list(move_wrapper.get_valid_moves(range(10), self.any_diff))
+
+        # Assert
+        self.assertListEqual([0, 2, 4, 6, 8], actual)
+
+    def test_get_valid_moves__validation_pool__same_moves_in_order(self):
+        # Arrange
+        move_validators = [EvenMoveValidator()]
+        move_wrapper = ps.MoveWrapper([], [], [], move_validators, ps.MoveValidationPool(move_validators, 3))
+
+        # Act
+        try:
+            actual = list(move_wrapper.get_valid_moves(range(10), ps.Diff({"PORT": {}}, {})))
+        finally:
+            move_wrapper.close()
+
+        # Assert
+        self.assertListEqual([0, 2, 4, 6, 8], actual)
+        self.assertIsNone(move_wrapper.validation_pool.executor)
+
+    def test_get_valid_moves__validation_pool__configs_sent_once_per_state(self):
+        # Arrange
+        move_validators = [AllowedMoveValidator()]
+        validation_pool = ps.MoveValidationPool(move_validators, 3)
+        move_wrapper = ps.MoveWrapper([], [], [], move_validators, validation_pool)
+
+        # Act
+        try:
+            with mock.patch.object(ps.pickle, "dump", wraps=ps.pickle.dump) as mock_dump:
+                actual1 = list(move_wrapper.get_valid_moves(range(10), ps.Diff({"ALLOWED": [0, 2, 7]}, {})))
+                actual2 = list(move_wrapper.get_valid_moves(range(10), ps.Diff({"ALLOWED": [0, 2, 7]}, {})))
+                actual3 = list(move_wrapper.get_valid_moves(range(10), ps.Diff({"ALLOWED": [1]}, {})))
+            state_dir = validation_pool.state_dir
+        finally:
+            move_wrapper.close()
+
+        # Assert
+        self.assertListEqual([0, 2, 7], actual1)
+        self.assertListEqual([0, 2, 7], actual2)
+        self.assertListEqual([1], actual3)
+        # Once for each distinct state, not for each move or batch
+        self.assertEqual(2, mock_dump.call_count)
+        self.assertFalse(os.path.exists(state_dir))
+
     def test_simulate__applies_move(self):
         # Arrange
         diff = Mock()
@@ -3249,12 +3407,40 @@ class TestSortAlgorithmFactory(unittest.TestCase):
     def test_dfs_sorter(self):
         self.verify(ps.Algorithm.DFS, ps.DfsSorter)
 
+    def test_create__validation_processes__validation_pool_used(self):
+        # Arrange
+        config_wrapper = Mock()
+        factory = ps.SortAlgorithmFactory(OperationWrapper(), config_wrapper, PathAddressing(config_wrapper), 4)
+
+        # Act
+        sorter = factory.create(ps.Algorithm.DFS)
+
+        # Assert
+        validation_pool = sorter.move_wrapper.validation_pool
+        self.assertIsInstance(validation_pool, ps.MoveValidationPool)
+        self.assertEqual(4, validation_pool.processes)
+        self.assertIs(sorter.move_wrapper.move_validators, validation_pool.move_validators)
+
+    def test_create__no_validation_processes__moves_validated_in_process(self):
+        # Arrange
+        config_wrapper = Mock()
+        factory = ps.SortAlgorithmFactory(OperationWrapper(), config_wrapper, PathAddressing(config_wrapper))
+
+        # Act
+        sorter = factory.create(ps.Algorithm.DFS)
+
+        # Assert
+        self.assertIsNone(sorter.move_wrapper.validation_pool)
+
     def test_bfs_sorter(self):
         self.verify(ps.Algorithm.BFS, ps.BfsSorter)
 
     def test_memoization_sorter(self):
         self.verify(ps.Algorithm.MEMOIZATION, ps.MemoizationSorter)
 
+    def test_astar_sorter(self):
+        self.verify(ps.Algorithm.ASTAR, ps.AStarSorter)
+
     def verify(self, algo, algo_class):
         # Arrange
         config_wrapper = ConfigWrapper()
@@ -3288,6 +3474,143 @@ class TestSortAlgorithmFactory(unittest.TestCase):
         self.assertCountEqual(expected_extenders, actual_extenders)
         self.assertCountEqual(expected_validator, actual_validators)
 
+
+class TableMoveGenerator:
+    # Generates one move per table different from the target config
+    def generate(self, diff):
+        current_config, target_config = diff.current_config, diff.target_config
+        for table in sorted(current_config.keys() | target_config.keys()):
+            if table not in target_config:
+                yield ps.JsonMove(diff, OperationType.REMOVE, [table])
+            elif table not in current_config:
+                yield ps.JsonMove(diff, OperationType.ADD, [table], [table])
+            elif current_config[table] != target_config[table]:
+                yield ps.JsonMove(diff, OperationType.REPLACE, [table], [table])
+
+
+class TableDependencyMoveValidator:
+    # A table can only exist if the tables it refers to exist
+    def __init__(self, dependencies):
+        self.dependencies = dependencies
+
+    def validate(self, move, diff):
+        simulated_config = move.apply(diff.current_config)
+        return all(dependency in simulated_config
+                   for table in simulated_config for dependency in self.dependencies.get(table, []))
+
+
+class TestAStarSorter(unittest.TestCase):
+    def setUp(self):
+        self.current_config = {
+            "PORT": {"Ethernet0": {"alias": "eth0"}},
+            "OLD_TABLE": {"key": {"field": "value"}}
+        }
+        self.target_config = {
+            "PORT": {"Ethernet0": {"alias": "eth0", "speed": "100000"}},
+            "ACL_TABLE": {"ACL1": {"ports": ["Ethernet0"]}},
+            "ACL_RULE": {"ACL1|RULE1": {"PRIORITY": "1"}}
+        }
+        self.validator = TableDependencyMoveValidator({"ACL_TABLE": ["PORT"], "ACL_RULE": ["ACL_TABLE"]})
+        self.move_wrapper = ps.MoveWrapper([TableMoveGenerator()], [], [], [self.validator])
+
+    def test_sort__moves_depend_on_each_other__valid_moves_in_order(self):
+        # Arrange
+        sorter = ps.AStarSorter(self.move_wrapper)
+
+        # Act
+        moves = sorter.sort(ps.Diff(self.current_config, self.target_config))
+
+        # Assert
+        self.assertEqual(4, len(moves))
+        self.verify_moves(moves)
+        # Every explored state is one move closer to the target config
+        self.assertEqual(4, sorter.explored_states)
+
+    def test_sort__no_diff__empty_moves(self):
+        # Arrange
+        sorter = ps.AStarSorter(self.move_wrapper)
+
+        # Act
+        moves = sorter.sort(ps.Diff(self.current_config, copy.deepcopy(self.current_config)))
+
+        # Assert
+        self.assertEqual([], moves)
+        self.assertEqual(0, sorter.explored_states)
+
+    def test_sort__no_valid_sorting__none(self):
+        # Arrange
+        validator = TableDependencyMoveValidator({"ACL_TABLE": ["MISSING_TABLE"]})
+        move_wrapper = ps.MoveWrapper([TableMoveGenerator()], [], [], [validator])
+        sorter = ps.AStarSorter(move_wrapper)
+
+        # Act
+        moves = sorter.sort(ps.Diff(self.current_config, self.target_config))
+
+        # Assert
+        self.assertIsNone(moves)
+
+    def test_sort__max_explored_states_reached__falls_back_to_dfs(self):
+        # Arrange
+        sorter = ps.AStarSorter(self.move_wrapper, max_explored_states=1)
+        diff = ps.Diff(self.current_config, self.target_config)
+        expected = ps.DfsSorter(self.move_wrapper).sort(diff)
+
+        # Act
+        moves = sorter.sort(diff)
+
+        # Assert
+        self.assertEqual(expected, moves)
+        self.verify_moves(moves)
+        self.assertEqual(1 + len(moves), sorter.explored_states)
+
+    def test_sort__explores_fewer_states_than_bfs(self):
+        # Arrange
+        astar_sorter = ps.AStarSorter(self.move_wrapper)
+        bfs_sorter = ps.BfsSorter(self.move_wrapper)
+        diff = ps.Diff(self.current_config, self.target_config)
+
+        # Act
+        astar_moves = astar_sorter.sort(diff)
+        bfs_moves = bfs_sorter.sort(diff)
+
+        # Assert
+        self.assertEqual(len(bfs_moves), len(astar_moves))
+        self.assertLess(astar_sorter.explored_states, bfs_sorter.explored_states)
+
+    def test_sort__pushed_states_do_not_hold_configs(self):
+        # Arrange
+        sorter = ps.AStarSorter(self.move_wrapper)
+        simulate, generate = self.move_wrapper.simulate, self.move_wrapper.generate
+        simulated = []
+        live = []
+
+        def record_simulated(move, diff):
+            new_diff = simulate(move, diff)
+            simulated.append(weakref.ref(new_diff))
+            return new_diff
+
+        def record_live(diff):
+            live.append(sum(1 for ref in simulated if ref() is not None))
+            return generate(diff)
+
+        # Act
+        with mock.patch.object(self.move_wrapper, "simulate", side_effect=record_simulated), \
+                mock.patch.object(self.move_wrapper, "generate", side_effect=record_live):
+            moves = sorter.sort(ps.Diff(self.current_config, self.target_config))
+
+        # Assert
+        self.verify_moves(moves)
+        # When the i-th state is explored, at most the diffs of the i states explored before it are held
+        for i, count in enumerate(live):
+            self.assertLessEqual(count, i + 1)
+
+    def verify_moves(self, moves):
+        config = self.current_config
+        for move in moves:
+            self.assertTrue(self.validator.validate(move, ps.Diff(config, self.target_config)))
+            config = move.apply(config)
+        self.assertEqual(self.target_config, config)
+
 class TestPatchSorter(unittest.TestCase):
     def setUp(self):
         self.config_wrapper = ConfigWrapper()
@@ -3719,12 +4042,25 @@ class TestStrictPatchSorter(unittest.TestCase):
         # Assert
         self.assertListEqual(changes, actual)
 
+    def test_sort__algorithm_not_specified__calls_inner_patch_sorter_with_default_algorithm(self):
+        # Arrange
+        patch = Mock()
+        changes = [Mock(), Mock(), Mock()]
+        sorter = self.__create_patch_sorter(patch, ps.Algorithm.ASTAR, changes, default_algorithm=ps.Algorithm.ASTAR)
+
+        # Act
+        actual = sorter.sort(patch)
+
+        # Assert
+        self.assertListEqual(changes, actual)
+
     def __create_patch_sorter(self,
                               patch=None,
                               algorithm=None,
                               changes=None,
                               valid_patch_only_tables_with_yang_models=True,
-                              valid_config_db=True):
+                              valid_config_db=True,
+                              default_algorithm=ps.Algorithm.DFS):
         config_wrapper = Mock()
         patch_wrapper = Mock()
         inner_patch_sorter = Mock()
@@ -3755,4 +4091,4 @@ class TestStrictPatchSorter(unittest.TestCase):
             create_side_effect_dict(
                 {(str(patch), str(algorithm)): changes})
 
-        return ps.StrictPatchSorter(config_wrapper, patch_wrapper, inner_patch_sorter)
+        return ps.StrictPatchSorter(config_wrapper, patch_wrapper, inner_patch_sorter, default_algorithm)
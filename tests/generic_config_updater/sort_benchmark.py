@@ -0,0 +1,105 @@
+"""
+Benchmark of the patch sort algorithms.
+
+Every case is sorted by each algorithm and the number of explored states,
+i.e. the states moves were generated from, the number of moves found and
+the wall time are reported. Cases have the format of the patch sorter test
+files: {"<name>": {"current_config": ..., "patch": [...]}}, by default the
+success cases of patch_sorter_test.py are used.
+
+    python -m tests.generic_config_updater.sort_benchmark \\
+        [--cases cases.json] [--algorithm ASTAR --algorithm DFS] [--output results.json]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import jsonpatch
+
+import generic_config_updater.patch_sorter as ps
+from generic_config_updater.gu_common import ConfigWrapper, OperationWrapper, PathAddressing
+
+
+def sort_case(case, algorithm, sort_algorithm_factory):
+    current_config = case["current_config"]
+    target_config = jsonpatch.JsonPatch(case["patch"]).apply(current_config)
+
+    sorter = sort_algorithm_factory.create(algorithm)
+    start = time.perf_counter()
+    try:
+        moves = sorter.sort(ps.Diff(current_config, target_config))
+    finally:
+        sorter.move_wrapper.close()
+
+    return {
+        "algorithm": algorithm.name,
+        "explored_states": sorter.explored_states,
+        "moves": len(moves) if moves is not None else None,
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+def run(cases, algorithms, sort_algorithm_factory):
+    results = []
+    for name, case in cases.items():
+        for algorithm in algorithms:
+            result = sort_case(case, algorithm, sort_algorithm_factory)
+            result["case"] = name
+            results.append(result)
+    return results
+
+
+def summarize(results):
+    """
+    Returns {algorithm: totals over the cases} of the explored states, moves and wall time.
+    """
+    summary = {}
+    for result in results:
+        totals = summary.setdefault(result["algorithm"],
+                                    {"cases": 0, "explored_states": 0, "moves": 0, "wall_time": 0.0, "failed": 0})
+        totals["cases"] += 1
+        totals["explored_states"] += result["explored_states"]
+        totals["wall_time"] += result["wall_time"]
+        if result["moves"] is None:
+            totals["failed"] += 1
+        else:
+            totals["moves"] += result["moves"]
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the patch sort algorithms")
+    parser.add_argument("--cases", help="JSON file of the cases to sort, default to the patch sorter test cases")
+    parser.add_argument("--algorithm", action="append", choices=[e.name for e in ps.Algorithm],
+                        help="algorithm to run, can be repeated, default to all")
+    parser.add_argument("--output", help="file to save the results to as JSON")
+    args = parser.parse_args(argv)
+
+    if args.cases:
+        with open(args.cases) as f:
+            cases = json.load(f)
+    else:
+        from .gutest_helpers import Files
+        cases = Files.PATCH_SORTER_TEST_SUCCESS
+    algorithms = [ps.Algorithm[name] for name in args.algorithm] if args.algorithm else list(ps.Algorithm)
+
+    config_wrapper = ConfigWrapper()
+    factory = ps.SortAlgorithmFactory(OperationWrapper(), config_wrapper, PathAddressing(config_wrapper))
+    results = run(cases, algorithms, factory)
+
+    print(f"{'algorithm':<12} {'cases':>6} {'failed':>6} {'explored':>9} {'moves':>6} {'time (s)':>9}")
+    for algorithm, totals in summarize(results).items():
+        print(f"{algorithm:<12} {totals['cases']:>6} {totals['failed']:>6} {totals['explored_states']:>9} "
+              f"{totals['moves']:>6} {totals['wall_time']:>9.3f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results}, f, indent=4)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
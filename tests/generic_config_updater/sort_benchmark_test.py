@@ -0,0 +1,50 @@
+import unittest
+
+import generic_config_updater.patch_sorter as ps
+from . import sort_benchmark
+from .patch_sorter_test import TableMoveGenerator, TableDependencyMoveValidator
+
+
+class TableSortAlgorithmFactory:
+    def create(self, algorithm):
+        validator = TableDependencyMoveValidator({"ACL_TABLE": ["PORT"], "ACL_RULE": ["ACL_TABLE"]})
+        move_wrapper = ps.MoveWrapper([TableMoveGenerator()], [], [], [validator])
+        if algorithm == ps.Algorithm.DFS:
+            return ps.DfsSorter(move_wrapper)
+        if algorithm == ps.Algorithm.BFS:
+            return ps.BfsSorter(move_wrapper)
+        if algorithm == ps.Algorithm.MEMOIZATION:
+            return ps.MemoizationSorter(move_wrapper)
+        return ps.AStarSorter(move_wrapper)
+
+
+class TestSortBenchmark(unittest.TestCase):
+    def test_run(self):
+        # Arrange
+        cases = {
+            "ADD_ACL": {
+                "current_config": {"PORT": {"Ethernet0": {"alias": "eth0"}}},
+                "patch": [
+                    {"op": "add", "path": "/ACL_RULE", "value": {"ACL1|RULE1": {"PRIORITY": "1"}}},
+                    {"op": "add", "path": "/ACL_TABLE", "value": {"ACL1": {"ports": ["Ethernet0"]}}},
+                    {"op": "add", "path": "/PORT/Ethernet0/speed", "value": "100000"}
+                ]
+            },
+            "NO_SORTING": {
+                "current_config": {},
+                "patch": [{"op": "add", "path": "/ACL_TABLE", "value": {"ACL1": {}}}]
+            }
+        }
+
+        # Act
+        results = sort_benchmark.run(cases, list(ps.Algorithm), TableSortAlgorithmFactory())
+        summary = sort_benchmark.summarize(results)
+
+        # Assert
+        self.assertEqual(2 * len(ps.Algorithm), len(results))
+        for algorithm in ps.Algorithm:
+            totals = summary[algorithm.name]
+            self.assertEqual(2, totals["cases"])
+            self.assertEqual(1, totals["failed"])
+            self.assertEqual(3, totals["moves"])
+        self.assertLess(summary["ASTAR"]["explored_states"], summary["BFS"]["explored_states"])
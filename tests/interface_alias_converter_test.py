@@ -0,0 +1,90 @@
+from unittest import mock
+
+import utilities_common.cli as clicommon
+
+PORT_TABLE = {
+    'Ethernet0': {'alias': 'etp1'},
+    'Ethernet4': {'alias': 'etp2'},
+    'Ethernet8': {'alias': 'etp2'},
+    'Ethernet12': {'lanes': '12,13,14,15'},
+}
+
+# Port table of a multi ASIC device, merged across the namespaces
+MULTI_ASIC_PORT_TABLE = {
+    'Ethernet0': {'alias': 'Ethernet1/1', 'asic_port_name': 'Eth0-ASIC0'},
+    'Ethernet-BP0': {'alias': 'Ethernet-BP0', 'asic_port_name': 'Eth4-ASIC0'},
+    'Ethernet-BP256': {'alias': 'Ethernet-BP256', 'asic_port_name': 'Eth0-ASIC1'},
+}
+
+
+def get_converter(port_table):
+    db = mock.MagicMock()
+    db.cfgdb.get_table.return_value = port_table
+    with mock.patch('utilities_common.cli.load_db_config'):
+        return clicommon.InterfaceAliasConverter(db)
+
+
+class TestInterfaceAliasConverter(object):
+    def test_name_to_alias(self):
+        converter = get_converter(PORT_TABLE)
+
+        assert converter.name_to_alias('Ethernet0') == 'etp1'
+        assert converter.name_to_alias('Ethernet0.10') == 'etp1.10'
+        assert converter.name_to_alias('Ethernet12') == 'Ethernet12'
+        assert converter.name_to_alias('Ethernet100.20') == 'Ethernet100.20'
+        assert converter.name_to_alias(None) is None
+        assert converter.alias_max_length == 4
+
+    def test_alias_to_name(self):
+        converter = get_converter(PORT_TABLE)
+
+        assert converter.alias_to_name('etp1') == 'Ethernet0'
+        assert converter.alias_to_name('etp1.10') == 'Ethernet0.10'
+        # The first port with a shared alias keeps it
+        assert converter.alias_to_name('etp2') == 'Ethernet4'
+        assert converter.alias_to_name('etp100') == 'etp100'
+        assert converter.alias_to_name(None) is None
+
+    def test_empty_port_table(self):
+        converter = get_converter(None)
+
+        assert converter.port_dict == {}
+        assert converter.name_to_alias('Ethernet0') == 'Ethernet0'
+
+    def test_multi_asic_port_table(self):
+        with mock.patch('utilities_common.cli.load_db_config'), \
+                mock.patch('utilities_common.cli.multi_asic.get_port_table', return_value=MULTI_ASIC_PORT_TABLE):
+            converter = clicommon.InterfaceAliasConverter()
+
+        assert converter.name_to_alias('Ethernet0') == 'Ethernet1/1'
+        assert converter.name_to_alias('Ethernet-BP256') == 'Ethernet-BP256'
+        assert converter.alias_to_name('Ethernet1/1.100') == 'Ethernet0.100'
+
+    def test_get_interface_alias_converter(self):
+        db = mock.MagicMock()
+        db.cfgdb.get_table.return_value = PORT_TABLE
+        with mock.patch('utilities_common.cli.load_db_config'):
+            converter = clicommon.get_interface_alias_converter(db)
+            assert clicommon.get_interface_alias_converter(db) is converter
+            assert clicommon.get_interface_alias_converter(mock.MagicMock()) is not converter
+
+        db.cfgdb.get_table.assert_called_once_with('PORT')
+
+    def test_get_interface_alias_converter_without_db(self):
+        with mock.patch('utilities_common.cli.load_db_config'), \
+                mock.patch('utilities_common.cli.multi_asic.get_port_table', return_value=PORT_TABLE):
+            converter = clicommon.get_interface_alias_converter(None)
+            assert converter.name_to_alias('Ethernet0') == 'etp1'
+            assert clicommon.get_interface_alias_converter(None) is not converter
+
+    def test_get_interface_name_for_display(self):
+        db = mock.MagicMock()
+        db.cfgdb.get_table.return_value = PORT_TABLE
+        with mock.patch('utilities_common.cli.load_db_config'):
+            with mock.patch.dict('os.environ', {'SONIC_CLI_IFACE_MODE': 'alias'}):
+                assert clicommon.get_interface_name_for_display(db, 'Ethernet0') == 'etp1'
+                assert clicommon.get_interface_name_for_display(db, 'Ethernet4.5') == 'etp2.5'
+            with mock.patch.dict('os.environ', {'SONIC_CLI_IFACE_MODE': 'default'}):
+                assert clicommon.get_interface_name_for_display(db, 'Ethernet0') == 'Ethernet0'
+
+        db.cfgdb.get_table.assert_called_once_with('PORT')
@@ -0,0 +1,82 @@
+import os
+from importlib import reload
+from unittest import mock
+
+import pytest
+
+from utilities_common import multi_asic as multi_asic_util
+
+NAMESPACES = ['asic0', 'asic1', 'asic2']
+
+
+class Collector(object):
+    def __init__(self, parallel, fail_on=()):
+        self.multi_asic = multi_asic_util.MultiAsic(parallel=parallel)
+        self.fail_on = fail_on
+        self.config_db = None
+        self.db = None
+        self.visited = []
+
+    @multi_asic_util.run_on_multi_asic_namespaces
+    def collect(self, namespace, prefix):
+        if namespace.name in self.fail_on:
+            raise RuntimeError("failed on {}".format(namespace.name))
+        ports = sorted(namespace.config_db.get_table('PORT'))
+        return (prefix, namespace.multi_asic.current_namespace, ports)
+
+    @multi_asic_util.run_on_multi_asic
+    def visit(self):
+        self.visited.append((self.multi_asic.current_namespace, self.config_db is not None, self.db is not None))
+
+
+class TestMultiAsicParallel(object):
+    @classmethod
+    def setup_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "2"
+        os.environ["UTILITIES_UNIT_TESTING_TOPOLOGY"] = "multi_asic"
+        from .mock_tables import mock_multi_asic_3_asics
+        reload(mock_multi_asic_3_asics)
+        from .mock_tables import dbconnector
+        dbconnector.load_namespace_config()
+
+    def setup_method(self):
+        self.patcher = mock.patch.object(multi_asic_util.MultiAsic, 'get_ns_list_based_on_options',
+                                         return_value=NAMESPACES)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def test_same_result_as_sequential(self):
+        sequential = Collector(parallel=False).collect('ports')
+        parallel = Collector(parallel=True).collect('ports')
+
+        assert [ns for _, ns, _ in parallel] == NAMESPACES
+        assert parallel == sequential
+
+    def test_collector_state_is_not_changed(self):
+        collector = Collector(parallel=True)
+        collector.collect('ports')
+        assert collector.config_db is None
+        assert collector.db is None
+        assert collector.multi_asic.current_namespace is None
+
+    def test_failure_raises_first_failed_namespace(self):
+        collector = Collector(parallel=True, fail_on=('asic1', 'asic2'))
+        with pytest.raises(RuntimeError, match='asic1'):
+            collector.collect('ports')
+
+    def test_run_on_multi_asic_is_sequential(self):
+        collector = Collector(parallel=True)
+        collector.visit()
+        assert collector.visited == [(ns, True, True) for ns in NAMESPACES]
+        assert collector.multi_asic.current_namespace == 'asic2'
+
+    @classmethod
+    def teardown_class(cls):
+        os.environ["UTILITIES_UNIT_TESTING"] = "0"
+        os.environ["UTILITIES_UNIT_TESTING_TOPOLOGY"] = ""
+        from .mock_tables import mock_single_asic
+        reload(mock_single_asic)
+        from .mock_tables import dbconnector
+        dbconnector.load_database_config()
@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+from utilities_common import netstat
+from utilities_common.netstat import CounterMatrix, STATUS_NA, format_brate, format_prate, ns_diff
+
+COLUMNS = ['rx_ok', 'tx_ok', 'rx_byt']
+
+NEW_CNSTAT = {
+    'time': '2025-01-01T00:00:10',
+    'Ethernet0': {'rx_ok': '1,000', 'tx_ok': STATUS_NA, 'rx_byt': '20000'},
+    'Ethernet4': {'rx_ok': '5', 'tx_ok': '7', 'rx_byt': str(2**64 - 1)},
+}
+
+OLD_CNSTAT = {
+    'time': '2025-01-01T00:00:00',
+    'Ethernet0': {'rx_ok': '400', 'tx_ok': '1', 'rx_byt': STATUS_NA},
+    'Ethernet4': {'rx_ok': '9', 'tx_ok': '3', 'rx_byt': '0'},
+}
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def engine(request):
+    if request.param == 'python':
+        with mock.patch.object(netstat, 'numpy', None):
+            yield request.param
+    else:
+        pytest.importorskip('numpy')
+        yield request.param
+
+
+class TestCounterMatrix(object):
+    def test_diff_matches_ns_diff(self, engine):
+        new = CounterMatrix.from_dict(NEW_CNSTAT, COLUMNS)
+        old = CounterMatrix.from_dict(OLD_CNSTAT, COLUMNS)
+        output = new.diff(old).format()
+
+        assert new.rows == ['Ethernet0', 'Ethernet4']
+        for port in new.rows:
+            for column in COLUMNS:
+                expected = ns_diff(NEW_CNSTAT[port][column].replace(',', ''), OLD_CNSTAT[port][column])
+                assert output[port][column] == expected
+
+    def test_rate(self, engine):
+        new = CounterMatrix.from_dict(NEW_CNSTAT, COLUMNS)
+        old = CounterMatrix.from_dict(OLD_CNSTAT, COLUMNS)
+        output = new.rate(old, 2).format({'rx_byt': format_brate}, format_prate)
+
+        assert output['Ethernet0'] == {'rx_ok': '300.00/s', 'tx_ok': STATUS_NA, 'rx_byt': STATUS_NA}
+        assert output['Ethernet4']['rx_ok'] == '0.00/s'
+        assert output['Ethernet4']['tx_ok'] == '2.00/s'
+
+    def test_util(self, engine):
+        new = CounterMatrix.from_dict({'Ethernet0': {'rx_byt': '12500000'}, 'Ethernet4': {'rx_byt': '1'}}, ['rx_byt'])
+        old = CounterMatrix.from_dict({'Ethernet0': {'rx_byt': '0'}, 'Ethernet4': {'rx_byt': '0'}}, ['rx_byt'])
+        output = new.util(old, 1, ['1000', STATUS_NA]).format(default=lambda util: "{:.2f}%".format(util))
+
+        assert output == {'Ethernet0': {'rx_byt': '10.00%'}, 'Ethernet4': {'rx_byt': STATUS_NA}}
+
+    def test_missing_rows_and_columns(self, engine):
+        new = CounterMatrix.from_dict(NEW_CNSTAT, COLUMNS)
+        old = CounterMatrix.from_dict({'Ethernet4': {'rx_ok': '1'}}, ['rx_ok'])
+
+        diff = new.diff(old)
+        assert diff.get('Ethernet0', 'rx_ok') == 1000
+        assert diff.get('Ethernet4', 'rx_ok') == 4
+        assert diff.get('Ethernet4', 'tx_ok') == 7
+        assert new.rate(old, 1).get('Ethernet4', 'tx_ok') == STATUS_NA
+
+    def test_empty(self, engine):
+        new = CounterMatrix.from_dict({'time': 0}, COLUMNS)
+        assert new.rate(new, 1).format() == {}
@@ -239,6 +239,46 @@ class TestPfcwd(object):
         assert result.exit_code == 0
         assert pfc_is_not_enabled == result.output
 
+    @patch('pfcwd.main.os')
+    def test_pfcwd_start_stop_single_batch(self, mock_os):
+        import pfcwd.main as pfcwd
+        runner = CliRunner()
+        db = Db()
+        mock_os.geteuid.return_value = 0
+
+        config_db = db.cfgdb_pipe
+        with patch.object(config_db, 'mod_config', wraps=config_db.mod_config) as mock_mod_config:
+            result = runner.invoke(
+                pfcwd.cli.commands["start"],
+                [
+                    "--action", "drop", "--restoration-time", "601",
+                    "all", "602"
+                ],
+                obj=db
+            )
+            print(result.output)
+            assert result.exit_code == 0
+            # the existing entries are deleted first, then all the ports
+            # are written in one batch, not one by one
+            assert mock_mod_config.call_count == 2
+            deleted = mock_mod_config.call_args_list[0][0][0]['PFC_WD']
+            assert deleted == {'Ethernet0': None, 'Ethernet4': None}
+            entries = mock_mod_config.call_args_list[1][0][0]['PFC_WD']
+            assert len(entries) > 1
+            assert 'Ethernet8' not in entries
+            assert config_db.get_entry('PFC_WD', 'Ethernet0')['detection_time'] == '602'
+
+            mock_mod_config.reset_mock()
+            result = runner.invoke(
+                pfcwd.cli.commands["stop"],
+                [],
+                obj=db
+            )
+            print(result.output)
+            assert result.exit_code == 0
+            assert mock_mod_config.call_count == 1
+            assert all(entry is None for entry in mock_mod_config.call_args[0][0]['PFC_WD'].values())
+
 
     def test_pfcwd_start_ports_invalid(self):
         # pfcwd start --action drop --restoration-time 200 Ethernet0 200
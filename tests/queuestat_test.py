@@ -3,6 +3,7 @@ import pytest
 import os
 import json
 import logging
+from unittest import mock
 
 import show.main as show
 
@@ -10,6 +11,7 @@ from click.testing import CliRunner
 
 from utilities_common.cli import UserCache
 from utilities_common.cli import json_dump
+from utilities_common.general import load_module_from_source
 
 from .utils import get_result_and_return_code
 from .queuestat_input import assert_show_output
@@ -266,3 +268,38 @@ class TestQueueTrimStat(object):
 
         assert result == assert_show_output.trim_counters_all
         assert return_code == SUCCESS
+
+    def test_queue_counters_bulk_read(self):
+        queuestat = load_module_from_source('queuestat', os.path.join(scripts_path, 'queuestat'))
+        wrapper = queuestat.QueuestatWrapper(None, False, False, False)
+        wrapper.connect()
+        qstat = wrapper.queuestats[0]
+
+        cnstat_all = qstat.get_cnstat_all()
+        for port in cnstat_all:
+            cnstat = qstat.get_cnstat(qstat.port_queues_map[port])
+            cnstat.pop('time')
+            cnstat_all[port].pop('time')
+            assert cnstat_all[port] == cnstat
+
+    def test_queue_counters_watch(self, capsys):
+        queuestat = load_module_from_source('queuestat', os.path.join(scripts_path, 'queuestat'))
+        wrapper = queuestat.QueuestatWrapper(None, False, False, False)
+        remove_tmp_cnstat_file()
+
+        with mock.patch('time.sleep'), mock.patch('click.clear'):
+            wrapper.watch(1, 'Ethernet0', False, iterations=2)
+
+        output = capsys.readouterr().out
+        assert output.count('Every 1s: queuestat -p Ethernet0') == 2
+        assert 'Pkts/s' in output
+        assert 'Ethernet4' not in output
+        # Watch mode must not touch the cached snapshot
+        assert not os.listdir(UserCache("queuestat").get_directory())
+
+    def test_queue_counters_watch_invalid_port(self):
+        return_code, result = get_result_and_return_code(
+            ['queuestat', '-w', '1', '-p', 'Ethernet999']
+        )
+        assert return_code == 1
+        assert "Port doesn't exist!" in result
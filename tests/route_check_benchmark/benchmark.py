@@ -0,0 +1,353 @@
+"""
+Scale benchmark for scripts/route_check.py and scripts/vnet_route_check.py.
+
+For every scale, synthetic tables are generated (see fixtures.py), served to
+the checkers through an in-memory stand-in of the swsscommon DBConnector /
+Table / SubscriberStateTable API, and each checker is run in a forked
+process. For each run the wall time, the peak RSS and the number of DB
+calls are reported.
+
+    python -m tests.route_check_benchmark.benchmark --scale 10k,100k \\
+        --output results.json [--compare baseline.json]
+
+Results are saved as JSON with the commit they were taken on. With
+--compare, the run is checked against an earlier results file and the
+exit code is 1 if a metric regressed by more than --threshold.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from unittest import mock
+
+from . import fixtures
+
+SCRIPTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "scripts")
+
+SCALES = {"10k": 10000, "100k": 100000, "1m": 1000000}
+TOOLS = ["route_check", "vnet_route_check"]
+
+# Metrics compared by --compare
+METRICS = ["wall_time", "rss_delta_kb", "db_calls"]
+
+DEFAULT_THRESHOLD = 0.2
+
+
+class StandinDb(object):
+    """
+    In-memory stand-in for the parts of the swsscommon API the route
+    checkers use, serving a Fixture and counting the DB calls
+    """
+
+    TIMEOUT = 1
+    OBJECT = 0
+
+    def __init__(self, fixture):
+        self.calls = Counter()
+        # {db name: {table: {key: fields}}}
+        self.tables = {}
+        for db_name, content in fixture.dbs.items():
+            separator = fixtures.TABLE_SEPARATORS[db_name]
+            tables = self.tables.setdefault(db_name, {})
+            for redis_key, fields in content.items():
+                table, _, key = redis_key.partition(separator)
+                tables.setdefault(table, {})[key] = fields
+
+    def get_table(self, db_name, name):
+        separator = fixtures.TABLE_SEPARATORS[db_name]
+        tables = self.tables.get(db_name, {})
+        if name in tables:
+            return tables[name]
+        # Sub-table such as ASIC_STATE:SAI_OBJECT_TYPE_VIRTUAL_ROUTER
+        table, _, prefix = name.partition(separator)
+        prefix += separator
+        return {key[len(prefix):]: fields for key, fields in tables.get(table, {}).items()
+                if key.startswith(prefix)}
+
+    def api(self):
+        standin = self
+
+        def DBConnector(db_name, *args, **kwargs):
+            standin.calls["connect"] += 1
+            return db_name
+
+        class Table(object):
+            def __init__(self, db_name, name):
+                self.data = standin.get_table(db_name, name)
+
+            def getKeys(self):
+                standin.calls["getKeys"] += 1
+                return list(self.data)
+
+            def get(self, key):
+                standin.calls["get"] += 1
+                if key not in self.data:
+                    return False, []
+                return True, list(self.data[key].items())
+
+            def hget(self, key, field):
+                standin.calls["hget"] += 1
+                value = self.data.get(key, {}).get(field)
+                return value is not None, value
+
+        class SubscriberStateTable(object):
+            def __init__(self, db_name, name):
+                self.pending = iter(list(standin.get_table(db_name, name).items()))
+
+            def pop(self):
+                standin.calls["pop"] += 1
+                key, fields = next(self.pending, ("", None))
+                return (key, "SET", list(fields.items())) if key else ("", "", None)
+
+        class Select(object):
+            TIMEOUT = StandinDb.TIMEOUT
+            OBJECT = StandinDb.OBJECT
+
+            def addSelectable(self, subs):
+                pass
+
+            def select(self, timeout):
+                standin.calls["select"] += 1
+                return self.TIMEOUT, None
+
+        return {"DBConnector": DBConnector, "Table": Table,
+                "SubscriberStateTable": SubscriberStateTable, "Select": Select}
+
+
+class StandinConfigDb(object):
+    def __init__(self, standin):
+        self.standin = standin
+
+    def get_table(self, table):
+        self.standin.calls["config_get_table"] += 1
+        if table == "FEATURE":
+            return {"bgp": {"state": "enabled"}}
+        if table == "DEVICE_METADATA":
+            return {"localhost": {"hostname": "benchmark"}}
+        return {}
+
+    def get_entry(self, table, key):
+        return self.get_table(table).get(key, {})
+
+
+def _frr_output(fixture, cmd):
+    return fixture.frr_files["ipv6" if "ipv6" in cmd else "ip"]
+
+
+def _popen(fixture, cmd, *args, **kwargs):
+    stdout = open(_frr_output(fixture, cmd))
+    return mock.MagicMock(stdout=stdout, returncode=0)
+
+
+def _check_output(fixture, cmd, *args, **kwargs):
+    with open(_frr_output(fixture, cmd)) as f:
+        return f.read()
+
+
+def _load_script(name):
+    if SCRIPTS_PATH not in sys.path:
+        sys.path.insert(0, SCRIPTS_PATH)
+    return __import__(name)
+
+
+def run_route_check(fixture, standin):
+    route_check = _load_script("route_check")
+    route_check.FRR_WAIT_TIME = 0
+    with mock.patch.multiple(route_check.swsscommon, **standin.api()), \
+            mock.patch.object(route_check.multi_asic, "get_namespace_list",
+                              return_value=[route_check.multi_asic.DEFAULT_NAMESPACE]), \
+            mock.patch.object(route_check.multi_asic, "connect_config_db_for_ns",
+                              side_effect=lambda ns: StandinConfigDb(standin)), \
+            mock.patch.object(route_check.chassis, "get_chassis_local_interfaces", return_value=[]), \
+            mock.patch.object(route_check.subprocess, "Popen", side_effect=lambda *a, **k: _popen(fixture, *a, **k)), \
+            mock.patch.object(route_check.subprocess, "check_output",
+                              side_effect=lambda *a, **k: _check_output(fixture, *a, **k)):
+        ret, res = route_check.check_routes(route_check.multi_asic.DEFAULT_NAMESPACE)
+    missed = (res or {}).get(route_check.multi_asic.DEFAULT_NAMESPACE, {}).get("missed_ROUTE_TABLE_routes", [])
+    return {"ret": ret, "missed": len(missed)}
+
+
+def run_vnet_route_check(fixture, standin):
+    vnet_route_check = _load_script("vnet_route_check")
+    with mock.patch.multiple(vnet_route_check.swsscommon, **standin.api()), \
+            mock.patch.object(vnet_route_check.subprocess, "call", return_value=1), \
+            mock.patch("sys.argv", ["vnet_route_check.py"]):
+        ret = vnet_route_check.main()
+    if isinstance(ret, tuple):
+        ret = ret[0]
+    return {"ret": ret}
+
+
+RUNNERS = {"route_check": run_route_check, "vnet_route_check": run_vnet_route_check}
+
+
+def current_rss_kb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        return 0
+
+
+def measure(tool, fixture):
+    """
+    Run <tool> on <fixture> in this process
+    :return dict of metrics
+    """
+    standin = StandinDb(fixture)
+    rss_before = current_rss_kb()
+    start = time.monotonic()
+    with contextlib.redirect_stdout(io.StringIO()):
+        outcome = RUNNERS[tool](fixture, standin)
+    wall_time = time.monotonic() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    result = {
+        "tool": tool,
+        "routes": fixture.routes,
+        "wall_time": round(wall_time, 4),
+        "peak_rss_kb": peak_rss,
+        "rss_delta_kb": max(peak_rss - rss_before, 0),
+        "db_calls": sum(standin.calls.values()),
+        "db_calls_by_method": dict(sorted(standin.calls.items())),
+    }
+    result.update(outcome)
+    return result
+
+
+def _measure_child(queue, tool, fixture):
+    try:
+        queue.put(measure(tool, fixture))
+    except BaseException as e:
+        queue.put({"tool": tool, "routes": fixture.routes, "error": repr(e)})
+
+
+def measure_forked(tool, fixture):
+    """
+    Run measure() in a forked process, so that every run has its own peak RSS
+    """
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_measure_child, args=(queue, tool, fixture))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def run(scales, tools, vrfs=4, missing=0, fork=True, dump_dir=None):
+    results = []
+    for scale in scales:
+        workdir = tempfile.mkdtemp(prefix="route_check_benchmark_")
+        try:
+            fixture = fixtures.generate(scale, workdir, vrfs=vrfs, missing=missing)
+            if dump_dir:
+                fixture_dir = os.path.join(dump_dir, str(scale))
+                os.makedirs(fixture_dir, exist_ok=True)
+                fixtures.dump(fixture, fixture_dir)
+            for tool in tools:
+                results.append(measure_forked(tool, fixture) if fork else measure(tool, fixture))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def get_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL, cwd=SCRIPTS_PATH).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """
+    :return list of (tool, routes, metric, old, new) that got worse by
+    more than <threshold>
+    """
+    old_results = {(r["tool"], r["routes"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = old_results.get((result["tool"], result["routes"]))
+        if old is None or "error" in old or "error" in result:
+            continue
+        for metric in METRICS:
+            if result[metric] > old[metric] * (1 + threshold) and result[metric] - old[metric] > 0:
+                regressions.append((result["tool"], result["routes"], metric, old[metric], result[metric]))
+    return regressions
+
+
+def print_results(results):
+    print("{:<18} {:>9} {:>10} {:>13} {:>13} {:>10}".format(
+        "tool", "routes", "wall (s)", "peak RSS kB", "RSS delta kB", "DB calls"))
+    for r in results:
+        if "error" in r:
+            print("{:<18} {:>9} error: {}".format(r["tool"], r["routes"], r["error"]))
+            continue
+        print("{:<18} {:>9} {:>10.3f} {:>13} {:>13} {:>10}".format(
+            r["tool"], r["routes"], r["wall_time"], r["peak_rss_kb"], r["rss_delta_kb"], r["db_calls"]))
+
+
+def parse_scale(value):
+    scales = []
+    for item in value.split(","):
+        item = item.strip().lower()
+        scales.append(SCALES[item] if item in SCALES else int(item))
+    return scales
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark route_check.py and vnet_route_check.py at scale")
+    parser.add_argument("--scale", type=parse_scale, default=parse_scale("10k,100k"),
+                        help="Comma separated route counts, 10k/100k/1m or a number (default: 10k,100k)")
+    parser.add_argument("--tool", choices=TOOLS, action="append", help="Checker to run (default: all)")
+    parser.add_argument("--vrfs", type=int, default=4, help="Number of VRFs")
+    parser.add_argument("--missing", type=int, default=0, help="Routes left out of ASIC_DB")
+    parser.add_argument("--output", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Results JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative increase reported as a regression (default: 0.2)")
+    parser.add_argument("--dump-fixtures", metavar="DIR",
+                        help="Also write the generated tables as mock_tables JSON files")
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, args.tool or TOOLS, vrfs=args.vrfs, missing=args.missing,
+                  dump_dir=args.dump_fixtures)
+    print_results(results)
+
+    report = {
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": {"vrfs": args.vrfs, "missing": args.missing},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for tool, routes, metric, old, new in regressions:
+            print("REGRESSION {} {} routes: {} {} -> {}".format(tool, routes, metric, old, new))
+        if regressions:
+            return 1
+
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+Synthetic route tables for the route_check / vnet_route_check benchmark.
+
+generate() builds the APPL_DB, ASIC_DB, COUNTERS_DB and STATE_DB content of
+a switch with <routes> routes in the layout of the tests/mock_tables JSON
+files ({db name: {"TABLE<sep>key": {field: value}}}), plus the matching
+"show ip route json" / "show ipv6 route json" output, written to files as
+zebra would print them. The content only depends on the arguments, so two
+runs with the same arguments, on any commit, see the same tables.
+"""
+
+import json
+import os
+
+DEFAULT_VR = "oid:0x3000000000022"
+SWITCH_ID = "oid:0x21000000000000"
+RT_ENTRY_KEY = 'SAI_OBJECT_TYPE_ROUTE_ENTRY:{{"dest":"{}","switch_id":"' + SWITCH_ID + '","vr":"{}"}}'
+
+# Share of the routes in each family / table
+V6_SHARE = 0.1
+VRF_SHARE = 0.1
+VNET_SHARE = 0.05
+ROUTES_PER_VNET = 1000
+ROUTES_PER_INTF = 1000
+
+# Fields are never modified, so all the route entries can share them
+ROUTE_FIELDS = {"nexthop": "10.0.0.1", "ifname": "PortChannel101"}
+NO_FIELDS = {}
+
+TABLE_SEPARATORS = {
+    "APPL_DB": ":",
+    "ASIC_DB": ":",
+    "COUNTERS_DB": ":",
+    "STATE_DB": "|",
+    "CONFIG_DB": "|",
+}
+
+
+def v4_prefix(base, i, length):
+    addr = base + (i << (32 - length))
+    return "{}.{}.{}.{}/{}".format(addr >> 24, (addr >> 16) & 0xff, (addr >> 8) & 0xff, addr & 0xff, length)
+
+
+def v6_prefix(i):
+    # Both groups are non zero, so the string is in canonical form
+    return "2001:db8:{:x}:{:x}::/64".format((i >> 16) + 1, (i & 0xffff) + 1)
+
+
+def vr_oid(index):
+    return "oid:0x30000000{:05x}".format(index + 0x100)
+
+
+def rif_oid(index):
+    return "oid:0x60000000{:05x}".format(index)
+
+
+class Fixture(object):
+    """
+    Generated tables. dbs is in the tests/mock_tables layout, frr_files
+    maps "ip" / "ipv6" to the file holding the zebra JSON output.
+    """
+
+    def __init__(self, routes, vrfs, missing, workdir):
+        self.routes = routes
+        self.vrfs = vrfs
+        self.missing = missing
+        self.dbs = {db_name: {} for db_name in TABLE_SEPARATORS}
+        self.frr_files = {
+            "ip": os.path.join(workdir, "frr_ip_route.json"),
+            "ipv6": os.path.join(workdir, "frr_ipv6_route.json"),
+        }
+        self.expected_missing = []
+
+    def set(self, db_name, table, key, fields):
+        self.dbs[db_name][table + TABLE_SEPARATORS[db_name] + key] = fields
+
+    def add_route(self, prefix, vrf=None, vr=DEFAULT_VR, in_asic=True):
+        self.set("APPL_DB", "ROUTE_TABLE", "{}:{}".format(vrf, prefix) if vrf else prefix, ROUTE_FIELDS)
+        if in_asic:
+            self.add_asic_route(prefix, vr)
+        else:
+            self.expected_missing.append(prefix)
+
+    def add_asic_route(self, prefix, vr=DEFAULT_VR):
+        self.dbs["ASIC_DB"]["ASIC_STATE:" + RT_ENTRY_KEY.format(prefix, vr)] = NO_FIELDS
+
+
+def _write_frr(path, prefixes):
+    with open(path, "w") as f:
+        f.write("{")
+        for i, prefix in enumerate(prefixes):
+            entry = {
+                "prefix": prefix,
+                "protocol": "bgp",
+                "vrfName": "default",
+                "selected": True,
+                "installed": True,
+                "offloaded": True,
+                "nexthops": [{"ip": "10.0.0.1", "afi": "ipv4", "interfaceName": "PortChannel101",
+                              "active": True, "fib": True}],
+            }
+            f.write("{}{}: [{}]".format("," if i else "", json.dumps(prefix), json.dumps(entry)))
+        f.write("}")
+
+
+def generate(routes, workdir, vrfs=4, missing=0):
+    """
+    Build the tables of a switch with about <routes> routes: IPv4 & IPv6
+    routes in the default VRF, routes in <vrfs> VRFs, local interfaces
+    and VNET routes. <missing> default VRF routes are left out of ASIC_DB.
+    :return Fixture
+    """
+    fixture = Fixture(routes, vrfs, missing, workdir)
+
+    n_v6 = int(routes * V6_SHARE)
+    n_vrf = int(routes * VRF_SHARE) if vrfs else 0
+    n_vnet = int(routes * VNET_SHARE)
+    n_v4 = max(routes - n_v6 - n_vrf - n_vnet, 0)
+    n_intfs = max(routes // ROUTES_PER_INTF, 1)
+    n_vnets = max(n_vnet // ROUTES_PER_VNET, 1) if n_vnet else 0
+
+    # Default routes
+    fixture.add_route("0.0.0.0/0")
+    fixture.add_route("::/0")
+
+    # Default VRF routes, 11.0.0.0/24 onwards and 2001:db8::/64s
+    v4 = [v4_prefix(0x0b000000, i, 24) for i in range(n_v4)]
+    v6 = [v6_prefix(i) for i in range(n_v6)]
+    for i, prefix in enumerate(v4):
+        fixture.add_route(prefix, in_asic=i >= missing)
+    for prefix in v6:
+        fixture.add_route(prefix)
+
+    # VRF routes, 30.0.0.0/24 onwards, spread over the VRFs
+    for i in range(n_vrf):
+        vrf = i % vrfs
+        fixture.add_route(v4_prefix(0x1e000000, i, 24), vrf="Vrf{}".format(vrf), vr=vr_oid(vrf))
+
+    # Local interfaces: /31 subnets on front panel ports, plus a loopback
+    for i in range(n_intfs):
+        ip = v4_prefix(0x0a000000, i, 31).split("/")[0]
+        port = "Ethernet{}".format(i * 4)
+        fixture.set("APPL_DB", "INTF_TABLE", port, NO_FIELDS)
+        fixture.set("APPL_DB", "INTF_TABLE", "{}:{}/31".format(port, ip), NO_FIELDS)
+        fixture.set("APPL_DB", "ROUTE_TABLE", "{}/31".format(ip), {"nexthop": "0.0.0.0", "ifname": port})
+        fixture.add_asic_route("{}/31".format(ip))
+        fixture.add_asic_route("{}/32".format(ip))
+    fixture.set("APPL_DB", "INTF_TABLE", "Loopback0:10.1.0.1/32", NO_FIELDS)
+    fixture.add_asic_route("10.1.0.1/32")
+
+    # VNETs, each with a VLAN interface and tunnel routes from 40.0.0.0/32 on
+    if n_vnets:
+        fixture.set("APPL_DB", "VXLAN_TUNNEL_TABLE", "tunnel_v4", {"src_ip": "10.1.0.32"})
+        fixture.set("ASIC_DB", "ASIC_STATE", "SAI_OBJECT_TYPE_VIRTUAL_ROUTER:" + DEFAULT_VR, NO_FIELDS)
+    rif_name_map = {}
+    for v in range(n_vnets):
+        vnet = "Vnet{}".format(v + 1)
+        vlan = "Vlan{}".format(3000 + v)
+        vnet_vr = vr_oid(vrfs + v)
+        ip2me = v4_prefix(0x64000001, v, 24).split("/")[0]
+        fixture.set("APPL_DB", "VNET_TABLE", vnet, {"vxlan_tunnel": "tunnel_v4", "vni": str(10000 + v)})
+        fixture.set("APPL_DB", "INTF_TABLE", vlan, {"vnet_name": vnet})
+        fixture.set("APPL_DB", "INTF_TABLE", "{}:{}/24".format(vlan, ip2me), NO_FIELDS)
+        fixture.set("ASIC_DB", "ASIC_STATE", "SAI_OBJECT_TYPE_ROUTER_INTERFACE:" + rif_oid(v),
+                    {"SAI_ROUTER_INTERFACE_ATTR_VIRTUAL_ROUTER_ID": vnet_vr})
+        fixture.add_asic_route("{}/32".format(ip2me), vnet_vr)
+        rif_name_map[vlan] = rif_oid(v)
+    if rif_name_map:
+        fixture.set("COUNTERS_DB", "COUNTERS_RIF_NAME_MAP", "", rif_name_map)
+
+    for i in range(n_vnet):
+        vnet = "Vnet{}".format(i % n_vnets + 1)
+        prefix = v4_prefix(0x28000000, i, 32)
+        fixture.set("APPL_DB", "VNET_ROUTE_TUNNEL_TABLE", "{}:{}".format(vnet, prefix), {"endpoint": "10.2.0.1"})
+        fixture.set("STATE_DB", "VNET_ROUTE_TUNNEL_TABLE", "{}|{}".format(vnet, prefix), {"state": "active"})
+        fixture.add_asic_route(prefix, vr_oid(vrfs + i % n_vnets))
+
+    _write_frr(fixture.frr_files["ip"], v4)
+    _write_frr(fixture.frr_files["ipv6"], v6)
+    return fixture
+
+
+def dump(fixture, directory):
+    """
+    Write the tables as tests/mock_tables style JSON files
+    """
+    for db_name, content in fixture.dbs.items():
+        with open(os.path.join(directory, db_name.lower() + ".json"), "w") as f:
+            json.dump(content, f, indent=4)
@@ -0,0 +1,31 @@
+import json
+import os
+
+from .route_check_benchmark import benchmark, fixtures
+
+
+class TestRouteCheckBenchmark(object):
+    def test_fixture(self, tmp_path):
+        fixture = fixtures.generate(2000, str(tmp_path), vrfs=2, missing=2)
+        assert fixture.expected_missing == ['11.0.0.0/24', '11.0.1.0/24']
+        assert 'ROUTE_TABLE:Vrf1:30.0.1.0/24' in fixture.dbs['APPL_DB']
+        assert 'VNET_ROUTE_TUNNEL_TABLE|Vnet1|40.0.0.0/32' in fixture.dbs['STATE_DB']
+        with open(fixture.frr_files['ipv6']) as f:
+            assert '2001:db8:1:1::/64' in json.load(f)
+
+        fixtures.dump(fixture, str(tmp_path))
+        with open(os.path.join(str(tmp_path), 'asic_db.json')) as f:
+            assert len(json.load(f)) == len(fixture.dbs['ASIC_DB'])
+
+    def test_run(self):
+        results = benchmark.run([2000], benchmark.TOOLS, vrfs=2, missing=2, fork=False)
+        route_check, vnet_route_check = results
+        assert route_check['missed'] == 2
+        assert route_check['db_calls'] > 0
+        assert vnet_route_check['ret'] == 0
+        assert vnet_route_check['db_calls_by_method']['getKeys'] > 0
+
+    def test_compare(self):
+        old = {'tool': 'route_check', 'routes': 10, 'wall_time': 1.0, 'rss_delta_kb': 100, 'db_calls': 10}
+        new = dict(old, wall_time=1.5, db_calls=11)
+        assert benchmark.compare([new], {'results': [old]}, 0.2) == [('route_check', 10, 'wall_time', 1.0, 1.5)]
@@ -239,21 +239,72 @@ class TestRouteCheck(object):
         set_test_case_data(ct_data)
         self.run_test(ct_data)
 
-    def run_test(self, ct_data):
-        with patch('sys.argv', ct_data[ARGS].split()), \
+    @pytest.mark.parametrize("test_num", TEST_DATA.keys())
+    def test_route_check_daemon(self, mock_dbs, test_num):
+        self.init()
+        ct_data = TEST_DATA[test_num]
+        set_test_case_data(ct_data)
+        with patch('route_check.DAEMON_SELECT_TIMEOUT_MSECS', 0):
+            self.run_test(ct_data, ct_data[ARGS] + " -d --settle-time 0")
+
+    def test_route_checker_settle_time(self, mock_dbs):
+        self.init()
+        ct_data = TEST_DATA['2']
+        set_test_case_data(ct_data)
+        init_db_conns(ct_data[NAMESPACE])
+        with patch('route_check.subprocess.Popen',
+                   side_effect=lambda *args, **kwargs: self.mock_popen(ct_data, *args, **kwargs)):
+            checker = route_check.RouteChecker(DEFAULTNS, 10)
+            checker.sync(now=100)
+            for subs in subscribers_returned.values():
+                subs.update()
+            checker.process_updates(now=101)
+
+            # Nothing is reported before the mismatches settled
+            assert checker.check(now=105) == {}
+            assert checker.check(now=111) == ct_data[RESULT][DEFAULTNS]
+
+    def test_route_checker_filters_run_once_per_miss_set(self, mock_dbs):
+        self.init()
+        ct_data = TEST_DATA['2']
+        set_test_case_data(ct_data)
+        init_db_conns(ct_data[NAMESPACE])
+        with patch('route_check.subprocess.Popen',
+                   side_effect=lambda *args, **kwargs: self.mock_popen(ct_data, *args, **kwargs)), \
+                patch('route_check.filter_out_expected_misses',
+                      side_effect=route_check.filter_out_expected_misses) as mock_filter:
+            checker = route_check.RouteChecker(DEFAULTNS, 0)
+            checker.sync(now=100)
+            for subs in subscribers_returned.values():
+                subs.update()
+            checker.process_updates(now=101)
+
+            # The misses persist, the filters are not run again over the tables
+            assert checker.check(now=111) == ct_data[RESULT][DEFAULTNS]
+            assert checker.check(now=112) == ct_data[RESULT][DEFAULTNS]
+            assert mock_filter.call_count == 1
+
+            # A new miss runs them again
+            checker.recheck(checker.appl.update('', '10.99.0.0/16', True), now=100)
+            checker.check(now=113)
+            assert mock_filter.call_count == 2
+
+    def run_test(self, ct_data, args=None):
+        with patch('sys.argv', (args or ct_data[ARGS]).split()), \
             patch('sonic_py_common.multi_asic.get_namespace_list', return_value= ct_data[NAMESPACE]), \
             patch('sonic_py_common.multi_asic.is_multi_asic', return_value= ct_data[MULTI_ASIC]), \
-            patch('route_check.subprocess.check_output', side_effect=lambda *args, **kwargs: self.mock_check_output(ct_data, *args, **kwargs)), \
+            patch('route_check.subprocess.Popen',
+                  side_effect=lambda *args, **kwargs: self.mock_popen(ct_data, *args, **kwargs)), \
             patch('route_check.mitigate_installed_not_offloaded_frr_routes', side_effect=lambda *args, **kwargs: None), \
             patch('route_check.load_db_config', side_effect=lambda: init_db_conns(ct_data[NAMESPACE])):
 
             ret, res = route_check.main()
             self.assert_results(ct_data, ret, res)
 
-    def mock_check_output(self, ct_data, *args, **kwargs):
+    def mock_popen(self, ct_data, *args, **kwargs):
         ns = self.extract_namespace_from_args(args[0])
         routes = ct_data.get(FRR_ROUTES, {}).get(ns, {})
-        return json.dumps(routes)
+        return MagicMock(stdout=StringIO(json.dumps(routes)), returncode=0)
 
     def assert_results(self, ct_data, ret, res):
         expect_ret = ct_data.get(RET, 0)
@@ -307,3 +358,28 @@ class TestRouteCheck(object):
             route_check.mitigate_installed_not_offloaded_frr_routes(namespace, missed_frr_rt, rt_appl)
         # Verify that the stdout are suppressed in this function
         assert not mock_stdout.getvalue()
+
+    def test_prefix_set(self):
+        appl = route_check.PrefixSet(['10.0.0.0/24', '2000:0:0::1/128', '192.168.1.1', 'fc00::/64'])
+        asic = route_check.PrefixSet(['10.0.0.0/24', '2000::1', '192.168.1.1/32', '10.0.0.0/25'])
+
+        assert route_check.unpack_prefix(route_check.pack_prefix('2000:0:0::1')) == '2000::1/128'
+        assert '2000::1/128' in appl
+        assert '2000::1/64' not in appl
+        assert 'not-a-prefix' not in appl
+        assert appl.difference(asic) == ['fc00::/64']
+        assert asic.difference(appl) == ['10.0.0.0/25']
+        assert route_check.filter_out_prefixes(['10.0.0.0/24', '10.0.0.0/25'], appl) == ['10.0.0.0/25']
+
+    def test_iter_json_object(self):
+        routes = {
+            '10.0.0.0/24': [{'prefix': '10.0.0.0/24', 'protocol': 'bgp', 'metric': 20}],
+            '10.0.1.0/24': [{'prefix': '10.0.1.0/24', 'protocol': 'static'}],
+        }
+        for chunk_size in (1, 7, 1024):
+            items = route_check.iter_json_object(StringIO(json.dumps(routes, indent=2)), chunk_size)
+            assert list(items) == list(routes.items())
+
+        assert list(route_check.iter_json_object(StringIO('{}'))) == []
+        with pytest.raises(ValueError):
+            list(route_check.iter_json_object(StringIO('{"10.0.0.0/24": [')))
@@ -1,9 +1,12 @@
 import os
 import pytest
 import subprocess
+import sys
+from unittest import mock
 from click.testing import CliRunner
 
 import show.main as show
+from utilities_common.general import load_module_from_source
 from .utils import get_result_and_return_code
 
 root_path = os.path.dirname(os.path.abspath(__file__))
@@ -117,6 +120,48 @@ class TestShowIpInt(object):
         assert result == show_error_invalid_af
 
 
+class TestLinkStates(object):
+
+    @staticmethod
+    def link(index, name, flags, carrier, master=None):
+        attrs = {'IFLA_IFNAME': name, 'IFLA_CARRIER': carrier, 'IFLA_MASTER': master}
+        link = mock.MagicMock()
+        link.__getitem__.side_effect = {'index': index, 'flags': flags}.__getitem__
+        link.get_attr.side_effect = attrs.get
+        return link
+
+    def test_get_link_states(self):
+        ipintutil = load_module_from_source('ipintutil', os.path.join(scripts_path, 'ipintutil'))
+        pyroute2 = mock.MagicMock()
+        ipr = pyroute2.IPRoute.return_value.__enter__.return_value
+        ipr.get_links.return_value = [
+            self.link(10, 'Vrf_red', 0x1, 1),
+            self.link(11, 'Ethernet0', 0x1003, 1, master=10),
+            self.link(12, 'Ethernet4', 0x1002, 1),
+            self.link(13, 'Ethernet8', 0x1003, 0)
+        ]
+
+        with mock.patch.dict(sys.modules, {'pyroute2': pyroute2}):
+            link_states = ipintutil.get_link_states('asic0')
+
+        # one dump, taken inside the namespace
+        ipr.get_links.assert_called_once_with()
+        pyroute2.netns.pushns.assert_called_once_with('asic0')
+        pyroute2.netns.popns.assert_called_once_with()
+        assert link_states['Ethernet0'] == {'admin': 'up', 'oper': 'up', 'master': 'Vrf_red'}
+        assert link_states['Ethernet4'] == {'admin': 'down', 'oper': 'down', 'master': ''}
+        assert link_states['Ethernet8'] == {'admin': 'up', 'oper': 'down', 'master': ''}
+
+    def test_get_link_states_netns_error(self):
+        ipintutil = load_module_from_source('ipintutil', os.path.join(scripts_path, 'ipintutil'))
+        pyroute2 = mock.MagicMock()
+        pyroute2.netns.pushns.side_effect = OSError
+
+        with mock.patch.dict(sys.modules, {'pyroute2': pyroute2}):
+            assert ipintutil.get_link_states('asic0') == {}
+        pyroute2.netns.popns.assert_not_called()
+
+
 @pytest.mark.usefixtures('setup_teardown_multi_asic')
 class TestMultiAsicShowIpInt(object):
 
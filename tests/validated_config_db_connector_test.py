@@ -80,3 +80,103 @@ class TestValidatedConfigDBConnector(TestCase):
                     validated_config_db_connector.ValidatedConfigDBConnector.apply_patch(mock.Mock(), SAMPLE_PATCH, SAMPLE_TABLE)
                 except Exception as ex:
                     assert False, "Exception {} thrown unexpectedly".format(ex)
+
+    def test_batch_writes_applied_as_single_patch(self):
+        mock_generic_updater = mock.Mock()
+        connector = mock.Mock()
+        connector.get_table.side_effect = lambda table: {
+            "VLAN": {"Vlan1000": {"vlanid": "1000"}},
+            "VLAN_MEMBER": {("Vlan1000", "Ethernet0"): {"tagging_mode": "untagged"}},
+            "PORTCHANNEL": {"PortChannel01": {"mtu": "9100"}},
+        }.get(table, {})
+        expected_gcu_patch = jsonpatch.JsonPatch([
+            {"op": "remove", "path": "/VLAN_MEMBER/Vlan1000|Ethernet0"},
+            {"op": "add", "path": "/VLAN_MEMBER/Vlan1000|Ethernet4", "value": {"tagging_mode": "tagged"}},
+            {"op": "add", "path": "/VLAN_MEMBER/Vlan1000|Ethernet8", "value": {"tagging_mode": "tagged"}},
+            {"op": "add", "path": "/VLAN/Vlan1000/mtu", "value": "9100"},
+            {"op": "add", "path": "/SAMPLE_TABLE", "value": {"sample_key": {}}},
+            {"op": "remove", "path": "/PORTCHANNEL"}])
+        with mock.patch('validated_config_db_connector.device_info.is_yang_config_validation_enabled',
+                        return_value=True), \
+                mock.patch('validated_config_db_connector.GenericUpdater', return_value=mock_generic_updater):
+            config_db = ValidatedConfigDBConnector(connector)
+            with config_db.batch():
+                config_db.set_entry("VLAN_MEMBER", ("Vlan1000", "Ethernet4"), {"tagging_mode": "tagged"})
+                config_db.set_entry("VLAN_MEMBER", ("Vlan1000", "Ethernet8"), {"tagging_mode": "tagged"})
+                config_db.set_entry("VLAN_MEMBER", ("Vlan1000", "Ethernet0"), None)
+                config_db.mod_entry("VLAN", "Vlan1000", {"mtu": 9100})
+                config_db.set_entry("SAMPLE_TABLE", "sample_key", {"NULL": "NULL"})
+                config_db.delete_table("PORTCHANNEL")
+                mock_generic_updater.apply_patch.assert_not_called()
+
+        mock_generic_updater.apply_patch.assert_called_once()
+        assert mock_generic_updater.apply_patch.call_args.kwargs["patch"] == expected_gcu_patch
+        connector.set_entry.assert_not_called()
+        connector.mod_entry.assert_not_called()
+
+    def test_batch_exception_in_block_nothing_applied(self):
+        mock_generic_updater = mock.Mock()
+        connector = mock.Mock()
+        connector.get_table = mock.Mock(return_value={})
+        connector.get_entry = mock.Mock(return_value={})
+        with mock.patch('validated_config_db_connector.device_info.is_yang_config_validation_enabled',
+                        return_value=True), \
+                mock.patch('validated_config_db_connector.GenericUpdater', return_value=mock_generic_updater):
+            config_db = ValidatedConfigDBConnector(connector)
+            try:
+                with config_db.batch():
+                    config_db.set_entry(SAMPLE_TABLE, SAMPLE_KEY, SAMPLE_VALUE_DICT)
+                    raise ValueError()
+            except ValueError:
+                pass
+            config_db.set_entry(SAMPLE_TABLE, SAMPLE_KEY, SAMPLE_VALUE_DICT)
+
+        # Only the write made after the batch is applied
+        mock_generic_updater.apply_patch.assert_called_once()
+
+    def test_batch_yang_disabled_writes_made_as_called(self):
+        connector = mock.Mock()
+        connector.set_entry = mock.Mock()
+        with mock.patch('validated_config_db_connector.device_info.is_yang_config_validation_enabled',
+                        return_value=False):
+            config_db = ValidatedConfigDBConnector(connector)
+            with config_db.batch():
+                config_db.set_entry(SAMPLE_TABLE, SAMPLE_KEY, SAMPLE_VALUE_DICT)
+                connector.set_entry.assert_called_once_with(SAMPLE_TABLE, SAMPLE_KEY, SAMPLE_VALUE_DICT)
+
+    def test_batch_after_batch_calls(self):
+        mock_generic_updater = mock.Mock()
+        mock_generic_updater.apply_patch.side_effect = ValueError
+        connector = mock.Mock()
+        connector.get_table = mock.Mock(return_value={})
+        call = mock.Mock()
+        with mock.patch('validated_config_db_connector.device_info.is_yang_config_validation_enabled',
+                        return_value=True), \
+                mock.patch('validated_config_db_connector.GenericUpdater', return_value=mock_generic_updater):
+            config_db = ValidatedConfigDBConnector(connector)
+
+            # Not called when the block raises or the patch is rejected
+            try:
+                with config_db.batch():
+                    config_db.after_batch(call, "STP_VLAN")
+                    raise ValueError()
+            except ValueError:
+                pass
+            try:
+                with config_db.batch():
+                    config_db.set_entry(SAMPLE_TABLE, SAMPLE_KEY, SAMPLE_VALUE_DICT)
+                    config_db.after_batch(call, "STP_VLAN")
+            except ValueError:
+                pass
+            call.assert_not_called()
+
+            mock_generic_updater.apply_patch.side_effect = None
+            with config_db.batch():
+                config_db.set_entry(SAMPLE_TABLE, SAMPLE_KEY, SAMPLE_VALUE_DICT)
+                config_db.after_batch(call, "STP_VLAN")
+                call.assert_not_called()
+            call.assert_called_once_with("STP_VLAN")
+
+            # Called right away outside of a batch
+            config_db.after_batch(call, "STP_PORT")
+            call.assert_called_with("STP_PORT")
@@ -496,6 +496,73 @@ class TestVlan(object):
         assert result.exit_code != 0
         assert "{} is not integer".format(vid) in result.output
 
+    @mock.patch("config.validated_config_db_connector.device_info.is_yang_config_validation_enabled",
+                mock.Mock(return_value=True))
+    def test_config_vlan_add_multiple_vlan_failure_leaves_no_stp_vlan(self):
+        runner = CliRunner()
+        db = Db()
+
+        # Vlan2000 already exists, so the batch fails after Vlan1001 and Vlan1002
+        with mock.patch("config.validated_config_db_connector.GenericUpdater") as mock_generic_updater:
+            result = runner.invoke(config.config.commands["vlan"].commands["add"],
+                                   ["1001,1002,2000", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code != 0
+        assert "Vlan2000 already exists" in result.output
+        mock_generic_updater.return_value.apply_patch.assert_not_called()
+        assert not db.cfgdb.get_entry("STP_VLAN", "Vlan1001")
+        assert not db.cfgdb.get_entry("STP_VLAN", "Vlan1002")
+
+    @mock.patch("config.validated_config_db_connector.device_info.is_yang_config_validation_enabled",
+                mock.Mock(return_value=True))
+    def test_config_vlan_add_multiple_vlan_stp_vlan_after_batch(self):
+        runner = CliRunner()
+        db = Db()
+
+        with mock.patch("config.validated_config_db_connector.GenericUpdater") as mock_generic_updater:
+            result = runner.invoke(config.config.commands["vlan"].commands["add"],
+                                   ["1001,1002", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        mock_generic_updater.return_value.apply_patch.assert_called_once()
+        assert db.cfgdb.get_entry("STP_VLAN", "Vlan1001")["enabled"] == "true"
+        assert db.cfgdb.get_entry("STP_VLAN", "Vlan1002")["enabled"] == "true"
+
+    @mock.patch("config.validated_config_db_connector.device_info.is_yang_config_validation_enabled",
+                mock.Mock(return_value=True))
+    def test_config_vlan_add_member_multiple_failure_leaves_no_stp_port(self):
+        runner = CliRunner()
+        db = Db()
+
+        # Vlan1001 does not exist, so the batch fails after adding Ethernet20 to Vlan1000
+        with mock.patch("config.validated_config_db_connector.GenericUpdater") as mock_generic_updater:
+            result = runner.invoke(config.config.commands["vlan"].commands["member"].commands["add"],
+                                   ["1000,1001", "Ethernet20", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code != 0
+        assert "Vlan1001 does not exist" in result.output
+        mock_generic_updater.return_value.apply_patch.assert_not_called()
+        assert not db.cfgdb.get_entry("STP_PORT", "Ethernet20")
+
+    @mock.patch("config.validated_config_db_connector.device_info.is_yang_config_validation_enabled",
+                mock.Mock(return_value=True))
+    def test_config_vlan_add_member_multiple_single_stp_port_write(self):
+        runner = CliRunner()
+        db = Db()
+
+        with mock.patch("config.validated_config_db_connector.GenericUpdater") as mock_generic_updater, \
+                mock.patch("config.stp.interface_enable_stp") as mock_interface_enable_stp:
+            result = runner.invoke(config.config.commands["vlan"].commands["member"].commands["add"],
+                                   ["1000,2000,3000", "Ethernet20", "--multiple"], obj=db)
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        mock_generic_updater.return_value.apply_patch.assert_called_once()
+        mock_interface_enable_stp.assert_called_once_with(db.cfgdb, "Ethernet20")
+
     def test_config_vlan_add_vlan_is_digit_fail(self):
         runner = CliRunner()
         vid = "test_fail_case"
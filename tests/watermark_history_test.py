@@ -0,0 +1,73 @@
+import datetime
+import os
+
+import pytest
+
+from utilities_common.watermark_history import WatermarkHistory
+
+Q_SHARED = 'SAI_QUEUE_STAT_SHARED_WATERMARK_BYTES'
+PG_SHARED = 'SAI_INGRESS_PRIORITY_GROUP_STAT_SHARED_WATERMARK_BYTES'
+COLUMNS = [PG_SHARED, Q_SHARED]
+
+NOW = datetime.datetime(2025, 1, 1, 12, 0, 0)
+
+
+def minutes_ago(minutes):
+    return NOW - datetime.timedelta(minutes=minutes)
+
+
+class TestWatermarkHistory(object):
+    def test_get_max(self, tmp_path):
+        history = WatermarkHistory(str(tmp_path))
+        history.record({'Ethernet0:0': {Q_SHARED: '100', PG_SHARED: '7'}}, COLUMNS, minutes_ago(90))
+        history.record({'Ethernet0:0': {Q_SHARED: '20'}, 'Ethernet0:1': {Q_SHARED: '5'}}, COLUMNS, minutes_ago(30))
+        history.record({'Ethernet0:0': {Q_SHARED: '50', PG_SHARED: '3'}}, COLUMNS, minutes_ago(10))
+
+        peaks, samples = history.get_max(3600, NOW)
+
+        assert samples == 2
+        assert peaks == {'Ethernet0:0': {Q_SHARED: 50, PG_SHARED: 3}, 'Ethernet0:1': {Q_SHARED: 5}}
+
+    def test_get_max_no_samples(self, tmp_path):
+        history = WatermarkHistory(str(tmp_path / 'missing'))
+
+        assert history.get_max(3600, NOW) == ({}, 0)
+
+    def test_record_overwrites_oldest_sample(self, tmp_path):
+        history = WatermarkHistory(str(tmp_path), size=2)
+        paths = []
+        for minutes, value in [(3, '1'), (2, '2'), (1, '3')]:
+            paths.append(history.record({'Ethernet0:0': {Q_SHARED: value}}, COLUMNS, minutes_ago(minutes)))
+            # Make the sample files' modification times distinct
+            os.utime(paths[-1], ns=(len(paths), len(paths)))
+
+        samples = history.load_samples()
+
+        assert paths[2] == paths[0]
+        assert len(history.get_sample_paths()) == 2
+        assert [snapshot.get('Ethernet0:0', Q_SHARED) for snapshot in samples] == [2, 3]
+
+    def test_record_smaller_size_removes_extra_samples(self, tmp_path):
+        for minutes in [3, 2, 1]:
+            WatermarkHistory(str(tmp_path), size=3).record({'Ethernet0:0': {Q_SHARED: '1'}}, COLUMNS,
+                                                           minutes_ago(minutes))
+
+        WatermarkHistory(str(tmp_path), size=1).record({'Ethernet0:0': {Q_SHARED: '2'}}, COLUMNS, NOW)
+
+        assert len(WatermarkHistory(str(tmp_path), size=1).get_sample_paths()) == 1
+
+    def test_load_samples_skips_corrupted_sample(self, tmp_path):
+        history = WatermarkHistory(str(tmp_path))
+        history.record({'Ethernet0:0': {Q_SHARED: '1'}}, COLUMNS, NOW)
+        with open(history.get_sample_path(1), 'wb') as f:
+            f.write(b'garbage')
+
+        assert len(history.load_samples()) == 1
+
+    def test_for_namespace(self, tmp_path):
+        assert WatermarkHistory.for_namespace('', str(tmp_path)).directory == str(tmp_path / 'host')
+        assert WatermarkHistory.for_namespace('asic0', str(tmp_path)).directory == str(tmp_path / 'asic0')
+
+    def test_invalid_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            WatermarkHistory(str(tmp_path), size=0)
@@ -3,6 +3,7 @@ import sys
 import pytest
 import show.main as show
 from click.testing import CliRunner
+from utilities_common.general import load_module_from_source
 from wm_input.wm_test_vectors import testData
 
 test_path = os.path.dirname(os.path.abspath(__file__))
@@ -73,6 +74,18 @@ class TestWatermarkstat(object):
     def test_show_headroom_pool_persistent_wm(self):
         self.executor(testData['show_hdrm_pool_pwm'])
 
+    def test_record_and_show_history(self, tmp_path, capsys):
+        watermarkstat = load_module_from_source('watermarkstat', os.path.join(scripts_path, 'watermarkstat'))
+        wrapper = watermarkstat.WatermarkstatWrapper(None, str(tmp_path), 2)
+
+        wrapper.run(False, False, None, True)
+        wrapper.run(False, False, 'q_shared_uni', False, 3600)
+
+        output = capsys.readouterr().out
+        assert "Egress shared pool occupancy per unicast queue:" in output
+        assert "Maximum over the last 3600s (1 sample)" in output
+        assert len(os.listdir(os.path.join(str(tmp_path), 'host'))) == 1
+
     def executor(self, testcase):
         runner = CliRunner()
 
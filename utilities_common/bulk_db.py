@@ -0,0 +1,188 @@
+'''
+Pipelined bulk reads from the SONiC redis databases.
+
+SonicV2Connector.get/get_all issue one redis round trip per key (and per field
+for get). The show scripts call them for every port, queue or counter, so on
+a large box they spend most of their time waiting on the socket.
+
+BulkDbReader batches HGETALL/HGET/HMGET requests for many keys into redis
+pipelines and hands back plain dicts, so a script can load a whole table or
+counter map in a handful of round trips:
+
+    reader = BulkDbReader(db)
+    counters = reader.get_all(db.COUNTERS_DB, ['COUNTERS:oid:0x1', ...])
+
+The reader works on top of an already connected SonicV2Connector, so it
+follows whatever namespace the connector was created for. When the client
+returned by the connector does not support pipelining (swsscommon's
+DBConnector), a redis-py connection to the same unix socket is opened; if that
+is not possible either, the reader falls back to one request per key.
+'''
+
+from sonic_py_common import multi_asic
+from swsscommon.swsscommon import SonicDBConfig
+
+from utilities_common import constants
+
+# Number of commands queued in one pipeline before it is flushed. Large
+# enough to amortize the round trip, small enough to keep a single reply
+# from holding up the redis event loop.
+DEFAULT_BATCH_SIZE = 1000
+
+# COUNT hint passed to SCAN
+SCAN_COUNT = 1000
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class BulkDbReader(object):
+    '''
+    Batched reader for one SonicV2Connector (i.e. one namespace)
+    '''
+
+    def __init__(self, db, batch_size=DEFAULT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+        self.round_trips = 0
+        self._clients = {}
+
+    @classmethod
+    def for_namespace(cls, namespace=constants.DEFAULT_NAMESPACE, batch_size=DEFAULT_BATCH_SIZE):
+        '''
+        Connect to all the DBs of <namespace> and return a reader for them
+        '''
+        return cls(multi_asic.connect_to_all_dbs_for_ns(namespace), batch_size)
+
+    def _get_namespace(self):
+        namespace = getattr(self.db, 'namespace', None)
+        if callable(namespace):
+            namespace = namespace()
+        return namespace or constants.DEFAULT_NAMESPACE
+
+    def _open_redis_client(self, db_name):
+        try:
+            import redis
+        except ImportError:
+            return None
+
+        namespace = self._get_namespace()
+        try:
+            client = redis.Redis(unix_socket_path=SonicDBConfig.getDbSock(db_name, namespace),
+                                 db=SonicDBConfig.getDbId(db_name, namespace),
+                                 decode_responses=True)
+            client.ping()
+        except Exception:
+            return None
+        return client
+
+    def get_client(self, db_name):
+        '''
+        Return a client supporting pipeline() for <db_name>, or the plain
+        connector client when pipelining is unavailable.
+        '''
+        if db_name in self._clients:
+            return self._clients[db_name]
+
+        client = self.db.get_redis_client(db_name)
+        if not hasattr(client, 'pipeline'):
+            client = self._open_redis_client(db_name) or client
+
+        self._clients[db_name] = client
+        return client
+
+    def _execute(self, db_name, keys, queue, fallback):
+        '''
+        Run one command per key, pipelined in batches when possible.
+        queue(pipe, key) adds the command for <key> to a pipeline,
+        fallback(client, key) runs it directly on a non-pipelining client.
+        Returns the replies in the order of <keys>.
+        '''
+        client = self.get_client(db_name)
+        replies = []
+        if not hasattr(client, 'pipeline'):
+            for key in keys:
+                self.round_trips += 1
+                replies.append(fallback(client, key))
+            return replies
+
+        for chunk in _chunks(keys, self.batch_size):
+            pipe = client.pipeline(transaction=False)
+            for key in chunk:
+                queue(pipe, key)
+            self.round_trips += 1
+            replies.extend(pipe.execute())
+        return replies
+
+    def keys(self, db_name, pattern='*'):
+        '''
+        Return the keys matching <pattern> using SCAN rather than KEYS, so a
+        large table does not block the DB for the whole walk.
+        '''
+        client = self.get_client(db_name)
+        if not hasattr(client, 'scan_iter'):
+            self.round_trips += 1
+            return list(client.keys(pattern) or [])
+
+        keys = []
+        cursor = '0'
+        while True:
+            self.round_trips += 1
+            cursor, batch = client.scan(cursor=cursor, match=pattern, count=SCAN_COUNT)
+            keys.extend(batch)
+            if int(cursor) == 0:
+                break
+        # SCAN may return a key more than once
+        return list(dict.fromkeys(keys))
+
+    def get_all(self, db_name, keys):
+        '''
+        HGETALL every key in <keys>.
+        Returns {key: {field: value}}; keys which do not exist are omitted.
+        '''
+        keys = list(keys)
+        replies = self._execute(db_name, keys,
+                                lambda pipe, key: pipe.hgetall(key),
+                                lambda client, key: client.hgetall(key))
+        return {key: dict(reply) for key, reply in zip(keys, replies) if reply}
+
+    def get(self, db_name, keys, field):
+        '''
+        HGET <field> from every key in <keys>.
+        Returns {key: value}; keys without the field are omitted.
+        '''
+        keys = list(keys)
+        replies = self._execute(db_name, keys,
+                                lambda pipe, key: pipe.hget(key, field),
+                                lambda client, key: client.hget(key, field))
+        return {key: reply for key, reply in zip(keys, replies) if reply is not None}
+
+    def get_fields(self, db_name, keys, fields):
+        '''
+        HMGET <fields> from every key in <keys>.
+        Returns {key: {field: value}} holding only the fields that exist;
+        keys with none of the fields are omitted.
+        '''
+        keys = list(keys)
+        fields = list(fields)
+
+        def fallback(client, key):
+            return [client.hget(key, field) for field in fields]
+
+        replies = self._execute(db_name, keys,
+                                lambda pipe, key: pipe.hmget(key, fields),
+                                fallback)
+        result = {}
+        for key, values in zip(keys, replies):
+            entry = {field: value for field, value in zip(fields, values) if value is not None}
+            if entry:
+                result[key] = entry
+        return result
+
+    def get_table(self, db_name, pattern):
+        '''
+        Return {key: {field: value}} for every hash matching <pattern>
+        '''
+        return self.get_all(db_name, self.keys(db_name, pattern))
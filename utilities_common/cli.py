@@ -5,6 +5,7 @@ import re
 import subprocess
 import sys
 import shutil
+import weakref
 
 import click
 import json
@@ -145,51 +146,54 @@ class InterfaceAliasConverter(object):
             except KeyError:
                 break
 
+        # Index both directions once, so that translating every row of a
+        # table does not scan the port table for each of them. When an
+        # alias is shared by several ports, the first one keeps it.
+        self._name_to_alias = {}
+        self._alias_to_name = {}
+        for port_name, port in self.port_dict.items():
+            if 'alias' not in port:
+                continue
+            self._name_to_alias[port_name] = port['alias']
+            self._alias_to_name.setdefault(port['alias'], port_name)
+
+    @staticmethod
+    def _split_sub_interface(interface):
+        """Return (parent port, sub interface suffix including the separator)"""
+        sub_intf_sep_idx = interface.find(VLAN_SUB_INTERFACE_SEPARATOR)
+        if sub_intf_sep_idx == -1:
+            return interface, ''
+        return interface[:sub_intf_sep_idx], interface[sub_intf_sep_idx:]
+
     def name_to_alias(self, interface_name):
         """Return vendor interface alias if SONiC
            interface name is given as argument
         """
-        vlan_id = ''
-        sub_intf_sep_idx = -1
-        if interface_name is not None:
-            sub_intf_sep_idx = interface_name.find(VLAN_SUB_INTERFACE_SEPARATOR)
-            if sub_intf_sep_idx != -1:
-                vlan_id = interface_name[sub_intf_sep_idx + 1:]
-                # interface_name holds the parent port name
-                interface_name = interface_name[:sub_intf_sep_idx]
-
-            for port_name in self.port_dict:
-                if interface_name == port_name:
-                    return self.port_dict[port_name]['alias'] if sub_intf_sep_idx == -1 \
-                            else self.port_dict[port_name]['alias'] + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+        if interface_name is None:
+            return None
 
+        port_name, suffix = self._split_sub_interface(interface_name)
         # interface_name not in port_dict. Just return interface_name
-        return interface_name if sub_intf_sep_idx == -1 else interface_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+        return self._name_to_alias.get(port_name, port_name) + suffix
 
     def alias_to_name(self, interface_alias):
         """Return SONiC interface name if vendor
            port alias is given as argument
         """
-        vlan_id = ''
-        sub_intf_sep_idx = -1
-        if interface_alias is not None:
-            sub_intf_sep_idx = interface_alias.find(VLAN_SUB_INTERFACE_SEPARATOR)
-            if sub_intf_sep_idx != -1:
-                vlan_id = interface_alias[sub_intf_sep_idx + 1:]
-                # interface_alias holds the parent port alias
-                interface_alias = interface_alias[:sub_intf_sep_idx]
-
-            for port_name in self.port_dict:
-                if interface_alias == self.port_dict[port_name]['alias']:
-                    return port_name if sub_intf_sep_idx == -1 else port_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+        if interface_alias is None:
+            return None
 
+        alias, suffix = self._split_sub_interface(interface_alias)
         # interface_alias not in port_dict. Just return interface_alias
-        return interface_alias if sub_intf_sep_idx == -1 else interface_alias + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+        return self._alias_to_name.get(alias, alias) + suffix
 
 
 # Lazy global class instance for SONiC interface name to alias conversion
 iface_alias_converter = lazy_object_proxy.Proxy(lambda: InterfaceAliasConverter())
 
+# InterfaceAliasConverter of each Db object, see get_interface_alias_converter
+_iface_alias_converters = weakref.WeakKeyDictionary()
+
 
 def get_interface_naming_mode():
     mode = os.getenv('SONIC_CLI_IFACE_MODE')
@@ -468,11 +472,27 @@ def get_vlan_id(vlan):
     return vid
 
 
+def get_interface_alias_converter(db):
+    """Return the InterfaceAliasConverter of <db>, built on first use
+
+    Commands translate interface names row by row, the converter is kept
+    per Db object so that the PORT table is read and indexed only once.
+    A converter built without a Db is not cached.
+    """
+    if db is None:
+        return InterfaceAliasConverter(None)
+
+    converter = _iface_alias_converters.get(db)
+    if converter is None:
+        converter = InterfaceAliasConverter(db)
+        _iface_alias_converters[db] = converter
+    return converter
+
+
 def get_interface_name_for_display(db, interface):
     interface_naming_mode = get_interface_naming_mode()
-    iface_alias_converter = InterfaceAliasConverter(db)
     if interface_naming_mode == "alias" and interface:
-        return iface_alias_converter.name_to_alias(interface)
+        return get_interface_alias_converter(db).name_to_alias(interface)
     return interface
 
 
@@ -0,0 +1,267 @@
+'''
+Compact binary snapshots of counters for "clear counters" baselines.
+
+The stat scripts keep the counters saved by "clear" in a UserCache directory
+and read them back on every show. Storing them as JSON dicts of strings means
+parsing the whole file each time, which gets slow with tens of thousands of
+queues. A snapshot file stores the same data as a fixed-width uint64 array
+that is memory-mapped on load, so reading a baseline costs little more than
+reading the row and column names.
+
+File layout (little-endian):
+
+    header    magic "SNCS", version, flags, number of rows, number of
+              columns, length of the names block
+    names     NUL separated: the snapshot time, the row names (e.g. port or
+              queue names), then the column names (counter names)
+    padding   up to an 8 byte boundary
+    values    rows x columns uint64, row-major; NA_VALUE marks N/A
+
+The legacy JSON format ({"time": ..., row: {column: value}}) can still be
+imported and exported, so existing cache files keep working.
+'''
+
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+
+from utilities_common import netstat
+from utilities_common.netstat import CounterMatrix, STATUS_NA
+
+MAGIC = b'SNCS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')
+VALUE_SIZE = 8
+# Counters are 64-bit, the all-ones value is reserved to mark N/A
+NA_VALUE = 0xFFFFFFFFFFFFFFFF
+SNAPSHOT_SUFFIX = '.snap'
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _align(offset):
+    return (offset + VALUE_SIZE - 1) // VALUE_SIZE * VALUE_SIZE
+
+
+def _to_value(value):
+    if value is None or value == STATUS_NA:
+        return NA_VALUE
+    if isinstance(value, str):
+        value = value.replace(',', '')
+        try:
+            return int(value)
+        except ValueError:
+            return int(float(value))
+    return int(value)
+
+
+class CounterSnapshot(object):
+    '''
+    A rows x columns table of counters, saved as a snapshot file
+    '''
+
+    def __init__(self, rows, columns, values, time=None):
+        '''
+        <values> is a flat, row-major sequence of ints (NA_VALUE for N/A)
+        '''
+        self.rows = list(rows)
+        self.columns = list(columns)
+        self.values = values
+        self.time = time
+        self.row_index = {row: i for i, row in enumerate(self.rows)}
+        self.column_index = {column: j for j, column in enumerate(self.columns)}
+        self._mmap = None
+        self._values_offset = 0
+
+    @classmethod
+    def from_cnstat_dict(cls, cnstat_dict, columns, rows=None):
+        '''
+        Build a snapshot from a {row: {column: value}} cnstat dict.
+        The 'time' key, if any, becomes the snapshot time.
+        '''
+        if rows is None:
+            rows = [row for row in cnstat_dict if row != 'time']
+        values = array.array('Q')
+        for row in rows:
+            cntr = cnstat_dict.get(row) or {}
+            if hasattr(cntr, '_asdict'):
+                cntr = cntr._asdict()
+            values.extend(_to_value(cntr.get(column)) for column in columns)
+
+        time = cnstat_dict.get('time')
+        if time is not None and not isinstance(time, str):
+            time = time.isoformat()
+        return cls(rows, columns, values, time)
+
+    @classmethod
+    def load(cls, path):
+        '''
+        Memory-map the snapshot file at <path>
+        '''
+        with open(path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError("Empty snapshot file {}".format(path))
+
+        if len(mm) < HEADER.size:
+            raise SnapshotError("Truncated snapshot file {}".format(path))
+        magic, version, _, nrows, ncols, names_len = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise SnapshotError("{} is not a counter snapshot".format(path))
+        if version != VERSION:
+            raise SnapshotError("Unsupported snapshot version {} in {}".format(version, path))
+
+        names = mm[HEADER.size:HEADER.size + names_len].decode('utf-8').split('\0')
+        if len(names) != 1 + nrows + ncols:
+            raise SnapshotError("Corrupted snapshot file {}".format(path))
+        offset = _align(HEADER.size + names_len)
+        if len(mm) < offset + nrows * ncols * VALUE_SIZE:
+            raise SnapshotError("Truncated snapshot file {}".format(path))
+
+        values = memoryview(mm)[offset:offset + nrows * ncols * VALUE_SIZE]
+        if sys.byteorder == 'little':
+            values = values.cast('Q')
+        else:
+            values = array.array('Q', values.tobytes())
+            values.byteswap()
+
+        snapshot = cls(names[1:1 + nrows], names[1 + nrows:], values, names[0] or None)
+        snapshot._mmap = mm
+        snapshot._values_offset = offset
+        return snapshot
+
+    def save(self, path):
+        '''
+        Write the snapshot to <path>. The file is replaced atomically.
+        '''
+        names = '\0'.join([self.time or ''] + self.rows + self.columns).encode('utf-8')
+        values = array.array('Q', self.values)
+        if sys.byteorder != 'little':
+            values.byteswap()
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, 0, len(self.rows), len(self.columns), len(names)))
+            f.write(names)
+            f.write(b'\0' * (_align(HEADER.size + len(names)) - HEADER.size - len(names)))
+            f.write(values.tobytes())
+        os.replace(tmp_path, path)
+
+    def close(self):
+        if self._mmap is not None:
+            if isinstance(self.values, memoryview):
+                self.values.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __contains__(self, row):
+        return row in self.row_index
+
+    def get(self, row, column):
+        '''
+        Return the value of a counter as int, STATUS_NA if it is N/A or missing
+        '''
+        i = self.row_index.get(row)
+        j = self.column_index.get(column)
+        if i is None or j is None:
+            return STATUS_NA
+        value = self.values[i * len(self.columns) + j]
+        return STATUS_NA if value == NA_VALUE else value
+
+    def get_row(self, row):
+        '''
+        Return the counters of <row> as a {column: str} dict, like the
+        entries of the legacy JSON snapshot
+        '''
+        return {column: str(self.get(row, column)) for column in self.columns}
+
+    def to_cnstat_dict(self, rows=None):
+        '''
+        Return the snapshot (or just <rows>) as a legacy cnstat dict
+        '''
+        cnstat_dict = {'time': self.time}
+        for row in self.rows if rows is None else rows:
+            if row in self.row_index:
+                cnstat_dict[row] = self.get_row(row)
+        return cnstat_dict
+
+    def to_matrix(self):
+        '''
+        Return the snapshot as a CounterMatrix. With NumPy the values are
+        read straight from the mapped file.
+        '''
+        nrows, ncols = len(self.rows), len(self.columns)
+        numpy = netstat.numpy
+        if numpy is not None:
+            if self._mmap is not None and sys.byteorder == 'little':
+                raw = numpy.frombuffer(self._mmap, dtype=numpy.uint64, count=nrows * ncols,
+                                       offset=self._values_offset)
+            else:
+                raw = numpy.array(self.values, dtype=numpy.uint64)
+            raw = raw.reshape((nrows, ncols))
+            na = raw == numpy.uint64(NA_VALUE)
+            return CounterMatrix(self.rows, self.columns, numpy.where(na, numpy.uint64(0), raw), na)
+
+        values = []
+        na = []
+        for i in range(nrows):
+            row = [self.values[i * ncols + j] for j in range(ncols)]
+            na.append([value == NA_VALUE for value in row])
+            values.append([0 if value == NA_VALUE else value for value in row])
+        return CounterMatrix(self.rows, self.columns, values, na)
+
+    @classmethod
+    def import_json(cls, path, columns=None):
+        '''
+        Read a legacy JSON snapshot. Without <columns>, the columns are
+        those of the first row.
+        '''
+        with open(path, 'r') as f:
+            cnstat_dict = json.load(f)
+        if columns is None:
+            first = next((row for row in cnstat_dict if row != 'time'), None)
+            columns = list(cnstat_dict[first]) if first is not None else []
+        return cls.from_cnstat_dict(cnstat_dict, columns)
+
+    def export_json(self, path):
+        '''
+        Write the snapshot in the legacy JSON format
+        '''
+        with open(path, 'w') as f:
+            json.dump(self.to_cnstat_dict(), f)
+
+
+def get_snapshot_path(cache, name):
+    return os.path.join(cache.get_directory(), name + SNAPSHOT_SUFFIX)
+
+
+def save_snapshot(cache, name, cnstat_dict, columns):
+    '''
+    Save <cnstat_dict> as snapshot <name> in UserCache <cache>
+    '''
+    snapshot = CounterSnapshot.from_cnstat_dict(cnstat_dict, columns)
+    snapshot.save(get_snapshot_path(cache, name))
+    return snapshot
+
+
+def load_snapshot(cache, name, columns=None):
+    '''
+    Load snapshot <name> from UserCache <cache>. A legacy JSON file called
+    <name> is imported if there is no binary snapshot. Returns None if
+    neither exists.
+    '''
+    path = get_snapshot_path(cache, name)
+    if os.path.isfile(path):
+        return CounterSnapshot.load(path)
+
+    legacy_path = os.path.join(cache.get_directory(), name)
+    if os.path.isfile(legacy_path):
+        return CounterSnapshot.import_json(legacy_path, columns)
+
+    return None
@@ -1,21 +1,61 @@
+import functools
+import threading
+import time
+from collections.abc import MutableMapping
+
 from sonic_py_common import multi_asic, device_info
-from swsscommon.swsscommon import ConfigDBConnector, ConfigDBPipeConnector, SonicV2Connector
+from swsscommon.swsscommon import ConfigDBConnector, SonicV2Connector
 from utilities_common import constants
-from utilities_common.multi_asic import multi_asic_ns_choices
+from utilities_common.multi_asic import multi_asic_ns_choices, connect_config_db_pipe_for_ns
 
 
-class Db(object):
+class DbConnectMetrics(object):
+    """
+    Number of connections opened by a Db and the time spent opening them
+    """
     def __init__(self):
-        self.cfgdb_clients = {}
-        self.db_clients = {}
-        self.cfgdb = ConfigDBConnector()
-        self.cfgdb.connect()
-        self.cfgdb_pipe = ConfigDBPipeConnector()
-        self.cfgdb_pipe.connect()
-        self.db = SonicV2Connector(host="127.0.0.1")
+        self.connections = 0
+        self.connect_time = 0.0
+        # {(namespace, db name): seconds}, config DB connectors use
+        # 'CONFIG_DB' and 'CONFIG_DB_PIPE' as db name
+        self.latencies = {}
+
+    def record(self, namespace, db_name, seconds):
+        self.connections += 1
+        self.connect_time += seconds
+        self.latencies[(namespace, db_name)] = seconds
+
+    def as_dict(self):
+        return {
+            'connections': self.connections,
+            'connect_time': self.connect_time,
+            'latencies': {'{}/{}'.format(ns or 'default', db_name): seconds
+                          for (ns, db_name), seconds in self.latencies.items()},
+        }
+
+
+def _timed_connect(metrics, namespace, db_name, connect):
+    start = time.monotonic()
+    result = connect()
+    metrics.record(namespace, db_name, time.monotonic() - start)
+    return result
+
+
+class LazyDbConnector(object):
+    """
+    Wraps a SonicV2Connector and connects each DB the first time a method
+    is called for it, e.g. db.get_all(db.APPL_DB, ...) connects APPL_DB.
+    Everything else is forwarded to the connector.
+    """
+    def __init__(self, connector, namespace, metrics):
+        self._connector = connector
+        self._namespace = namespace
+        self._metrics = metrics
+        self._connected = set()
+        self._lock = threading.Lock()
 
         # Skip connecting to chassis databases in line cards
-        self.db_list = list(self.db.get_db_list())
+        self.db_list = list(connector.get_db_list())
         if not device_info.is_supervisor():
             try:
                 self.db_list.remove('CHASSIS_APP_DB')
@@ -23,19 +63,149 @@ class Db(object):
             except Exception:
                 pass
 
-        for db_id in self.db_list:
-            self.db.connect(db_id)
+    def connect(self, db_name, retry_on=True):
+        with self._lock:
+            if db_name not in self._connected:
+                _timed_connect(self._metrics, self._namespace, db_name,
+                               lambda: self._connector.connect(db_name, retry_on))
+                self._connected.add(db_name)
+
+    def connect_all(self):
+        for db_name in self.db_list:
+            self.connect(db_name)
+
+    def close(self, db_name):
+        with self._lock:
+            if db_name in self._connected:
+                self._connector.close(db_name)
+                self._connected.discard(db_name)
+
+    def __getattr__(self, name):
+        attr = getattr(self._connector, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            db_name = args[0] if args else kwargs.get('db_name')
+            if db_name in self.db_list:
+                self.connect(db_name)
+            return attr(*args, **kwargs)
+        return call
+
+
+class LazyConnectors(MutableMapping):
+    """
+    {namespace: connector} mapping which creates the connector of a
+    namespace the first time it is looked up. Iterating over it connects
+    all the namespaces.
+    """
+    def __init__(self, namespaces, connect):
+        self.namespaces = list(namespaces)
+        self._connect = connect
+        self._connectors = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, namespace):
+        with self._lock:
+            if namespace not in self._connectors:
+                if namespace not in self.namespaces:
+                    raise KeyError(namespace)
+                self._connectors[namespace] = self._connect(namespace)
+            return self._connectors[namespace]
+
+    def __setitem__(self, namespace, connector):
+        if namespace not in self.namespaces:
+            self.namespaces.append(namespace)
+        self._connectors[namespace] = connector
+
+    def __delitem__(self, namespace):
+        self.namespaces.remove(namespace)
+        self._connectors.pop(namespace, None)
 
-        self.cfgdb_clients[constants.DEFAULT_NAMESPACE] = self.cfgdb
-        self.db_clients[constants.DEFAULT_NAMESPACE] = self.db
+    def __contains__(self, namespace):
+        return namespace in self.namespaces
 
+    def __iter__(self):
+        return iter(list(self.namespaces))
+
+    def __len__(self):
+        return len(self.namespaces)
+
+    def connected(self):
+        """
+        Return the namespaces connected so far
+        """
+        return list(self._connectors)
+
+    def connect_all(self):
+        return [self[namespace] for namespace in self.namespaces]
+
+
+class Db(object):
+    """
+    Connectors to the DBs of every namespace. Nothing is connected up front:
+    each connector is opened the first time it is used and then reused, so a
+    command only pays for the DBs it actually reads. The connections opened
+    are recorded in self.metrics.
+    """
+    def __init__(self):
+        self.metrics = DbConnectMetrics()
+
+        namespaces = [constants.DEFAULT_NAMESPACE]
         if multi_asic.is_multi_asic():
             self.ns_list = multi_asic_ns_choices()
-            for ns in self.ns_list:
-                self.cfgdb_clients[ns] = (
-                    multi_asic.connect_config_db_for_ns(ns)
-                )
-                self.db_clients[ns] = multi_asic.connect_to_all_dbs_for_ns(ns)
+            namespaces += self.ns_list
+        self.cfgdb_clients = LazyConnectors(namespaces, self._connect_config_db)
+        self.cfgdb_pipe_clients = LazyConnectors(namespaces, self._connect_config_db_pipe)
+        self.db_clients = LazyConnectors(namespaces, self._connect_dbs)
+
+    def _connect_config_db(self, namespace):
+        if namespace == constants.DEFAULT_NAMESPACE:
+            def connect():
+                cfgdb = ConfigDBConnector()
+                cfgdb.connect()
+                return cfgdb
+        else:
+            def connect():
+                return multi_asic.connect_config_db_for_ns(namespace)
+        return _timed_connect(self.metrics, namespace, 'CONFIG_DB', connect)
+
+    def _connect_dbs(self, namespace):
+        if namespace == constants.DEFAULT_NAMESPACE:
+            connector = SonicV2Connector(host="127.0.0.1")
+        else:
+            connector = SonicV2Connector(use_unix_socket_path=True, namespace=namespace)
+        return LazyDbConnector(connector, namespace, self.metrics)
+
+    @property
+    def cfgdb(self):
+        return self.cfgdb_clients[constants.DEFAULT_NAMESPACE]
+
+    @property
+    def cfgdb_pipe(self):
+        return self.cfgdb_pipe_clients[constants.DEFAULT_NAMESPACE]
+
+    def _connect_config_db_pipe(self, namespace):
+        return _timed_connect(self.metrics, namespace, 'CONFIG_DB_PIPE',
+                              lambda: connect_config_db_pipe_for_ns(namespace))
+
+    @property
+    def db(self):
+        return self.db_clients[constants.DEFAULT_NAMESPACE]
+
+    @property
+    def db_list(self):
+        return self.db.db_list
+
+    def connect_all(self):
+        """
+        Connect every DB of every namespace, as the eager Db used to
+        """
+        self.cfgdb_clients.connect_all()
+        for connector in self.db_clients.connect_all():
+            connector.connect_all()
+        return self.cfgdb_pipe
 
     def get_data(self, table, key):
         data = self.cfgdb.get_table(table)
@@ -0,0 +1,174 @@
+'''
+Index of the FDB entries programmed in ASIC_DB.
+
+fdbshow, nbrshow, fast-reboot-dump and dualtor_neighbor_check all need the
+ASIC FDB entries resolved to a VLAN id and a port. Each of them used to walk
+ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY on its own with KEYS and one HGETALL per
+entry (once per VLAN for fast-reboot-dump), and resolve the bridge ports and
+VLAN objects one request at a time.
+
+FdbReader SCANs the FDB entries, bridge ports and VLAN objects once, reads them
+with pipelined requests (see bulk_db) and returns an FdbIndex:
+
+    index = FdbReader(db).read(port_names)
+    index.get_by_vlan(1000)
+    index.get(1000, '7C:FE:90:80:9F:05')
+
+Object ids are kept the way sonic_py_common.port_util reports them: bridge
+port and port ids without their "oid:0x" prefix, so port_util's interface
+maps can be used as <port_names>. The bvid is kept as it appears in the FDB
+entry key.
+'''
+
+import json
+from collections import namedtuple
+
+from utilities_common.bulk_db import BulkDbReader
+
+FDB_ENTRY_PREFIX = 'ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:'
+BRIDGE_PORT_PREFIX = 'ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT:'
+VLAN_PREFIX = 'ASIC_STATE:SAI_OBJECT_TYPE_VLAN:'
+OID_PREFIX = 'oid:0x'
+
+FDB_ENTRY_TYPE_STATIC = 'SAI_FDB_ENTRY_TYPE_STATIC'
+FDB_ENTRY_TYPE_DYNAMIC = 'SAI_FDB_ENTRY_TYPE_DYNAMIC'
+
+# mac: as found in the entry key
+# vlan: VLAN id (int), None when it cannot be resolved
+# bvid: bridge VLAN object id of the entry, None for entries keyed by VLAN id
+# bridge_port_id, port_id: object ids without "oid:0x", port_id is None when
+#   the bridge port is unknown
+# port: name of the port from <port_names>, None when not found
+# type: SAI FDB entry type, e.g. SAI_FDB_ENTRY_TYPE_DYNAMIC
+FdbEntry = namedtuple('FdbEntry', ['mac', 'vlan', 'bvid', 'bridge_port_id', 'port_id', 'port', 'type'])
+
+
+def strip_oid(oid):
+    return oid[len(OID_PREFIX):] if oid.startswith(OID_PREFIX) else oid
+
+
+class FdbIndex(object):
+    '''
+    FDB entries of one ASIC, looked up by MAC, VLAN or port
+    '''
+
+    def __init__(self, entries, bridge_ports, vlans):
+        self.entries = entries
+        # {bridge port id: port id}
+        self.bridge_ports = bridge_ports
+        # {bvid: VLAN id or None} of every VLAN object in ASIC_DB
+        self.vlans = vlans
+
+        self._by_mac = {}
+        self._by_vlan = {}
+        self._by_port = {}
+        self._by_vlan_mac = {}
+        for entry in entries:
+            mac = entry.mac.lower()
+            self._by_mac.setdefault(mac, []).append(entry)
+            if entry.vlan is not None:
+                self._by_vlan.setdefault(entry.vlan, []).append(entry)
+                self._by_vlan_mac[(entry.vlan, mac)] = entry
+            if entry.port is not None:
+                self._by_port.setdefault(entry.port, []).append(entry)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def get(self, vlan, mac):
+        '''
+        Return the entry of <mac> in <vlan>, or None
+        '''
+        return self._by_vlan_mac.get((int(vlan), mac.lower()))
+
+    def get_by_mac(self, mac):
+        return list(self._by_mac.get(mac.lower(), []))
+
+    def get_by_vlan(self, vlan):
+        return list(self._by_vlan.get(int(vlan), []))
+
+    def get_by_port(self, port):
+        return list(self._by_port.get(port, []))
+
+    def get_bvid(self, vlan):
+        '''
+        Return the id of the VLAN object of <vlan>, or None
+        '''
+        for bvid, vlan_id in self.vlans.items():
+            if vlan_id == int(vlan):
+                return bvid
+        return None
+
+
+class FdbReader(object):
+    '''
+    Reads the FDB of the ASIC_DB of one connector. The connector must be
+    connected to ASIC_DB.
+    '''
+
+    def __init__(self, db, reader=None):
+        self.db = db
+        self.reader = reader if reader is not None else BulkDbReader(db)
+
+    def read_bridge_ports(self, types=None):
+        '''
+        Return {bridge port id: port id} of the bridge ports with a port,
+        restricted to the SAI_BRIDGE_PORT_ATTR_TYPE values in <types> if given
+        '''
+        table = self.reader.get_table(self.db.ASIC_DB, BRIDGE_PORT_PREFIX + '*')
+        bridge_ports = {}
+        for key, attrs in table.items():
+            if 'SAI_BRIDGE_PORT_ATTR_PORT_ID' not in attrs:
+                continue
+            if types is not None and attrs.get('SAI_BRIDGE_PORT_ATTR_TYPE') not in types:
+                continue
+            bridge_ports[strip_oid(key[len(BRIDGE_PORT_PREFIX):])] = \
+                strip_oid(attrs['SAI_BRIDGE_PORT_ATTR_PORT_ID'])
+        return bridge_ports
+
+    def read_vlans(self):
+        '''
+        Return {bvid: VLAN id} of the VLAN objects, the VLAN id is None for
+        objects without SAI_VLAN_ATTR_VLAN_ID
+        '''
+        keys = self.reader.keys(self.db.ASIC_DB, VLAN_PREFIX + '*')
+        vlan_ids = self.reader.get(self.db.ASIC_DB, keys, 'SAI_VLAN_ATTR_VLAN_ID')
+        return {key[len(VLAN_PREFIX):]: int(vlan_ids[key]) if key in vlan_ids else None
+                for key in keys}
+
+    def read(self, port_names=None, bridge_port_types=None):
+        '''
+        Read the FDB entries and return an FdbIndex. <port_names> is a
+        {port id: port name} map used to name the port of the entries.
+        '''
+        port_names = port_names or {}
+        bridge_ports = self.read_bridge_ports(bridge_port_types)
+        vlans = self.read_vlans()
+
+        entries = []
+        table = self.reader.get_table(self.db.ASIC_DB, FDB_ENTRY_PREFIX + '*')
+        for key, attrs in table.items():
+            fdb = json.loads(key[len(FDB_ENTRY_PREFIX):])
+            if not fdb or 'mac' not in fdb:
+                continue
+
+            bvid = fdb.get('bvid')
+            if 'vlan' in fdb:
+                vlan = int(fdb['vlan'])
+            else:
+                vlan = vlans.get(bvid)
+
+            bridge_port_id = strip_oid(attrs.get('SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID', ''))
+            port_id = bridge_ports.get(bridge_port_id)
+            entries.append(FdbEntry(mac=fdb['mac'],
+                                    vlan=vlan,
+                                    bvid=bvid,
+                                    bridge_port_id=bridge_port_id,
+                                    port_id=port_id,
+                                    port=port_names.get(port_id),
+                                    type=attrs.get('SAI_FDB_ENTRY_ATTR_TYPE')))
+
+        return FdbIndex(entries, bridge_ports, vlans)
@@ -1,19 +1,25 @@
 import argparse
+import copy
 import functools
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 import netifaces
 from natsort import natsorted
 from sonic_py_common import multi_asic, device_info
+from swsscommon.swsscommon import ConfigDBPipeConnector
 from utilities_common import constants
 from utilities_common.general import load_db_config
 
+# Upper bound on the namespaces collected at the same time in parallel mode
+MAX_PARALLEL_NAMESPACES = 16
+
 
 class MultiAsic(object):
 
     def __init__(
         self, display_option=constants.DISPLAY_ALL, namespace_option=None,
-        db=None
+        db=None, parallel=False, config_db_pipe=False
     ):
         # Load database config files
         load_db_config()
@@ -22,6 +28,12 @@ class MultiAsic(object):
         self.current_namespace = None
         self.is_multi_asic = multi_asic.is_multi_asic()
         self.db = db
+        # Run the functions decorated with run_on_multi_asic_namespaces for
+        # all the namespaces concurrently, see run_on_multi_asic_namespaces
+        self.parallel = parallel
+        # Connect config_db with a ConfigDBPipeConnector, whose mod_config
+        # writes all its entries in one pipelined transaction
+        self.config_db_pipe = config_db_pipe
 
     def get_display_option(self):
         return self.display_option
@@ -125,6 +137,51 @@ def multi_asic_click_option_namespace(func):
    func = _multi_asic_click_option_namespace(func)
    return func
 
+
+def connect_config_db_pipe_for_ns(namespace=constants.DEFAULT_NAMESPACE):
+    if namespace == constants.DEFAULT_NAMESPACE:
+        config_db = ConfigDBPipeConnector()
+    else:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+    config_db.connect()
+    return config_db
+
+
+def _connect_namespace_dbs(multi_asic_obj, ns):
+    # if object instance already has db connections, use them
+    db_clients = multi_asic_obj.db
+    if getattr(multi_asic_obj, 'config_db_pipe', False):
+        if db_clients and ns in db_clients.cfgdb_pipe_clients:
+            config_db = db_clients.cfgdb_pipe_clients[ns]
+        else:
+            config_db = connect_config_db_pipe_for_ns(ns)
+    elif db_clients and db_clients.cfgdb_clients.get(ns):
+        config_db = db_clients.cfgdb_clients[ns]
+    else:
+        config_db = multi_asic.connect_config_db_for_ns(ns)
+
+    if db_clients and db_clients.db_clients.get(ns):
+        db = db_clients.db_clients[ns]
+    else:
+        db = multi_asic.connect_to_all_dbs_for_ns(ns)
+    return config_db, db
+
+
+class MultiAsicNamespace(object):
+    """
+    One namespace handed to a function decorated with
+    run_on_multi_asic_namespaces: its name, its DB connections and a copy
+    of the MultiAsic object with current_namespace set to it, for
+    skip_display and the like.
+    """
+
+    def __init__(self, multi_asic_obj, ns):
+        self.name = ns
+        self.multi_asic = copy.copy(multi_asic_obj)
+        self.multi_asic.current_namespace = ns
+        self.config_db, self.db = _connect_namespace_dbs(multi_asic_obj, ns)
+
+
 def run_on_multi_asic(func):
     '''
     This decorator is used on the CLI functions which needs to be
@@ -139,21 +196,40 @@ def run_on_multi_asic(func):
         ns_list = self.multi_asic.get_ns_list_based_on_options()
         for ns in ns_list:
             self.multi_asic.current_namespace = ns
-            # if object instance already has db connections, use them
-            if self.multi_asic.db and self.multi_asic.db.cfgdb_clients.get(ns):
-                self.config_db = self.multi_asic.db.cfgdb_clients[ns]
-            else:
-                self.config_db = multi_asic.connect_config_db_for_ns(ns)
-
-            if self.multi_asic.db and self.multi_asic.db.db_clients.get(ns):
-                self.db = self.multi_asic.db.db_clients[ns]
-            else:
-                self.db = multi_asic.connect_to_all_dbs_for_ns(ns)
-
+            self.config_db, self.db = _connect_namespace_dbs(self.multi_asic, ns)
             func(self,  *args, **kwargs)
     return wrapped_run_on_all_asics
 
 
+def run_on_multi_asic_namespaces(func):
+    '''
+    Decorator for the CLI functions which collect a result per namespace.
+    func(self, namespace, *args, **kwargs) is called for every required
+    namespace with a MultiAsicNamespace, and returns the result of that
+    namespace. The decorated function returns the list of the results, in
+    namespace order.
+
+    func only reads self and namespace, it does not change self nor print.
+    Under that contract, when the MultiAsic object was created with
+    parallel=True, the namespaces are run concurrently in a thread pool.
+    If some of them fail, the exception of the first one in namespace order
+    is raised, once they are all done.
+    '''
+    @functools.wraps(func)
+    def wrapped_run_on_namespaces(self, *args, **kwargs):
+        def run(ns):
+            return func(self, MultiAsicNamespace(self.multi_asic, ns), *args, **kwargs)
+
+        ns_list = self.multi_asic.get_ns_list_based_on_options()
+        if not getattr(self.multi_asic, 'parallel', False) or len(ns_list) <= 1:
+            return [run(ns) for ns in ns_list]
+
+        with ThreadPoolExecutor(max_workers=min(len(ns_list), MAX_PARALLEL_NAMESPACES)) as executor:
+            futures = [executor.submit(run, ns) for ns in ns_list]
+        return [future.result() for future in futures]
+    return wrapped_run_on_namespaces
+
+
 def multi_asic_args(parser=None):
     if parser is None:
         parser = argparse.ArgumentParser(
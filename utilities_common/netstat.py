@@ -2,6 +2,11 @@
 
 import json
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 STATUS_NA = 'N/A'
 PORT_RATE = 40
 
@@ -137,3 +142,194 @@ def format_util_directly(util):
         return STATUS_NA
     else:
         return "{:.2f}%".format(float(util))
+
+
+def format_counter(value):
+    """
+        Format a counter value with comma.
+    """
+    return '{:,}'.format(value)
+
+
+def _parse_counter(value):
+    """
+        Convert a counter read from DB or a snapshot to int, None if N/A.
+    """
+    if value is None or value == STATUS_NA:
+        return None
+    if isinstance(value, str):
+        value = value.replace(',', '')
+        try:
+            return int(value)
+        except ValueError:
+            return int(float(value))
+    return int(value)
+
+
+class CounterMatrix(object):
+    """
+        A rows x columns matrix of counters, e.g. ports x counter names.
+
+        The values are kept as unsigned 64-bit integers (floats for rates)
+        next to a mask of the N/A cells, so the diffs, rates and utilization
+        of a whole table are computed in one vectorized step instead of one
+        string at a time. Nothing is converted back to strings until
+        format() is called at render time.
+
+        NumPy is used when it is installed, plain lists otherwise.
+    """
+
+    def __init__(self, rows, columns, values, na):
+        self.rows = list(rows)
+        self.columns = list(columns)
+        self.values = values
+        self.na = na
+        # NumPy arrays, or lists of lists when NumPy is not available
+        self.vectorized = not isinstance(values, list)
+        self.row_index = {row: i for i, row in enumerate(self.rows)}
+
+    @classmethod
+    def from_dict(cls, cnstat_dict, columns, rows=None):
+        """
+            Build a matrix from a {row: {column: value}} dict such as the
+            cnstat dicts kept by the stat scripts. The 'time' key is
+            skipped, missing rows/columns and 'N/A' values are marked N/A.
+        """
+        if rows is None:
+            rows = [row for row in cnstat_dict if row != 'time']
+        values = []
+        na = []
+        for row in rows:
+            cntr = cnstat_dict.get(row) or {}
+            if hasattr(cntr, '_asdict'):
+                cntr = cntr._asdict()
+            row_values = [_parse_counter(cntr.get(column)) for column in columns]
+            values.append([0 if value is None else value for value in row_values])
+            na.append([value is None for value in row_values])
+
+        if numpy is not None:
+            shape = (len(rows), len(columns))
+            return cls(rows, columns,
+                       numpy.array(values, dtype=numpy.uint64).reshape(shape),
+                       numpy.array(na, dtype=bool).reshape(shape))
+        return cls(rows, columns, values, na)
+
+    def _align(self, other):
+        """
+            Return other's values and N/A mask laid out like self. Rows or
+            columns missing in other are N/A.
+        """
+        if other.rows == self.rows and other.columns == self.columns and other.vectorized == self.vectorized:
+            return other.values, other.na
+
+        col_index = {column: j for j, column in enumerate(other.columns)}
+        values = []
+        na = []
+        for row in self.rows:
+            i = other.row_index.get(row)
+            row_values = []
+            row_na = []
+            for column in self.columns:
+                j = col_index.get(column)
+                if i is None or j is None:
+                    row_values.append(0)
+                    row_na.append(True)
+                else:
+                    row_values.append(int(other.values[i][j]))
+                    row_na.append(bool(other.na[i][j]))
+            values.append(row_values)
+            na.append(row_na)
+
+        if self.vectorized:
+            shape = (len(self.rows), len(self.columns))
+            return (numpy.array(values, dtype=numpy.uint64).reshape(shape),
+                    numpy.array(na, dtype=bool).reshape(shape))
+        return values, na
+
+    def diff(self, old):
+        """
+            Counter increase since <old>, same semantics as ns_diff: never
+            negative, N/A if the new value is N/A, an N/A old value counts
+            as 0.
+        """
+        old_values, _ = self._align(old)
+        if self.vectorized:
+            values = numpy.where(self.values >= old_values, self.values - old_values, numpy.uint64(0))
+            return CounterMatrix(self.rows, self.columns, values, self.na.copy())
+
+        values = [[max(0, new - prev) for new, prev in zip(new_row, old_row)]
+                  for new_row, old_row in zip(self.values, old_values)]
+        return CounterMatrix(self.rows, self.columns, values, [list(row) for row in self.na])
+
+    def rate(self, old, delta):
+        """
+            Per-second rate since <old>, <delta> seconds ago, same semantics
+            as ns_prate/ns_brate: N/A if either value is N/A.
+        """
+        _, old_na = self._align(old)
+        diff = self.diff(old)
+        if self.vectorized:
+            return CounterMatrix(self.rows, self.columns,
+                                 diff.values.astype(numpy.float64) / delta,
+                                 self.na | old_na)
+
+        values = [[value / delta for value in row] for row in diff.values]
+        na = [[new or prev for new, prev in zip(new_row, old_row)]
+              for new_row, old_row in zip(self.na, old_na)]
+        return CounterMatrix(self.rows, self.columns, values, na)
+
+    def util(self, old, delta, port_speeds):
+        """
+            Utilization in percent of byte counters since <old>.
+            <port_speeds> holds the speed in Mbps of every row, N/A rows
+            give an N/A utilization.
+        """
+        rates = self.rate(old, delta)
+        speeds = [_parse_counter(speed) for speed in port_speeds]
+        if self.vectorized:
+            speed_na = numpy.array([speed is None or speed == 0 for speed in speeds], dtype=bool)
+            line_rate = numpy.array([(speed or 1) * 1000 * 1000 / 8.0 for speed in speeds],
+                                    dtype=numpy.float64)
+            return CounterMatrix(self.rows, self.columns,
+                                 rates.values / line_rate[:, None] * 100,
+                                 rates.na | speed_na[:, None])
+
+        values = []
+        na = []
+        for row, row_na, speed in zip(rates.values, rates.na, speeds):
+            if not speed:
+                values.append([0.0] * len(row))
+                na.append([True] * len(row))
+            else:
+                values.append([value / (speed * 1000 * 1000 / 8.0) * 100 for value in row])
+                na.append(list(row_na))
+        return CounterMatrix(self.rows, self.columns, values, na)
+
+    def get(self, row, column):
+        """
+            Raw value of a cell, STATUS_NA if it is N/A.
+        """
+        i = self.row_index[row]
+        j = self.columns.index(column)
+        if self.na[i][j]:
+            return STATUS_NA
+        return self.values[i][j].item() if self.vectorized else self.values[i][j]
+
+    def format(self, formatters=None, default=format_counter):
+        """
+            Render the whole matrix in one pass.
+            <formatters> maps a column to the function used to format its
+            values, other columns use <default>. N/A cells become STATUS_NA.
+            Returns {row: {column: str}}.
+        """
+        formatters = formatters or {}
+        column_formatters = [formatters.get(column, default) for column in self.columns]
+        values = self.values.tolist() if self.vectorized else self.values
+        na = self.na.tolist() if self.vectorized else self.na
+
+        output = {}
+        for row, row_values, row_na in zip(self.rows, values, na):
+            output[row] = {column: STATUS_NA if is_na else formatter(value)
+                           for column, formatter, value, is_na
+                           in zip(self.columns, column_formatters, row_values, row_na)}
+        return output
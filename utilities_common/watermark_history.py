@@ -0,0 +1,124 @@
+'''
+Fixed-size on-disk history of watermark samples.
+
+Showing the peak occupancy of a queue over the last hour would otherwise
+mean polling the watermark tables every few seconds for the whole hour.
+Instead, "watermarkstat --record" is run periodically (e.g. from a timer) and
+saves one sample of the periodic watermarks, i.e. the peaks since the
+previous sample, and "watermarkstat --window" reports the maximum of the
+samples recorded over a time window without reading the watermark tables.
+
+A sample is a CounterSnapshot (see counter_snapshot) whose rows are the
+queue, priority group and buffer pool names and whose columns are the
+watermark counter names. The history directory holds at most <size> sample
+files, recording a sample overwrites the oldest one, so the disk usage stays
+bounded however long the samples are taken for.
+'''
+
+import datetime
+import glob
+import os
+
+from utilities_common.counter_snapshot import CounterSnapshot, SnapshotError, SNAPSHOT_SUFFIX
+from utilities_common.netstat import STATUS_NA
+
+HISTORY_DIR = '/var/cache/watermarkstat/history'
+# A day of samples taken every minute
+DEFAULT_SIZE = 1440
+SAMPLE_PREFIX = 'sample-'
+# Directory of the samples of the default namespace
+HOST_DIR = 'host'
+
+
+class WatermarkHistory(object):
+    '''
+    Ring of the watermark samples of one namespace
+    '''
+
+    def __init__(self, directory, size=DEFAULT_SIZE):
+        if size < 1:
+            raise ValueError("The history size must be at least 1")
+        self.directory = directory
+        self.size = size
+
+    @classmethod
+    def for_namespace(cls, namespace, directory=HISTORY_DIR, size=DEFAULT_SIZE):
+        return cls(os.path.join(directory, namespace or HOST_DIR), size)
+
+    def get_sample_path(self, slot):
+        return os.path.join(self.directory, "{}{}{}".format(SAMPLE_PREFIX, slot, SNAPSHOT_SUFFIX))
+
+    def get_sample_paths(self):
+        return glob.glob(os.path.join(self.directory, SAMPLE_PREFIX + '*' + SNAPSHOT_SUFFIX))
+
+    def get_next_slot(self):
+        '''
+        Return the first free slot, or the slot of the oldest sample when
+        the history is full
+        '''
+        oldest_slot, oldest_mtime = 0, None
+        for slot in range(self.size):
+            try:
+                mtime = os.stat(self.get_sample_path(slot)).st_mtime_ns
+            except FileNotFoundError:
+                return slot
+            if oldest_mtime is None or mtime < oldest_mtime:
+                oldest_slot, oldest_mtime = slot, mtime
+        return oldest_slot
+
+    def record(self, sample, columns, time=None):
+        '''
+        Save <sample>, a {row: {column: value}} dict, in place of the oldest
+        sample. Samples left by a larger history size are removed.
+        '''
+        os.makedirs(self.directory, exist_ok=True)
+        time = time if time is not None else datetime.datetime.now()
+        snapshot = CounterSnapshot.from_cnstat_dict(dict(sample, time=time), columns,
+                                                    rows=list(sample))
+        path = self.get_sample_path(self.get_next_slot())
+        snapshot.save(path)
+
+        for sample_path in self.get_sample_paths():
+            slot = os.path.basename(sample_path)[len(SAMPLE_PREFIX):-len(SNAPSHOT_SUFFIX)]
+            if not slot.isdigit() or int(slot) >= self.size:
+                os.remove(sample_path)
+        return path
+
+    def load_samples(self, since=None):
+        '''
+        Return the samples recorded at or after <since>, oldest first.
+        Unreadable sample files are skipped.
+        '''
+        samples = []
+        for path in self.get_sample_paths():
+            try:
+                snapshot = CounterSnapshot.load(path)
+                time = datetime.datetime.fromisoformat(snapshot.time)
+            except (OSError, SnapshotError, TypeError, ValueError):
+                continue
+            if since is not None and time < since:
+                snapshot.close()
+                continue
+            samples.append((time, snapshot))
+        samples.sort(key=lambda sample: sample[0])
+        return [snapshot for _, snapshot in samples]
+
+    def get_max(self, window, now=None):
+        '''
+        Return ({row: {column: max value}}, number of samples) over the
+        samples of the last <window> seconds. N/A values are ignored, a
+        counter never available is left out.
+        '''
+        now = now if now is not None else datetime.datetime.now()
+        samples = self.load_samples(now - datetime.timedelta(seconds=window))
+
+        peaks = {}
+        for snapshot in samples:
+            for row in snapshot.rows:
+                row_peaks = peaks.setdefault(row, {})
+                for column in snapshot.columns:
+                    value = snapshot.get(row, column)
+                    if value != STATUS_NA and value > row_peaks.get(column, -1):
+                        row_peaks[column] = value
+            snapshot.close()
+        return peaks, len(samples)